@@ -29,8 +29,11 @@ module arty_top
    // Include generated CSR regs
 `include "crypto1_csr.vh"
 
-   // ID value
-   assign id = 32'hd00dcafe;
+   // ORDER_ID
+`include "crypto1.vh"
+
+   // ID value, d00dcafe is the single key image (RecoverKey)
+   assign id = 32'hd00dcaf1;
    
    // Dropped host comm bytes
    logic [9:0]          dropped;
@@ -88,6 +91,36 @@ module arty_top
    // Loop back bitstream
    assign bitstream_hi_i = bitstream_hi_o;
    assign bitstream_lo_i = bitstream_lo_o;
+   assign next_hi_i = next_hi_o;
+   assign next_lo_i = next_lo_o;
+
+   // Loop back walk order
+   assign order_i = order_o;
+   assign eorder_0_i = eorder_0_o;
+   assign eorder_1_i = eorder_1_o;
+   assign eorder_2_i = eorder_2_o;
+   assign eorder_3_i = eorder_3_o;
+   assign eorder_4_i = eorder_4_o;
+   assign eorder_5_i = eorder_5_o;
+   assign eorder_6_i = eorder_6_o;
+   assign eorder_7_i = eorder_7_o;
+   assign oorder_0_i = oorder_0_o;
+   assign oorder_1_i = oorder_1_o;
+   assign oorder_2_i = oorder_2_o;
+   assign oorder_3_i = oorder_3_o;
+   assign oorder_4_i = oorder_4_o;
+   assign oorder_5_i = oorder_5_o;
+   assign oorder_6_i = oorder_6_o;
+   assign oorder_7_i = oorder_7_o;
+
+   // Walk order from CSRs once order is set, else count up
+   logic [239:0]       eorder, oorder;
+   assign eorder = order_o ? {eorder_7_o, eorder_6_o, eorder_5_o, eorder_4_o,
+                              eorder_3_o, eorder_2_o, eorder_1_o, eorder_0_o} :
+                   `ORDER_ID;
+   assign oorder = order_o ? {oorder_7_o, oorder_6_o, oorder_5_o, oorder_4_o,
+                              oorder_3_o, oorder_2_o, oorder_1_o, oorder_0_o} :
+                   `ORDER_ID;
    
    // Create crypto1 attack core
    Crypto1Attack
@@ -95,8 +128,20 @@ module arty_top
                .CLK       (sysclk),
                .RESETn    (poreset_n & start),
                .BITSTREAM ({bitstream_hi_o, bitstream_lo_o}),
+               .EORDER    (eorder),
+               .OORDER    (oorder),
+               .NEXT      ({next_hi_o, next_lo_o}),
+               .QUEUE     (queue),
+               .QUEUED    (queued),
+               .SKIP      (skip),
+               .JOB       (job),
+               .LAST      (last_job),
                .KEY       ({key_hi, key_lo}),
+               .KEY_JOB   (key_job),
                .VALID     (valid),
+               .COUNT     (key_cnt),
+               .POP       (key_pop),
+               .LOST      (lost),
                .DONE      (done)
                );
    
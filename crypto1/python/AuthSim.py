@@ -0,0 +1,206 @@
+#!/bin/env python3
+#
+# Batched simulator of MIFARE Classic three pass authentications
+# for benchmark corpora. Sessions are generated as numpy arrays:
+#
+#  AUTH(blk) -> nt -> {nr}{ar} -> {at}
+#
+# with a valid tag PRNG nonce, uid ^ nt fed into the cipher, the
+# reader nonce fed in and encrypted, ar/at the PRNG successors of nt
+# and every parity bit encrypted with the keystream bit following
+# its byte. Sessions are saved with their ground truth key as a
+# structured .npy (SESSION), --trace also writes the first sessions
+# as a Proxmark3 tracelog that Trace.py parses.
+#
+# Usage:
+#  AuthSim.py --count N [--per-key M] [--out FILE.npy] [--trace FILE] [--check K]
+#
+
+import FastCrypto1 as fc
+from BitUtil import OddParity8
+import numpy as np
+import argparse
+import struct
+import time
+
+# One session, 30 bytes. par holds the encrypted parity bits of
+# nr, ar and at as 3 nibbles (nr in bits 11-8), byte 0 in the
+# nibble MSB.
+SESSION = np.dtype ([('key', '<u8'), ('uid', '<u4'), ('nt', '<u4'),
+                     ('nr_enc', '<u4'), ('ar_enc', '<u4'), ('at_enc', '<u4'),
+                     ('par', '<u2')])
+
+# Encrypted parity of each byte of plaintext words, ks holds the
+# keystream words, last the keystream bit after the word
+def Parity (plain, ks, last):
+    par = np.zeros (len (plain), dtype=np.uint16)
+    for n in range (4):
+        byte = ((plain >> (24 - 8 * n)) & 0xFF).astype (np.uint8)
+        bit = last if n == 3 else (ks >> ((8 * (n + 1)) ^ 24)) & 1
+        par |= ((OddParity8 (byte) ^ bit) & 1).astype (np.uint16) << (3 - n)
+    return par
+
+def Simulate (count, per_key=1, rng=None):
+    '''
+    Generate count sessions, per_key sessions share a key and uid
+    (the same card read several times). Returns SESSION array.
+    '''
+    rng = rng or np.random.default_rng ()
+    cards = (count + per_key - 1) // per_key
+    key = np.repeat (rng.integers (0, 1 << 48, cards, dtype=np.uint64), per_key)[0:count]
+    uid = np.repeat (rng.integers (0, 1 << 32, cards, dtype=np.uint64), per_key)[0:count]
+
+    # Tag nonces are states of the 16 bit PRNG
+    nt = fc.PrngSuccessor (rng.integers (1, 1 << 16, count, dtype=np.uint32), 32)
+    ar = fc.PrngSuccessor (nt, 64)
+    at = fc.PrngSuccessor (ar, 32)
+    nr = rng.integers (0, 1 << 32, count, dtype=np.uint64)
+
+    x = fc.KeyToState (key)
+    _, x = fc.VWord (x, uid ^ nt.astype (np.uint64))
+    ks, x = fc.VWord (x, nr)
+    par = Parity (nr, ks, fc.VFilter (x)) << 8
+    s = np.zeros (count, dtype=SESSION)
+    s['nr_enc'] = nr ^ ks
+    ks, x = fc.VWord (x)
+    par |= Parity (ar, ks, fc.VFilter (x)) << 4
+    s['ar_enc'] = ar ^ ks
+    ks, x = fc.VWord (x)
+    par |= Parity (at, ks, fc.VFilter (x))
+    s['at_enc'] = at ^ ks
+    s['key'] = key
+    s['uid'] = uid
+    s['nt'] = nt
+    s['par'] = par
+    return s
+
+def Load (path):
+    return np.load (path, mmap_mode='r')
+
+# 64 known keystream bits of ar/at (air order, first bit MSB)
+def Keystream (s):
+    ar = s['ar_enc'] ^ fc.PrngSuccessor (s['nt'], 64)
+    at = s['at_enc'] ^ fc.PrngSuccessor (s['nt'], 96)
+    ks = (ar.astype (np.uint64) << 32) | at
+    # Word bit n is sent n-th as bit n ^ 24
+    ret = np.zeros (len (s), dtype=np.uint64)
+    for n in range (64):
+        ret = (ret << 1) | ((ks >> (32 * (1 - (n >> 5)) + ((n & 31) ^ 24))) & 1)
+    return ret
+
+# 48 bit bitstreams for FPGACrypto1.Recover and the bits past them
+def Bitstreams (s):
+    ks = Keystream (s)
+    return ks >> 16, ks & 0xFFFF
+
+# Ground truth states at the first bitstream bit
+def States (s):
+    x = fc.KeyToState (s['key'].astype (np.uint64))
+    _, x = fc.VWord (x, (s['uid'] ^ s['nt']).astype (np.uint64))
+    _, x = fc.VWord (x, s['nr_enc'].astype (np.uint64), True)
+    return x
+
+# Proxmark3 tracelog of sessions (see Trace.ReadBinary)
+def WriteTrace (path, s, block=4):
+    from Trace import CRC_A
+
+    def Frame (fp, ts, tag, data, par=None):
+        if par is None:
+            par = [OddParity8 (b) for b in data]
+        pbytes = bytearray ((len (data) + 7) // 8)
+        for n, p in enumerate (par):
+            pbytes[n >> 3] |= p << (7 - (n & 7))
+        fp.write (struct.pack ('<IHH', ts, 0, len (data) | (0x8000 if tag else 0)))
+        fp.write (bytes (data) + bytes (pbytes))
+
+    def Crc (data):
+        crc = CRC_A (data)
+        return bytes (data) + bytes ([crc & 0xFF, crc >> 8])
+
+    with open (path, 'wb') as fp:
+        ts = 0
+        for r in s:
+            uid = int (r['uid']).to_bytes (4, 'big')
+            par = int (r['par'])
+            bits = lambda n: [(par >> (n + 3 - i)) & 1 for i in range (4)]
+            nr = int (r['nr_enc']).to_bytes (4, 'big')
+            ar = int (r['ar_enc']).to_bytes (4, 'big')
+            frames = [
+                (False, bytes ([0x26]), None),
+                (False, Crc (bytes ([0x93, 0x70]) + uid + bytes ([uid[0] ^ uid[1] ^ uid[2] ^ uid[3]])), None),
+                (False, Crc (bytes ([0x60, block])), None),
+                (True, int (r['nt']).to_bytes (4, 'big'), None),
+                (False, nr + ar, bits (8) + bits (4)),
+                (True, int (r['at_enc']).to_bytes (4, 'big'), bits (0)),
+            ]
+            for tag, data, p in frames:
+                Frame (fp, ts, tag, data, p)
+                ts += 1000
+
+# Compare sessions with the pylfsr reference model
+def Check (s):
+    from Crypto1 import Crypto1
+    ok = 0
+    for r in s:
+        c = Crypto1 (int (r['key']))
+        c.GetWord (int (r['uid'] ^ r['nt']))
+        nr, p0 = c.Decrypt (int (r['nr_enc']).to_bytes (4, 'big'),
+                            [(int (r['par']) >> (11 - n)) & 1 for n in range (4)], True)
+        nt = int (r['nt'])
+        ar, p1 = c.Encrypt (fc.PrngSuccessor (nt, 64).to_bytes (4, 'big'))
+        at, p2 = c.Encrypt (fc.PrngSuccessor (nt, 96).to_bytes (4, 'big'))
+        par = (p1[0] << 7) | (p1[1] << 6) | (p1[2] << 5) | (p1[3] << 4) | \
+            (p2[0] << 3) | (p2[1] << 2) | (p2[2] << 1) | p2[3]
+        ok += all (p0) and ar == int (r['ar_enc']).to_bytes (4, 'big') and \
+            at == int (r['at_enc']).to_bytes (4, 'big') and par == (int (r['par']) & 0xFF)
+    return ok
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--count', type=int, default=1000000, help='Number of sessions')
+    parser.add_argument ('--per-key', type=int, default=1, help='Sessions per key/uid')
+    parser.add_argument ('--chunk', type=int, default=1 << 20, help='Sessions per batch')
+    parser.add_argument ('--out', type=str, help='Sessions file (.npy)')
+    parser.add_argument ('--trace', type=str, help='Also write Proxmark3 tracelog')
+    parser.add_argument ('--trace-count', type=int, default=100,
+                         help='Sessions written to the tracelog')
+    parser.add_argument ('--check', type=int, default=0,
+                         help='Check N sessions against Crypto1.py and the CPU engine')
+    parser.add_argument ('--seed', type=int, help='Random seed')
+    args = parser.parse_args ()
+
+    rng = np.random.default_rng (args.seed)
+    out = None
+    if args.out:
+        out = np.lib.format.open_memmap (args.out, mode='w+', dtype=SESSION,
+                                         shape=(args.count,))
+    start = time.time ()
+    first = None
+    # Whole cards per chunk
+    chunk = max (args.per_key, args.chunk - args.chunk % args.per_key)
+    for n in range (0, args.count, chunk):
+        cnt = min (chunk, args.count - n)
+        s = Simulate (cnt, args.per_key, rng)
+        if out is not None:
+            out[n:n+cnt] = s
+        if first is None:
+            first = s
+        print ('{}/{} {:.1f}s'.format (n + cnt, args.count, time.time () - start), flush=True)
+    t = time.time () - start
+    print ('{:.0f} sessions/min'.format (args.count / t * 60))
+    if out is not None:
+        out.flush ()
+    if args.trace:
+        WriteTrace (args.trace, first[0:args.trace_count])
+
+    if args.check:
+        s = first[0:args.check]
+        print ('Reference model: {}/{} OK'.format (Check (s), len (s)))
+        bs, _ = Bitstreams (s)
+        truth = States (s)
+        ok = 0
+        for b, x in zip (bs.tolist (), truth.tolist ()):
+            ks = [(b >> (47 - i)) & 1 for i in range (48)]
+            ok += x in fc.RecoverStates (ks).tolist ()
+        print ('CPU recovery: {}/{} OK'.format (ok, len (s)))
@@ -0,0 +1,111 @@
+#!/bin/env python3
+#
+# Shared bit helpers. Table driven and integer native, the
+# byte level helpers also take bytes and numpy arrays.
+#
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bit reversal and parity of every byte
+REV8 = bytes ([int ('{:08b}'.format (n)[::-1], 2) for n in range (256)])
+PAR8 = bytes ([bin (n).count ('1') & 1 for n in range (256)])
+
+def _isarray (x):
+    return np is not None and isinstance (x, np.ndarray)
+
+# Bit list (MSB first) <=> int
+def int2binarr (val, length):
+    return [(val >> n) & 1 for n in range (length - 1, -1, -1)]
+
+def binarr2int (arr):
+    if _isarray (arr):
+        arr = arr.tolist ()
+    x = 0
+    for b in arr:
+        x = (x << 1) | b
+    return x
+
+# Reverse bits within each byte
+def Reverse8 (x):
+    if isinstance (x, (bytes, bytearray)):
+        return x.translate (REV8)
+    if _isarray (x):
+        return np.frombuffer (REV8, dtype=np.uint8)[x]
+    return REV8[x & 0xFF]
+
+def ReverseBytes (x, n=6):
+    if isinstance (x, (bytes, bytearray)):
+        return x.translate (REV8)
+    if _isarray (x):
+        b = np.ascontiguousarray (x).view (np.uint8)
+        return np.frombuffer (REV8, dtype=np.uint8)[b].view (x.dtype)
+    return int.from_bytes (x.to_bytes (n, 'big').translate (REV8), 'big')
+
+# Reverse the low n bits of an int
+def ReverseBits (x, n):
+    nb = (n + 7) >> 3
+    x = int.from_bytes (x.to_bytes (nb, 'little').translate (REV8), 'big')
+    return x >> ((nb << 3) - n)
+
+# Swap byte order of 32 bit words
+def Swap32 (x):
+    if isinstance (x, (bytes, bytearray)):
+        return b''.join ([x[n:n+4][::-1] for n in range (0, len (x), 4)])
+    if _isarray (x):
+        return x.astype (np.uint32).byteswap ()
+    return int.from_bytes (x.to_bytes (4, 'little'), 'big')
+
+# Parity of an int, of all bytes or of each array element
+def Parity (x):
+    if isinstance (x, (bytes, bytearray)):
+        p = 0
+        for b in x:
+            p ^= b
+        return PAR8[p]
+    if _isarray (x):
+        if hasattr (np, 'bitwise_count'):
+            return (np.bitwise_count (x) & 1).astype (x.dtype)
+        x = x ^ (x >> 32)
+        x ^= x >> 16
+        x ^= x >> 8
+        x ^= x >> 4
+        x ^= x >> 2
+        x ^= x >> 1
+        return x & 1
+    return bin (x).count ('1') & 1
+
+# ISO14443-A odd parity bit of a byte, or list of bits per byte
+def OddParity8 (x):
+    if isinstance (x, (bytes, bytearray)):
+        return [PAR8[b] ^ 1 for b in x]
+    if _isarray (x):
+        return np.frombuffer (PAR8, dtype=np.uint8)[x & 0xFF] ^ 1
+    return PAR8[x & 0xFF] ^ 1
+
+# Even/odd bit split and merge of a 48 bit state
+def Compress (x):
+    x = x & 0x555555555555
+    x = (x | (x >> 1)) & 0x333333333333
+    x = (x | (x >> 2)) & 0x0F0F0F0F0F0F
+    x = (x | (x >> 4)) & 0x00FF00FF00FF
+    x = (x | (x >> 8)) & 0x0000FFFF0000FFFF
+    x = (x | (x >> 16)) & 0xFFFFFF
+    return x
+
+def Spread (x):
+    x = x & 0xFFFFFF
+    x = (x | (x << 16)) & 0x0000FFFF0000FFFF
+    x = (x | (x << 8)) & 0x00FF00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F0F0F
+    x = (x | (x << 2)) & 0x333333333333
+    x = (x | (x << 1)) & 0x555555555555
+    return x
+
+def Split (x):
+    return Compress (x), Compress (x >> 1)
+
+def Merge (even, odd):
+    return Spread (even) | (Spread (odd) << 1)
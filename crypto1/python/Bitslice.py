@@ -0,0 +1,1217 @@
+#
+# Generated by GenBitslice.py : do not edit!
+#
+# Bitsliced filter functions, every argument holds one input
+# bit of each lane. Pass ones for words wider than 64 lanes.
+# FILTER20 takes the 20 filter taps (state bits 0, 2, .. 38).
+#
+
+LANES = 64
+ONES = (1 << LANES) - 1
+
+# nlfa.esp (4 cubes)
+def NLFA (A, B, C, D, ones=ONES):
+    n1 = B ^ ones
+    n2 = C ^ ones
+    n3 = D ^ ones
+    return ((C & D) |
+            (B & n2 & n3) |
+            (A & n1 & D) |
+            (A & n1 & C))
+
+# nlfb.esp (4 cubes)
+def NLFB (A, B, C, D, ones=ONES):
+    n0 = A ^ ones
+    n1 = B ^ ones
+    n2 = C ^ ones
+    n3 = D ^ ones
+    return ((n1 & C & n3) |
+            (B & C & D) |
+            (n0 & n1 & D) |
+            (A & B & n2))
+
+# nlfc.esp (7 cubes)
+def NLFC (A, B, C, D, E, ones=ONES):
+    n0 = A ^ ones
+    n1 = B ^ ones
+    n2 = C ^ ones
+    n3 = D ^ ones
+    n4 = E ^ ones
+    return ((n1 & n2 & n3 & E) |
+            (B & D & E) |
+            (B & C & E) |
+            (B & C & D) |
+            (n0 & n2 & D & E) |
+            (A & D & n4) |
+            (A & n1 & n4))
+
+# crypto1.sol (1148 cubes)
+def FILTER20 (x, ones=ONES):
+    n0 = x[0] ^ ones
+    n1 = x[1] ^ ones
+    n2 = x[2] ^ ones
+    n3 = x[3] ^ ones
+    n4 = x[4] ^ ones
+    n5 = x[5] ^ ones
+    n6 = x[6] ^ ones
+    n7 = x[7] ^ ones
+    n8 = x[8] ^ ones
+    n9 = x[9] ^ ones
+    n10 = x[10] ^ ones
+    n11 = x[11] ^ ones
+    n12 = x[12] ^ ones
+    n13 = x[13] ^ ones
+    n14 = x[14] ^ ones
+    n15 = x[15] ^ ones
+    n16 = x[16] ^ ones
+    n17 = x[17] ^ ones
+    n18 = x[18] ^ ones
+    n19 = x[19] ^ ones
+    return ((x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & x[14] & n15 & x[16] & x[17] & n18) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & n14 & x[15] & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & x[14] & n15 & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & n14 & x[15] & x[16] & x[17] & n18) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n12 & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n8 & n10 & x[11] & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n8 & n10 & x[11] & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n8 & n10 & x[11] & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n8 & n10 & x[11] & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n8 & x[10] & n11 & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n8 & x[10] & n11 & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n8 & x[10] & n11 & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n8 & x[10] & n11 & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & x[14] & n15 & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & x[14] & n15 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & n2 & x[3] & n8 & x[10] & n11 & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[1] & n2 & x[3] & n8 & x[10] & n11 & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[1] & x[2] & n3 & n8 & n10 & x[11] & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n8 & n10 & x[11] & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n8 & x[10] & n11 & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & x[14] & n15 & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & n2 & x[3] & n8 & x[10] & n11 & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (n1 & n2 & n3 & n8 & x[10] & n11 & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n8 & x[10] & n11 & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n5 & n6 & n7 & n8 & x[10] & n11 & n12 & x[14] & n15 & x[16] & x[17] & n18) |
+            (n5 & n6 & n7 & n8 & x[10] & n11 & n12 & n14 & x[15] & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n8 & n10 & x[11] & x[14] & x[15] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n8 & n10 & x[11] & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & n8 & x[10] & n11 & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n8 & x[10] & n11 & x[14] & x[15] & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n12 & x[14] & n15 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & n8 & x[10] & n11 & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & x[14] & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n12 & x[14] & n15 & n16 & n17 & x[19]) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n12 & x[14] & n15 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n13 & n14 & n15) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n13 & n14 & n15) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15 & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n12 & x[14] & n15 & x[17] & x[18] & x[19]) |
+            (n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (n4 & x[5] & n6 & n8 & x[10] & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n8 & x[10] & n11 & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & x[14] & n15 & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & x[14] & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & x[14] & n15 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & x[14] & n15 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & x[14] & n15 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n5 & n6 & n7 & n8 & x[10] & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & x[14] & n15 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[4] & n5 & x[7] & x[9] & x[10] & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & x[14] & n15 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & x[14] & n15 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & x[14] & n15) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[4] & n5 & x[7] & x[9] & x[10] & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[4] & n5 & x[7] & x[9] & x[10] & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15] & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15] & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n8 & x[10] & n11 & x[14] & x[15] & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (n0 & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (n0 & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15 & x[16] & x[17] & n18) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n4 & x[5] & n6 & x[9] & x[10] & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & x[16] & x[17] & n18) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15 & n16 & n17 & x[19]) |
+            (x[4] & n5 & x[7] & x[9] & x[10] & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (n4 & x[5] & n6 & x[9] & x[10] & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (x[4] & n5 & x[7] & n8 & n10 & x[11] & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & n13 & n14 & n15) |
+            (n4 & x[5] & n6 & x[9] & x[10] & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15] & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & n7 & n8 & x[10] & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[12] & n13 & x[14] & n17 & n18 & n19) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[3] & x[12] & n13 & x[14] & n16 & x[17] & n18) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & n7 & n8 & x[10] & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[5] & x[6] & n7 & n8 & x[10] & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[4] & n5 & x[7] & n9 & n10 & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n0 & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n0 & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n8 & x[10] & n11 & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[4] & n5 & x[7] & n9 & n10 & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n9 & n10 & n11 & n13 & n14 & n15) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n13 & n14 & n15) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[4] & n5 & x[7] & n9 & n10 & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[12] & n13 & x[14] & x[16] & n17 & x[19]) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n4 & x[5] & n6 & x[9] & x[10] & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[3] & x[12] & n13 & x[14] & x[17] & x[18] & n19) |
+            (n4 & x[5] & n6 & n8 & n10 & x[11] & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n8 & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[5] & x[6] & n7 & n8 & x[10] & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n4 & x[5] & n6 & n9 & n10 & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & n12 & n14 & x[15]) |
+            (x[4] & n5 & x[7] & n9 & n10 & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & x[14] & n15) |
+            (n4 & x[5] & n6 & n9 & n10 & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n12 & n14 & x[15]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n4 & x[5] & n6 & n9 & n10 & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n5 & n6 & n7 & n8 & n10 & x[11] & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & x[14] & n15) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & x[12] & n13 & x[14]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (x[1] & x[2] & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & x[12] & n13 & x[15]) |
+            (x[1] & n2 & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & x[12] & n13 & x[14]) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & x[12] & n13 & x[15]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[0] & n1 & x[2] & n4 & n5 & x[7] & x[12] & n13 & x[14]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n4 & n5 & x[7] & x[12] & n13 & x[15]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[3] & n4 & n5 & x[7] & x[12] & n13 & x[15]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n5 & n6 & n7 & n9 & n10 & n11 & n13 & n14 & n15 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n4 & x[5] & n6 & n9 & n10 & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (n5 & n6 & n7 & n9 & n10 & n11 & n13 & n14 & n15 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & x[7] & x[12] & n13 & x[14]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & x[7] & x[12] & n13 & x[15]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n5 & n6 & n7 & n9 & n10 & n11 & n13 & n14 & n15 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & x[7] & x[12] & n13 & x[15]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n8 & n10 & x[11] & n13 & n14 & n15) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[1] & x[2] & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & x[4] & x[5] & n6 & x[12] & n13 & x[14]) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & x[4] & x[5] & n6 & x[12] & n13 & x[15]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[4] & x[5] & n6 & x[12] & n13 & x[15]) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n12 & x[14] & n15) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[2] & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & n12 & n14 & x[15]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[0] & n1 & x[2] & n5 & x[6] & n7 & x[12] & n13 & x[14]) |
+            (x[1] & x[2] & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n5 & x[6] & n7 & x[12] & n13 & x[15]) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[14] & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[3] & n5 & x[6] & n7 & x[12] & n13 & x[15]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n1 & n2 & n3 & x[4] & n5 & x[7] & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[15] & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[14] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (n5 & n6 & n7 & n9 & n10 & n11 & n13 & n14 & n15 & x[17] & x[18] & x[19]) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[15] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & n10 & x[11] & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & x[9] & x[10] & n11 & x[17] & x[18] & x[19]) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[14] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n8 & x[10] & n11 & n13 & n14 & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[15] & n16 & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[14] & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[15] & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[1] & x[2] & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[16] & x[17] & n18) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[14] & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[14] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[14] & x[17] & x[18] & x[19]) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[15] & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[15] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n4 & n5 & x[7] & x[12] & n13 & x[15] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & n4 & x[5] & n6 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[14] & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & n13 & n14 & n15) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[15] & n17 & x[18] & n19) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n16 & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[14] & n16 & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[15] & n16 & n17 & x[19]) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & x[14] & n15) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[14] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[15] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & x[5] & x[6] & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[14] & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & x[7] & x[12] & n13 & x[15] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[14] & x[17] & x[18] & x[19]) |
+            (x[4] & x[5] & n6 & x[12] & n13 & x[15] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & n10 & x[11] & x[13] & n14 & x[15]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & x[14] & n15) |
+            (n1 & n2 & n3 & n5 & n6 & n7 & n9 & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & x[13] & n14 & x[15]) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[14] & x[17] & x[18] & x[19]) |
+            (n5 & x[6] & n7 & x[12] & n13 & x[15] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n17 & n18 & n19) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n17 & n18 & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[9] & n10 & x[11] & n13 & n14 & n15) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & x[16] & x[17] & n18) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & n5 & x[7] & x[12] & n13 & x[14]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & n4 & n5 & x[7] & x[12] & n13 & x[15]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & n17 & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & x[7] & x[12] & n13 & x[14]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & n3 & x[5] & x[6] & x[7] & x[12] & n13 & x[15]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[9] & x[10] & n11 & n13 & n14 & n15) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n17 & n18 & n19) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n17 & n18 & n19) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & x[13] & n14 & n15) |
+            (x[1] & n2 & n3 & x[4] & x[5] & n6 & x[12] & n13 & x[14]) |
+            (x[1] & n2 & n3 & x[4] & x[5] & n6 & x[12] & n13 & x[15]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n17 & n18 & n19) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n17 & n18 & n19) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & x[13] & n14 & n15) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n4 & n5 & x[7] & x[13] & n14 & n15) |
+            (x[0] & n1 & x[3] & n4 & n5 & x[7] & x[13] & n14 & n15) |
+            (x[1] & n2 & n3 & n5 & x[6] & n7 & x[12] & n13 & x[14]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & x[14] & n15) |
+            (x[1] & n2 & n3 & n5 & x[6] & n7 & x[12] & n13 & x[15]) |
+            (x[2] & x[3] & n5 & n6 & n7 & n9 & n10 & n11 & x[13] & n14 & x[15]) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & x[12] & n13 & x[14]) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & x[7] & x[13] & n14 & n15) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & x[7] & x[13] & n14 & n15) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n9 & n10 & n11 & n13 & n14 & n15) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n17 & n18 & n19) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n17 & n18 & n19) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & x[17] & x[18] & x[19]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[4] & x[5] & n6 & x[13] & n14 & n15) |
+            (x[0] & n1 & x[3] & x[4] & x[5] & n6 & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[0] & n1 & x[2] & n5 & x[6] & n7 & x[13] & n14 & n15) |
+            (x[0] & n1 & x[3] & n5 & x[6] & n7 & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[13] & n14 & n15 & n16 & n17 & x[19]) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[16] & n17 & x[19]) |
+            (n4 & n5 & x[7] & x[13] & n14 & n15 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & n5 & n6 & n7 & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[3] & n5 & n6 & n7 & x[17] & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[5] & x[6] & x[7] & x[13] & n14 & n15 & n16 & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[13] & n14 & n15 & n17 & x[18] & n19) |
+            (x[4] & x[5] & n6 & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n4 & n5 & x[7] & x[12] & n13 & x[14]) |
+            (n5 & x[6] & n7 & x[13] & n14 & n15 & x[16] & x[17] & n18) |
+            (x[2] & x[3] & n4 & n5 & x[7] & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[13] & n14 & n15 & n16 & n17 & x[19]) |
+            (n4 & n5 & x[7] & x[13] & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[4] & x[5] & n6 & x[13] & n14 & n15 & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & x[12] & n13 & x[14]) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & x[12] & n13 & x[15]) |
+            (n5 & x[6] & n7 & x[13] & n14 & n15 & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n17 & n18 & n19) |
+            (n5 & x[6] & n7 & x[13] & n14 & n15 & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & x[7] & x[12] & n13 & x[14]) |
+            (x[2] & x[3] & x[5] & x[6] & x[7] & x[12] & n13 & x[15]) |
+            (x[5] & x[6] & x[7] & x[13] & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[4] & x[5] & n6 & x[12] & n13 & x[14]) |
+            (x[2] & x[3] & x[4] & x[5] & n6 & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[13] & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & x[6] & n7 & x[12] & n13 & x[14]) |
+            (x[2] & x[3] & n5 & x[6] & n7 & x[12] & n13 & x[15]) |
+            (n5 & x[6] & n7 & x[13] & n14 & n15 & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[11] & x[14] & x[15]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n17 & n18 & n19) |
+            (x[5] & x[6] & x[7] & x[8] & n9 & x[10] & x[14] & x[15]) |
+            (x[0] & n1 & x[2] & n4 & n5 & x[7] & x[14] & x[15]) |
+            (x[0] & n1 & x[3] & n4 & n5 & x[7] & x[14] & x[15]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n17 & n18 & n19) |
+            (x[1] & n2 & n3 & n4 & n5 & x[7] & x[13] & n14 & n15) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & x[7] & x[14] & x[15]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & x[7] & x[14] & x[15]) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & x[16] & x[17] & n18) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & x[7] & x[13] & n14 & n15) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & n17 & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[4] & x[5] & n6 & x[14] & x[15]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n17 & n18 & n19) |
+            (x[0] & n1 & x[3] & x[4] & x[5] & n6 & x[14] & x[15]) |
+            (n4 & n5 & x[7] & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[2] & n5 & x[6] & n7 & x[14] & x[15]) |
+            (x[0] & n1 & x[3] & n5 & x[6] & n7 & x[14] & x[15]) |
+            (n4 & n5 & x[7] & x[14] & x[15] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[4] & x[5] & n6 & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n4 & n5 & x[7] & x[14] & x[15] & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[1] & n2 & n3 & n5 & x[6] & n7 & x[13] & n14 & n15) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[16] & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & x[13] & n14 & n15) |
+            (x[5] & x[6] & x[7] & x[14] & x[15] & n16 & n17 & x[19]) |
+            (x[1] & n2 & n3 & n5 & n6 & n7 & x[17] & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & x[7] & x[14] & x[15] & n17 & x[18] & n19) |
+            (x[4] & x[5] & n6 & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n17 & n18 & n19) |
+            (n5 & x[6] & n7 & x[14] & x[15] & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[14] & x[15] & n16 & n17 & x[19]) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n4 & n5 & x[7] & x[14] & x[15] & x[17] & x[18] & x[19]) |
+            (x[4] & x[5] & n6 & x[14] & x[15] & n17 & x[18] & n19) |
+            (n5 & x[6] & n7 & x[14] & x[15] & n16 & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & x[17] & x[18] & x[19]) |
+            (n5 & x[6] & n7 & x[14] & x[15] & n17 & x[18] & n19) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & x[16] & x[17] & n18) |
+            (x[5] & x[6] & x[7] & x[14] & x[15] & x[17] & x[18] & x[19]) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & n16 & n17 & x[19]) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n17 & n18 & n19) |
+            (x[4] & x[5] & n6 & x[14] & x[15] & x[17] & x[18] & x[19]) |
+            (n4 & n5 & x[7] & x[10] & x[11] & x[17] & x[18] & x[19]) |
+            (n5 & x[6] & n7 & x[14] & x[15] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n17 & n18 & n19) |
+            (x[2] & x[3] & n4 & n5 & x[7] & x[13] & n14 & n15) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & x[13] & n14 & n15) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & n4 & n5 & x[7] & x[14] & x[15]) |
+            (x[2] & x[3] & x[5] & x[6] & x[7] & x[13] & n14 & n15) |
+            (x[2] & x[3] & n5 & n6 & n7 & n17 & n18 & n19) |
+            (x[2] & x[3] & n5 & n6 & n7 & n16 & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & x[17] & x[18] & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & x[7] & x[14] & x[15]) |
+            (x[2] & x[3] & x[4] & x[5] & n6 & x[13] & n14 & n15) |
+            (n5 & x[6] & n7 & x[10] & x[11] & x[17] & x[18] & x[19]) |
+            (x[2] & x[3] & n5 & x[6] & n7 & x[13] & n14 & n15) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[16] & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[4] & x[5] & n6 & x[14] & x[15]) |
+            (x[2] & x[3] & n5 & n6 & n7 & x[17] & x[18] & n19) |
+            (x[1] & n2 & n3 & n5 & x[6] & n7 & x[14] & x[15]) |
+            (x[5] & x[6] & x[7] & x[9] & n10 & n11 & x[14] & x[15]) |
+            (x[2] & x[3] & n4 & n5 & x[7] & x[14] & x[15]) |
+            (x[5] & x[6] & x[7] & x[10] & x[11] & x[14] & x[15]) |
+            (x[2] & x[3] & x[5] & x[6] & x[7] & x[14] & x[15]) |
+            (x[2] & x[3] & x[4] & x[5] & n6 & x[14] & x[15]) |
+            (x[2] & x[3] & n5 & x[6] & n7 & x[14] & x[15]) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & x[13] & n14 & n15) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & x[13] & n14 & n15) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & x[13] & n14 & n15) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & x[13] & n14 & n15) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & x[12] & n13 & x[14]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & x[12] & n13 & x[14]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & x[12] & n13 & x[14]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & x[12] & n13 & x[14]) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & x[12] & n13 & x[14]) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & x[12] & n13 & x[15]) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & x[12] & n13 & x[15]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & x[12] & n13 & x[15]) |
+            (n4 & n5 & x[7] & x[10] & x[11] & x[12] & n13 & x[15]) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & x[14] & x[15]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & x[14] & x[15]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & x[14] & x[15]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & x[14] & x[15]) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & x[14] & x[15]) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & x[16] & x[17] & n18) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & x[16] & x[17] & n18) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & x[16] & x[17] & n18) |
+            (n4 & n5 & x[7] & x[10] & x[11] & x[16] & x[17] & n18) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & n17 & x[18] & n19) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & n17 & x[18] & n19) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & n17 & x[18] & n19) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & n17 & x[18] & n19) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & n17 & x[18] & n19) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & n17 & x[18] & n19) |
+            (n5 & x[6] & n7 & x[10] & x[11] & n17 & x[18] & n19) |
+            (n4 & n5 & x[7] & x[10] & x[11] & n17 & x[18] & n19) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & n17 & x[18] & n19) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & n17 & x[18] & n19) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[17] & x[18] & n19) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[17] & x[18] & n19) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[17] & x[18] & n19) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & x[13] & n14 & n15) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & x[13] & n14 & n15) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & x[13] & n14 & n15) |
+            (n5 & x[6] & n7 & x[10] & x[11] & x[13] & n14 & n15) |
+            (n4 & n5 & x[7] & x[10] & x[11] & x[13] & n14 & n15) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & x[12] & n13 & x[14]) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & x[12] & n13 & x[14]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & x[12] & n13 & x[14]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & x[12] & n13 & x[14]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & x[12] & n13 & x[14]) |
+            (n5 & x[6] & n7 & x[10] & x[11] & x[12] & n13 & x[14]) |
+            (n4 & n5 & x[7] & x[10] & x[11] & x[12] & n13 & x[14]) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & x[12] & n13 & x[15]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & x[12] & n13 & x[15]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & x[12] & n13 & x[15]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & x[12] & n13 & x[15]) |
+            (n5 & x[6] & n7 & x[10] & x[11] & x[12] & n13 & x[15]) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & x[14] & x[15]) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & x[14] & x[15]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & x[14] & x[15]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & x[14] & x[15]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & x[14] & x[15]) |
+            (n5 & x[6] & n7 & x[10] & x[11] & x[14] & x[15]) |
+            (n4 & n5 & x[7] & x[10] & x[11] & x[14] & x[15]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[17] & x[18] & n19) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[17] & x[18] & n19) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & n16 & n17 & x[19]) |
+            (n4 & n5 & x[7] & x[9] & n10 & n11 & n16 & n17 & x[19]) |
+            (x[4] & x[5] & n6 & x[9] & n10 & n11 & n16 & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & n16 & n17 & x[19]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[10] & n16 & n17 & x[19]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[10] & n16 & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & n16 & n17 & x[19]) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & n16 & n17 & x[19]) |
+            (x[4] & x[5] & n6 & x[8] & n9 & x[11] & n16 & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[10] & x[11] & n16 & n17 & x[19]) |
+            (n4 & n5 & x[7] & x[10] & x[11] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & x[16] & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & x[16] & n17 & x[19]) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & x[16] & n17 & x[19]) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & x[16] & n17 & x[19]) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & x[16] & n17 & x[19]) |
+            (x[2] & x[3] & n4 & x[5] & n6 & n16 & x[17] & n18) |
+            (x[1] & n2 & n3 & x[5] & x[6] & n7 & n16 & x[17] & n18) |
+            (x[2] & x[3] & x[5] & x[6] & n7 & n16 & x[17] & n18) |
+            (x[1] & n2 & n3 & x[4] & n5 & x[7] & n16 & x[17] & n18) |
+            (x[1] & n2 & n3 & n4 & x[5] & n6 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[4] & n5 & x[7] & n16 & x[17] & n18) |
+            (x[0] & n1 & x[2] & n4 & x[5] & n6 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[3] & n4 & x[5] & n6 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[2] & x[5] & x[6] & n7 & n16 & x[17] & n18) |
+            (x[0] & n1 & x[3] & x[5] & x[6] & n7 & n16 & x[17] & n18) |
+            (n5 & x[6] & n7 & x[9] & n10 & n11 & x[16] & x[17] & n18) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[11] & x[16] & x[17] & n18) |
+            (n5 & x[6] & n7 & x[10] & x[11] & x[16] & x[17] & n18) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[16] & n17 & x[19]) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[16] & n17 & x[19]) |
+            (n5 & x[6] & n7 & x[8] & n9 & x[10] & x[16] & x[17] & n18) |
+            (n4 & n5 & x[7] & x[8] & n9 & x[11] & x[16] & x[17] & n18) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & n17 & x[18] & n19) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & x[17] & x[18] & n19) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & x[17] & x[18] & n19) |
+            (x[4] & x[5] & n6 & x[10] & x[11] & n16 & n17 & x[19]) |
+            (x[2] & x[3] & x[4] & n5 & x[7] & n16 & x[17] & n18) |
+            (x[0] & n1 & x[3] & x[4] & n5 & x[7] & n16 & x[17] & n18))
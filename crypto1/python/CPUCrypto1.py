@@ -0,0 +1,232 @@
+#!/bin/env python3
+#
+# Recover crypto1 key on CPU. Even and odd subkey tables are
+# extended bit by bit against the bitstream and sort merged on
+# their LFSR feedback contribution (FastCrypto1.RecoverStates).
+# Same interface as FPGACrypto1 so it can stand in for the board
+# or be used as the reference to time it against.
+#
+# With workers > 1 the odd table is built once and the even cell
+# indices are searched against it in forked pool workers. Their
+# cost follows the even subkey survivors, which vary a lot between
+# indices (CellStats.py), so the schedule option orders or packs
+# them by the predicted survivor count:
+#
+#  static  equal count of even indices per worker, in order
+#  split   indices packed largest first into one task per worker
+#          with equal predicted work
+#  steal   one index per task, largest first, idle workers take
+#          the next one
+#
+
+import FastCrypto1 as fc
+from BitUtil import int2binarr
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing as mp
+import numpy as np
+import argparse
+import random
+import time
+
+# Every (EIDX, OIDX) cell
+ALL_CELLS = [(e, o) for e in range (16) for o in range (16)]
+
+SCHEDULES = ['static', 'split', 'steal']
+
+# Odd half shared with the forked pool workers: contiguous bits,
+# remaining (offset, bit) pairs, odd subkeys, their feedback keys
+# and the keys' sort order
+_ODD = None
+
+# Search even cell indices against the shared odd half, runs in
+# the pool workers. Returns states found and seconds taken.
+def SearchEven (eidx, cells=None):
+    start = time.time ()
+    full, extra, odd, okey, order = _ODD
+    even, ekey = fc.HalfTable (full[0:48], 0, eidx)
+    oi, ei = fc.Join (okey, ekey, order)
+    x = fc.Combine (full, None, extra, even[ei], odd[oi], cells)
+    return x.tolist (), time.time () - start
+
+# Pool tasks (lists of even indices) given the predicted cost of
+# each index
+def Schedule (eidx, cost, workers, schedule='steal'):
+    if schedule == 'static':
+        return [eidx[len (eidx) * n // workers:len (eidx) * (n + 1) // workers]
+                for n in range (workers) if len (eidx) * (n + 1) // workers > len (eidx) * n // workers]
+    order = sorted (eidx, key=lambda e: -cost[e])
+    if schedule == 'steal':
+        return [[e] for e in order]
+    tasks = [[] for _ in range (workers)]
+    load = [0] * workers
+    for e in order:
+        n = load.index (min (load))
+        tasks[n].append (e)
+        load[n] += cost[e]
+    return [t for t in tasks if len (t)]
+
+class CPUCrypto1:
+    '''
+    Recover returns the state at the first bitstream bit like
+    FPGACrypto1.Recover. Only keys in the given cells are reported
+    so the CPU can reproduce what a set of cores would find. All
+    matching states are kept in keys and the cell of the returned
+    one in cell. With a CalcProb.ProbTable keys are ordered most
+    likely cell first. workers > 1 searches in a process pool
+    with the given schedule, the cost of each even index is
+    predicted from its survivors after depth extensions. tasks
+    holds the (even indices, seconds) of the last search.
+    '''
+    def __init__ (self, cache=None, cells=ALL_CELLS, prob=None, workers=1,
+                  schedule='steal', depth=4):
+        self.cache = cache
+        self.prob = prob
+        self.cells = set (cells)
+        self.workers = workers
+        self.schedule = schedule
+        self.depth = depth
+        self.keys = []
+        self.cell = None
+        self.tasks = []
+
+    # Build the odd half for the pool workers, returns the even
+    # indices to search and their predicted cost
+    def Prepare (self, bits, extra, cells):
+        global _ODD
+        full, rest = fc.Contiguous (bits, extra)
+        if len (full) < 10:
+            raise ValueError ('At least 10 keystream bits required')
+        eidx = list (range (16))
+        ocells = None
+        if cells is not None:
+            eidx = sorted (set ([e for e, o in cells]))
+            ocells = set ([o for e, o in cells])
+        odd, okey = fc.HalfTable (full[0:48], 1, ocells)
+        _ODD = (full, rest, odd, okey, np.argsort (okey, kind='stable'))
+        return eidx, fc.Survivors (full[0:48], 0, self.depth)
+
+    # States in cells (None for all), in the pool if workers > 1
+    def Search (self, bits, extra, cells):
+        if self.workers <= 1:
+            return fc.RecoverStates (bits, None, extra, cells)
+        eidx, cost = self.Prepare (bits, extra, cells)
+        tasks = Schedule (eidx, cost, self.workers, self.schedule)
+        states = []
+        self.tasks = []
+        with ProcessPoolExecutor (self.workers, mp_context=mp.get_context ('fork')) as pool:
+            futures = [pool.submit (SearchEven, t, cells) for t in tasks]
+            for t, f in zip (tasks, futures):
+                keys, secs = f.result ()
+                states += keys
+                self.tasks.append ((t, secs))
+        return np.array (states, dtype=np.uint64)
+
+    # Recover key from bitstream, bits past 48 and extra (offset,
+    # bit) pairs are used to filter candidates
+    def Recover (self, bitstream, length=48, extra=None):
+        self.keys = []
+        self.cell = None
+        bs = bitstream >> (length - 48) if length >= 48 else None
+        bits = int2binarr (bitstream, length)
+
+        # Repeat jobs return from cache
+        if self.cache and bs is not None:
+            key = self.cache.Lookup (bs, bits, extra)
+            if key is not None:
+                self.keys = [key]
+                self.cell = tuple (int (x) for x in fc.Cell (key))
+                return key
+            if self.cells <= self.cache.EmptyCells (bs):
+                return None
+
+        cells = None if len (self.cells) == len (ALL_CELLS) else sorted (self.cells)
+        states = self.Search (bits, extra, cells)
+        eidx, oidx = fc.Cell (states)
+        found = [(x, (e, o)) for x, e, o in zip (states.tolist (), eidx.tolist (), oidx.tolist ())
+                 if (e, o) in self.cells]
+        if self.prob and length > max (self.prob.offsets) + 1:
+            rank = {(e, o) : n for n, (_, e, o) in enumerate (self.prob.Search (bits))}
+            found.sort (key=lambda k: rank[k[1]])
+        self.keys = [x for x, _ in found]
+        if len (found):
+            self.cell = found[0][1]
+
+        if len (self.keys) == 0:
+            # Searched cells hold no key
+            if self.cache and bs is not None:
+                for e, o in self.cells:
+                    self.cache.MarkEmpty (bs, e, o)
+            return None
+        if self.cache and bs is not None:
+            for key in self.keys:
+                self.cache.Store (bs, key)
+        return self.keys[0]
+
+    # Recover key from (offset, bits) keystream fragments too short
+    # for Recover (FastCrypto1.RecoverFragments). Returns the state
+    # at offset 0, cells apply at the start of the longest fragment.
+    def RecoverFragments (self, frags):
+        self.cell = None
+        cells = None if len (self.cells) == len (ALL_CELLS) else sorted (self.cells)
+        self.keys = fc.RecoverFragments (frags, cells).tolist ()
+        if len (self.keys) == 0:
+            return None
+        self.cell = tuple (int (x) for x in fc.Cell (self.keys[0]))
+        return self.keys[0]
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--count', type=int, default=12,
+                         help='Number of random bitstreams to recover')
+    parser.add_argument ('--len', type=int, default=48, help='Bitstream length')
+    parser.add_argument ('--fpga-cells', action='store_true',
+                         help='Only report keys in the cells instantiated on the FPGA')
+    parser.add_argument ('--profile', type=str,
+                         help='Save stage profile (JSON, or .folded for flamegraph)')
+    parser.add_argument ('--table', type=str,
+                         help='Order keys most likely cell first (CalcProb trained table)')
+    parser.add_argument ('--workers', type=int, default=1, help='Pool processes')
+    parser.add_argument ('--schedule', type=str, default='steal', choices=SCHEDULES,
+                         help='Even index scheduling with --workers')
+    args = parser.parse_args ()
+
+    if args.profile:
+        import Profile
+        Profile.Enable (args.profile)
+
+    cells = ALL_CELLS
+    if args.fpga_cells:
+        cells = [(i, j) for i in range (4) for j in range (5)]
+    prob = None
+    if args.table:
+        from CalcProb import ProbTable
+        prob = ProbTable (path=args.table)
+    crack = CPUCrypto1 (cells=cells, prob=prob, workers=args.workers, schedule=args.schedule)
+
+    # Try random valid bitstreams
+    total = 0
+    for n in range (args.count):
+
+        # Create random key and output bitstream
+        rkey = random.randint (0, 2**48 - 1)
+        bs = 0
+        x = rkey
+        for i in range (args.len):
+            b, x = fc.Step (x)
+            bs = (bs << 1) | b
+        print ('bitstream={}'.format (hex (bs)))
+
+        start = time.time ()
+        key = crack.Recover (bs, args.len)
+        total += time.time () - start
+        if key is not None:
+            print ('Found key: {} cell={} candidates={}'.format (
+                hex (key), crack.cell, len (crack.keys)))
+            if rkey in crack.keys:
+                print ('Key check: OK')
+        else:
+            print ('Key not found')
+    print ('Average time: {:.2f}s'.format (total / args.count))
+    if args.profile:
+        Profile.PROFILE.Print ()
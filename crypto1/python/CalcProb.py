@@ -5,31 +5,38 @@
 # four bits apart and retrieved after splitting
 # even/odd sequence.
 #
+# ProbTable (--train) conditions on larger contexts and also
+# orders the B20Enum positions within a cell.
+#
 # Elliot Buller
 # 2022
 #
 
 from Crypto1 import *
+import FastCrypto1 as fc
+import numpy as np
 import argparse
 import json
+import os
 
 # Convert initial state to index
 ilookup = [[0, 2, 4, 5, 6, 7, 8, 9, 10, 12, 19, 21, 23, 24, 25, 28],
            [1, 3, 11, 13, 14, 15, 16, 17, 18, 20, 22, 26, 27, 29, 30, 31]]
 
-def XOR (key):
-    return key[47] ^ key[42] ^ key[38] ^ key[37] ^ key[35] ^ key[33] ^ \
-        key[32] ^ key[30] ^ key[28] ^ key[23] ^ key[22] ^ key[20] ^ \
-        key[18] ^ key[12] ^ key[8] ^ key[6] ^ key[5] ^ key[4]
+# Default probability table next to this script
+PROB_JSON = os.path.join (os.path.dirname (os.path.abspath (__file__)),
+                          'crypto1_prob.json')
+
+# Trained higher order table for a context size
+def TablePath (bits):
+    return os.path.join (os.path.dirname (os.path.abspath (__file__)),
+                         'crypto1_prob{}.npz'.format (bits))
 
 # Rewind state 45 cycles
 def Rewind (key):
-    state = int2binarr (key, 48)[::-1]
     for n in range (45):
-        a = state[0]
-        state = state[1:48] + [0]
-        state[47] = XOR(state) ^ a
-    return binarr2int (state[::-1])
+        key = fc.Rollback (key)
+    return key
 
 class Crypto1Prob:
 
@@ -107,6 +114,185 @@ class Crypto1Prob:
         _ += '#endif /* CRYPTO1_PROB_H */\n'
         print (_)
         
+# Output bit offsets of each context, bit 0 is the first output
+# of the cell, the odd cell uses the same offsets + 1. 8 matches
+# crypto1_prob.json (64 bit bitstream), 12 was picked greedily on
+# held out keys and 16 extends it, both fit a 48 bit bitstream.
+# 16 needs well over 4M training keys. Odd stream offsets add
+# nothing measurable but any offsets can be trained.
+CONTEXTS = {
+    8  : [0, 8, 16, 24, 32, 40, 48, 56],
+    12 : [0, 2, 4, 6, 8, 10, 16, 18, 20, 24, 26, 32],
+    16 : [0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20, 22, 24, 26, 28, 32],
+}
+
+class ProbTable:
+    '''
+    Trainable tables over a context of output bits. cell holds
+    counts of the cell index (EIDX/OIDX) per context, sub the
+    counts of the 3 bit B20Enum sub-index of each Fa/Fb nibble per
+    context and nibble output. Cells and positions within a cell
+    can then be walked most likely first.
+    '''
+    def __init__ (self, offsets=CONTEXTS[12], path=None):
+        self.offsets = list (offsets)
+        self.cell = np.zeros ((1 << len (self.offsets), 16), dtype=np.int64)
+        self.sub = np.zeros ((1 << len (self.offsets), 5, 2, 8), dtype=np.int64)
+        if path:
+            self.Load (path)
+
+    def Load (self, path):
+        f = np.load (path)
+        self.offsets = f['offsets'].tolist ()
+        self.cell = f['cell']
+        self.sub = f['sub']
+
+    def Save (self, path):
+        np.savez_compressed (path, offsets=np.array (self.offsets),
+                             cell=self.cell, sub=self.sub)
+
+    # Context of bit lists or (n, bits) arrays starting at first
+    def Context (self, bits, first=0):
+        ctx = 0
+        for o in self.offsets:
+            ctx = (ctx << 1) | bits[first + o]
+        return ctx
+
+    # Count n random states, in batches
+    def Train (self, n, batch=1 << 20):
+        nbits = max (self.offsets) + 1
+        for m in range (0, n, batch):
+            x = np.random.randint (0, 1 << 48, min (batch, n - m), dtype=np.uint64)
+            h = fc.Compress (x) & 0xFFFFF
+            sel = fc.SEL20[h].astype (np.int64)
+            bits = []
+            s = x
+            for _ in range (nbits):
+                b, s = fc.VStep (s)
+                bits.append (b.astype (np.int64))
+            ctx = self.Context (bits)
+            size = self.cell.size
+            self.cell += np.bincount (ctx * 16 + fc.CELL5[sel],
+                                      minlength=size).reshape (self.cell.shape)
+            for g in range (5):
+                sub = fc.SUB4[g][(h >> (4 * g)) & 15].astype (np.int64)
+                bit = (sel >> (4 - g)) & 1
+                cnt = np.bincount ((ctx * 2 + bit) * 8 + sub, minlength=self.cell.shape[0] * 16)
+                self.sub[:, g] += cnt.reshape ((-1, 2, 8))
+
+    # Probability of each cell index, counts smoothed by one
+    def CellProb (self, ctx):
+        c = self.cell[ctx] + 1
+        return c / c.sum ()
+
+    # Probability of each sub-index per nibble given its output
+    def SubProb (self, ctx, sel):
+        p = np.array ([self.sub[ctx, g, (sel >> (4 - g)) & 1] for g in range (5)]) + 1
+        return p / p.sum (axis=1, keepdims=True)
+
+    # [prob, eidx, oidx] sorted most likely first as Crypto1Prob.search
+    def Search (self, bits):
+        even = self.CellProb (self.Context (bits, 0))
+        odd = self.CellProb (self.Context (bits, 1))
+        search = [[even[i] * odd[j], i, j] for i in range (16) for j in range (16)]
+        return sorted (search, key=lambda x: -x[0])
+
+    # B20Enum counters of a cell in probability order, half is 0
+    # for even and 1 for odd
+    def Positions (self, bits, half, idx):
+        sel = ilookup[bits[half]][idx]
+        p = self.SubProb (self.Context (bits, half), sel)
+        ctr = np.arange (1 << 15)
+        score = np.ones (1 << 15)
+        for g in range (5):
+            score *= p[g][(ctr >> (3 * g)) & 7]
+        return np.argsort (-score, kind='stable')
+
+    # Per nibble/output sub-index walk order for B20Enum ORDER,
+    # order[g][bit][rank] = sub-index
+    def Order (self, bits, half):
+        sub = self.sub[self.Context (bits, half)]
+        return np.argsort (-sub, axis=2, kind='stable').tolist ()
+
+# Pack Order () into the B20Enum ORDER port, 3 bits per entry at
+# ((g * 2 + bit) * 8 + rank) * 3
+def OrderBits (order):
+    ret = 0
+    for g in range (5):
+        for b in range (2):
+            for r in range (8):
+                ret |= order[g][b][r] << (((g * 2 + b) * 8 + r) * 3)
+    return ret
+
+# Identity order, B20Enum counts up
+ORDER_ID = OrderBits ([[list (range (8))] * 2] * 5)
+
+# Sample n random keys against a table, returns average percent
+# searched before the key's cell, and before its even/odd position
+# within the cell in counter, B20Enum ORDER and exact order
+def SampleTable (n, table):
+    cell = 0
+    pos = np.zeros ((2, 3))
+    for _ in range (n):
+        x = random.randint (1, 2**48 - 1)
+        bits = []
+        s = x
+        for _ in range (max (table.offsets) + 2):
+            b, s = fc.Step (s)
+            bits.append (b)
+        search = table.Search (bits)
+        eidx, oidx = (int (v) for v in fc.Cell (x))
+        cell += [(e, o) for _, e, o in search].index ((eidx, oidx)) / 255 * 100
+
+        # Counter of even/odd halves
+        for half, (y, idx) in enumerate ([(x, eidx), (fc.Step (x)[1], oidx)]):
+            ctr = int (fc.SubIndex (fc.Compress (y) & 0xFFFFF))
+            order = table.Order (bits, half)
+            rank = sum ([order[g][(fc.SEL20[fc.Compress (y) & 0xFFFFF] >> (4 - g)) & 1]
+                         .index ((ctr >> (3 * g)) & 7) << (3 * g) for g in range (5)])
+            exact = int (np.nonzero (table.Positions (bits, half, idx) == ctr)[0][0])
+            pos[half] += np.array ([ctr, rank, exact]) / 32767 * 100
+    return cell / n, pos / n
+
+# Even/odd index of key and 64 bit bitstream it generates
+def GetIndex (key):
+
+    # Get bitstream
+    cipher = Crypto1 (state=key)
+    bs = cipher.Raw (64)
+
+    # Create
+    cipher = Crypto1 (state=key)
+
+    # Get first output bit
+    out0 = cipher.Raw (1)[0]
+
+    # Get even idx
+    eidx = ilookup[out0].index (binarr2int(cipher.Start ()))
+
+    # Move one bit forward and get state
+    cipher = Crypto1 (state=binarr2int(cipher.State()))
+
+    # Get first output bit
+    out0 = cipher.Raw (1)[0]
+
+    # Get odd idx
+    oidx = ilookup[out0].index (binarr2int(cipher.Start ()))
+    return eidx, oidx, bs
+
+# Sample n random keys, return average time to solve in percent
+def Sample (n, json_file=PROB_JSON):
+    avg = float ()
+    for _ in range (n):
+        eidx, oidx, bs = GetIndex (random.randint (1, 2**48))
+
+        # Get probability
+        prob = Crypto1Prob (json_file, bs)
+
+        # Calc time to solve
+        avg += prob.index (eidx, oidx) / 255 * 100
+    return avg / n
+
 if __name__ == '__main__':
 
     parser = argparse.ArgumentParser ()
@@ -122,7 +308,22 @@ if __name__ == '__main__':
                          help='Rewind key 45 cycles')
     parser.add_argument ('--sample', type=int,
                          help='Sample n random keys, show average time to solve')
+    parser.add_argument ('--train', type=int,
+                         help='Train higher order table on n random keys')
+    parser.add_argument ('--bits', type=int, default=12, choices=sorted (CONTEXTS),
+                         help='Context size of trained table')
+    parser.add_argument ('--table', type=str,
+                         help='Trained table (default crypto1_prob<bits>.npz)')
     args = parser.parse_args ()
+    table = args.table or TablePath (args.bits)
+
+    # Train higher order table, adds to existing counts
+    if args.train:
+        prob = ProbTable (CONTEXTS[args.bits])
+        if os.path.exists (table):
+            prob.Load (table)
+        prob.Train (args.train)
+        prob.Save (table)
 
 
     # Generate pickle file
@@ -180,7 +381,7 @@ if __name__ == '__main__':
             idx += 1
             
         # Create output file
-        with open ('crypto1_prob.json', 'w') as fp:
+        with open (PROB_JSON, 'w') as fp:
 
             # Write out json
             json.dump (store, fp)
@@ -189,7 +390,7 @@ if __name__ == '__main__':
     elif args.gen_c:
 
         # Create object
-        prob = Crypto1Prob ('crypto1_prob.json')
+        prob = Crypto1Prob (PROB_JSON)
         prob.gen_c ()
         
     elif args.get_random:
@@ -206,79 +407,28 @@ if __name__ == '__main__':
     if args.get_idx:
 
         print ('Key={}'.format (args.get_idx))
-
-        # Get bitstream
-        cipher = Crypto1 (state=int(args.get_idx, 0))
-        bs = cipher.Raw (64)
-
-        # Create
-        cipher = Crypto1 (state=int(args.get_idx, 0))
-
-        # Get first output bit
-        out0 = cipher.Raw (1)[0]
-
-        # Get even idx
-        eidx = ilookup[out0].index (binarr2int(cipher.Start ()))
+        eidx, oidx, bs = GetIndex (int (args.get_idx, 0))
         print ('Even={}'.format (eidx))
-
-        # Move one bit forward and get state
-        cipher = Crypto1 (state=binarr2int(cipher.State()))
-
-        # Get first output bit
-        out0 = cipher.Raw (1)[0]
-        
-        # Get even idx
-        oidx = ilookup[out0].index (binarr2int(cipher.Start ()))
-
-        # Get odd idx
         print ('Odd={}'.format (oidx))
 
         # Print bitstream
         print ('Bitstream={}'.format (hex (binarr2int (bs))))
 
         # Get probability
-        prob = Crypto1Prob ('crypto1_prob.json', bs)
+        prob = Crypto1Prob (PROB_JSON, bs)
 
         # Print index
         print ('Solution found at {:.2f}%'.format (prob.index (eidx, oidx)/255 * 100))
 
     # Get even/odd index for key
     if args.sample:
-
-        avg = float ()
-        
-        for n in range (args.sample):
-            key = hex(random.randint (1, 2**48))
-
-            # Get bitstream
-            cipher = Crypto1 (state=int(key, 0))
-            bs = cipher.Raw (64)
-
-            # Create
-            cipher = Crypto1 (state=int(key, 0))
-
-            # Get first output bit
-            out0 = cipher.Raw (1)[0]
-
-            # Get even idx
-            eidx = ilookup[out0].index (binarr2int(cipher.Start ()))
-
-            # Move one bit forward and get state
-            cipher = Crypto1 (state=binarr2int(cipher.State()))
-
-            # Get first output bit
-            out0 = cipher.Raw (1)[0]
-        
-            # Get even idx
-            oidx = ilookup[out0].index (binarr2int(cipher.Start ()))
-
-            # Get probability
-            prob = Crypto1Prob ('crypto1_prob.json', bs)
-
-            # Calc time to solve
-            tts = prob.index (eidx, oidx) / 255 * 100
-            avg += tts
-
-        # Get average tts
-        avg = avg / args.sample
+        avg = Sample (args.sample)
         print ('Average time to solve: {:.2f}%'.format (avg))
+
+        # Gain of trained table, cells and positions within cells
+        if os.path.exists (table):
+            cell, pos = SampleTable (args.sample, ProbTable (path=table))
+            print ('{}: cell {:.2f}%'.format (os.path.basename (table), cell))
+            for half, p in zip (['Even', 'Odd'], pos):
+                print ('{} position: counter {:.2f}% ORDER {:.2f}% exact {:.2f}%'.format (
+                    half, *p))
@@ -0,0 +1,133 @@
+#!/bin/env python3
+#
+# Per cell workload over random bitstreams. Each Crypto1Attack core
+# takes one (EIDX, OIDX) cell and joins every even 24 bit subkey
+# left after GenSubkey's four extensions with every odd one, so a
+# cell costs even * odd merges and the slowest cell sets the finish
+# time. Reports the even/odd survivor and merge work distributions
+# per cell and the idle share of the FPGA cores.
+#
+# --time M also times the CPU engine's tasks (one even index
+# against the shared odd table, CPUCrypto1.SearchEven) on M
+# bitstreams, shows how well the survivor counts at a few depths
+# predict them and the simulated finish time of each CPUCrypto1
+# schedule for --workers processes relative to a perfect split.
+#
+# Usage:
+#  CellStats.py [--count N] [--ext 4] [--time M] [--workers 8] [--json FILE]
+#
+
+import FastCrypto1 as fc
+from RecoverKey import CELLS
+import CPUCrypto1 as cpu
+import numpy as np
+import argparse
+import json
+import random
+
+# Random 48 bit bitstreams as bit lists
+def Bitstreams (n):
+    for _ in range (n):
+        s = random.randint (0, 2**48 - 1)
+        bits = []
+        for _ in range (48):
+            b, s = fc.Step (s)
+            bits.append (b)
+        yield bits
+
+# Even and odd survivors per cell index, (n, 16) arrays each
+def Collect (n, ext=4):
+    even = []
+    odd = []
+    for bits in Bitstreams (n):
+        even.append (fc.Survivors (bits, 0, ext))
+        odd.append (fc.Survivors (bits, 1, ext))
+    return np.array (even), np.array (odd)
+
+def Summary (a):
+    a = np.asarray (a, dtype=np.float64).ravel ()
+    p = np.percentile (a, [5, 50, 95])
+    return {'mean' : round (float (a.mean ()), 1), 'std' : round (float (a.std ()), 1),
+            'min' : int (a.min ()), 'p5' : round (float (p[0]), 1), 'p50' : round (float (p[1]), 1),
+            'p95' : round (float (p[2]), 1), 'max' : int (a.max ())}
+
+# Share of core time idle waiting for the slowest cell, one core
+# per cell all started together
+def Idle (work):
+    return float ((1 - work.mean (axis=1) / work.max (axis=1)).mean ())
+
+# Finish time of tasks handed in order to the first free worker
+def Makespan (secs, workers):
+    free = [0.0] * workers
+    for s in secs:
+        n = free.index (min (free))
+        free[n] += s
+    return max (free)
+
+def Timing (count, workers, depths=(2, 4, 8)):
+    eng = cpu.CPUCrypto1 (workers=workers)
+    times = []
+    pred = {d : [] for d in depths}
+    ratio = {s : 0.0 for s in cpu.SCHEDULES}
+    for bits in Bitstreams (count):
+        eidx, _ = eng.Prepare (bits, None, None)
+        secs = {}
+        for e in eidx:
+            secs[e] = cpu.SearchEven ([e])[1]
+        times += [secs[e] for e in eidx]
+        for d in depths:
+            pred[d] += fc.Survivors (bits, 0, d).tolist ()
+        ideal = max (sum (secs.values ()) / workers, max (secs.values ()))
+        cost = fc.Survivors (bits, 0, eng.depth)
+        for s in cpu.SCHEDULES:
+            tasks = cpu.Schedule (eidx, cost, workers, s)
+            ratio[s] += Makespan ([sum ([secs[e] for e in t]) for t in tasks], workers) / ideal
+        print ('.', end='', flush=True)
+    print ()
+    return {'task_secs' : Summary (np.array (times) * 1000),
+            'predict_r' : {d : round (float (np.corrcoef (times, p)[0, 1]), 3)
+                           for d, p in pred.items ()},
+            'finish_vs_ideal' : {s : round (r / count, 3) for s, r in ratio.items ()}}
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--count', type=int, default=200, help='Number of random bitstreams')
+    parser.add_argument ('--ext', type=int, default=4, help='Subkey extensions (GenSubkey: 4)')
+    parser.add_argument ('--time', type=int, default=0,
+                         help='Time the CPU engine tasks on N bitstreams')
+    parser.add_argument ('--workers', type=int, default=8, help='Workers for the schedule simulation')
+    parser.add_argument ('--json', type=str, help='Save statistics (JSON)')
+    args = parser.parse_args ()
+
+    even, odd = Collect (args.count, args.ext)
+    merge = even[:, :, None] * odd[:, None, :]
+    fpga = np.array ([merge[:, e, o] for e, o in CELLS]).T
+    stats = {
+        'count' : args.count, 'ext' : args.ext,
+        'even' : Summary (even), 'odd' : Summary (odd), 'merge' : Summary (merge),
+        'even_by_index' : [Summary (even[:, n]) for n in range (16)],
+        'odd_by_index' : [Summary (odd[:, n]) for n in range (16)],
+        'merge_by_cell' : {'{},{}'.format (e, o) : Summary (merge[:, e, o])
+                           for e in range (16) for o in range (16)},
+        'fpga_idle' : round (Idle (fpga), 3),
+        'fpga_max_over_mean' : round (float ((fpga.max (axis=1) / fpga.mean (axis=1)).mean ()), 2),
+    }
+    print ('Even survivors: {}'.format (stats['even']))
+    print ('Odd survivors:  {}'.format (stats['odd']))
+    print ('Merge work:     {}'.format (stats['merge']))
+    print ('Mean even survivors by index: {}'.format (
+        ' '.join (['{:.0f}'.format (s['mean']) for s in stats['even_by_index']])))
+    print ('FPGA cells: slowest/mean {:.2f}, cores idle {:.1f}%'.format (
+        stats['fpga_max_over_mean'], stats['fpga_idle'] * 100))
+
+    if args.time:
+        t = Timing (args.time, args.workers)
+        stats['cpu'] = t
+        print ('CPU task ms: {}'.format (t['task_secs']))
+        print ('Task time vs survivors at depth: {}'.format (t['predict_r']))
+        print ('Finish time vs ideal, {} workers: {}'.format (args.workers, t['finish_vs_ideal']))
+
+    if args.json:
+        with open (args.json, 'w') as fp:
+            json.dump (stats, fp, indent=1)
@@ -0,0 +1,423 @@
+#!/bin/env python3
+#
+# Shard cell searches across machines. A coordinator splits each
+# bitstream into (EIDX, OIDX) cell ranges and leases them to the
+# workers connected over plain TCP, JSON lines both ways. Leases
+# not answered in time go back to the queue, the first key found
+# ends the job and every worker is told to drop it.
+#
+#  Cluster.py coordinator [--addr [HOST:]PORT] [--local N] [BITSTREAM ...]
+#  Cluster.py worker --addr HOST:PORT [--dev DEV]
+#
+# A CPU lease holds the cells of whole even index rows, the worker
+# joins them against the odd subkey table it builds once per job
+# (CPUCrypto1.SearchEven). A worker with a board (--dev, or
+# emu[:DELAY]) takes the 20 cells instantiated in Crypto1Attack in
+# one lease, they go back to the CPU workers if the board lost keys
+# or runs the shipped image. --local starts N CPU workers on
+# localhost.
+#
+# Messages:
+#  worker => {"type": "hello", "name": N, "kind": "cpu"|"fpga"}
+#  coord  => {"type": "lease", "job": J, "lease": L, "bits": "hex",
+#             "len": 48, "extra": [[offset, bit], ...], "cells": [[e, o], ...]}
+#  worker => {"type": "result", "job": J, "lease": L, "keys": ["hex"], "time": s}
+#            {"type": "result", "job": J, "lease": L, "error": "..."}
+#  coord  => {"type": "cancel", "job": J}
+#
+
+from CPUCrypto1 import ALL_CELLS
+from RecoverKey import CELLS
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+
+class Job:
+
+    def __init__ (self, jid, bitstream, length, extra, cells):
+        self.jid = jid
+        self.bitstream = bitstream
+        self.length = length
+        self.extra = list (extra or [])
+        # Cells not leased yet, most likely first
+        self.pending = list (cells)
+        # lease id => (worker, cells, deadline)
+        self.leases = {}
+        self.searched = set ()
+        self.keys = []
+        # Board not failed on this job yet
+        self.board = True
+        self.start = time.time ()
+        self.done = threading.Event ()
+
+class Worker:
+
+    def __init__ (self, wfile, name, kind):
+        self.wfile = wfile
+        self.name = name
+        self.kind = kind
+        self.leases = set ()
+        self.stats = {'leases' : 0, 'cells' : 0, 'expired' : 0, 'busy' : 0.0}
+
+    def Send (self, msg):
+        try:
+            self.wfile.write ((json.dumps (msg) + '\n').encode ())
+            self.wfile.flush ()
+        except OSError:
+            pass
+
+class Handler (socketserver.StreamRequestHandler):
+    '''
+    One worker connection. Its leases are handed back to the
+    queue when it goes away.
+    '''
+    def handle (self):
+        coord = self.server.coord
+        worker = None
+        for line in self.rfile:
+            try:
+                msg = json.loads (line)
+            except ValueError:
+                continue
+            if msg.get ('type') == 'hello' and worker is None:
+                worker = Worker (self.wfile, msg.get ('name'), msg.get ('kind', 'cpu'))
+                coord.Join (worker)
+            elif msg.get ('type') == 'result' and worker:
+                coord.Result (worker, msg)
+        if worker:
+            coord.Drop (worker)
+
+class TCPServer (socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+# [host:]port, host defaults to localhost
+def Address (addr):
+    host, _, port = addr.rpartition (':')
+    return (host or '127.0.0.1', int (port))
+
+class Coordinator:
+    '''
+    Lease cells to workers. A CPU worker holds at most slots leases
+    of the cells of span even index rows, a board one lease of the
+    FPGA cells per job.
+    Leases expire after timeout (board_timeout for boards), their
+    cells go back to the head of the queue. Results of expired
+    leases still count when they come in. With a
+    CalcProb.ProbTable cells are leased most likely first.
+    '''
+    def __init__ (self, addr, span=1, slots=2, timeout=60, board_timeout=120, prob=None):
+        self.span = span
+        self.slots = slots
+        self.timeout = timeout
+        self.board_timeout = board_timeout
+        self.prob = prob
+        self.lock = threading.RLock ()
+        self.jobs = {}
+        self.workers = []
+        self.next_job = 0
+        self.next_lease = 0
+        self.server = TCPServer (Address (addr), Handler)
+        self.server.coord = self
+        self.addr = '{}:{}'.format (*self.server.server_address)
+        threading.Thread (target=self.server.serve_forever, daemon=True).start ()
+        threading.Thread (target=self.Sweep, daemon=True).start ()
+
+    def Close (self):
+        self.server.shutdown ()
+        self.server.server_close ()
+
+    def Order (self, bitstream, length):
+        if self.prob and length > max (self.prob.offsets) + 1:
+            from BitUtil import int2binarr
+            return [(e, o) for _, e, o in self.prob.Search (int2binarr (bitstream, length))]
+        return list (ALL_CELLS)
+
+    # Queue a bitstream, returns job id
+    def Submit (self, bitstream, length=48, extra=None):
+        with self.lock:
+            jid = self.next_job
+            self.next_job += 1
+            self.jobs[jid] = Job (jid, bitstream, length, extra,
+                                  self.Order (bitstream, length))
+            self.Dispatch ()
+        return jid
+
+    # Keys found for a job, empty if none
+    def Wait (self, jid, timeout=None):
+        job = self.jobs[jid]
+        if not job.done.wait (timeout):
+            return None
+        with self.lock:
+            self.jobs.pop (jid, None)
+        return job.keys
+
+    def Recover (self, bitstream, length=48, extra=None):
+        keys = self.Wait (self.Submit (bitstream, length, extra))
+        return keys[0] if keys else None
+
+    def Join (self, worker):
+        with self.lock:
+            self.workers.append (worker)
+            self.Dispatch ()
+
+    def Drop (self, worker):
+        with self.lock:
+            if worker in self.workers:
+                self.workers.remove (worker)
+            for job in list (self.jobs.values ()):
+                for lid in [l for l, v in job.leases.items () if v[0] is worker]:
+                    self.Requeue (job, lid)
+            self.Dispatch ()
+
+    # Cells of a lease back to the head of the queue
+    def Requeue (self, job, lid):
+        worker, cells, _ = job.leases.pop (lid)
+        worker.leases.discard (lid)
+        if worker.kind == 'fpga':
+            job.board = False
+        job.pending = [c for c in cells if c not in job.searched] + job.pending
+
+    # Next cells for a worker, oldest job first
+    def Cells (self, worker):
+        boards = any ([w.kind == 'fpga' for w in self.workers])
+        for job in self.jobs.values ():
+            if job.done.is_set ():
+                continue
+            if worker.kind == 'fpga':
+                # Board searches its cells in one go, once per job
+                if job.board and not any ([v[0] is worker for v in job.leases.values ()]):
+                    cells = [c for c in job.pending if c in CELLS]
+                    if len (cells):
+                        return job, cells, self.board_timeout
+                continue
+            # Leave the FPGA cells to the boards while they work
+            skip = boards and job.board
+            cells = [c for c in job.pending if not (skip and c in CELLS)]
+            # Whole even index rows, most likely first
+            rows = []
+            for e, o in cells:
+                if e not in rows:
+                    rows.append (e)
+            cells = [c for c in cells if c[0] in rows[0:self.span]]
+            if len (cells):
+                return job, cells, self.timeout
+        return None
+
+    def Dispatch (self):
+        with self.lock:
+            for w in sorted (self.workers, key=lambda w: w.kind != 'fpga'):
+                while len (w.leases) < (1 if w.kind == 'fpga' else self.slots):
+                    nxt = self.Cells (w)
+                    if nxt is None:
+                        break
+                    job, cells, timeout = nxt
+                    lid = self.next_lease
+                    self.next_lease += 1
+                    job.pending = [c for c in job.pending if c not in cells]
+                    job.leases[lid] = (w, cells, time.time () + timeout)
+                    w.leases.add (lid)
+                    w.stats['leases'] += 1
+                    w.Send ({'type' : 'lease', 'job' : job.jid, 'lease' : lid,
+                             'bits' : hex (job.bitstream), 'len' : job.length,
+                             'extra' : job.extra, 'cells' : cells})
+
+    def Result (self, worker, msg):
+        with self.lock:
+            job = self.jobs.get (msg['job'])
+            lid = msg['lease']
+            worker.leases.discard (lid)
+            if job is None or job.done.is_set ():
+                self.Dispatch ()
+                return
+            lease = job.leases.get (lid)
+            if 'error' in msg:
+                if lease:
+                    self.Requeue (job, lid)
+            else:
+                job.leases.pop (lid, None)
+                cells = [tuple (c) for c in msg.get ('cells', lease[1] if lease else [])]
+                job.searched |= set (cells)
+                worker.stats['cells'] += len (cells)
+                worker.stats['busy'] += msg.get ('time', 0)
+                job.keys += [int (k, 16) for k in msg.get ('keys', [])]
+                job.pending = [c for c in job.pending if c not in job.searched]
+            if len (job.keys):
+                self.Finish (job)
+            elif len (job.pending) == 0 and len (job.leases) == 0:
+                job.done.set ()
+            self.Dispatch ()
+
+    # Key found, every worker drops the job
+    def Finish (self, job):
+        for lid in list (job.leases):
+            worker, _, _ = job.leases.pop (lid)
+            worker.leases.discard (lid)
+        job.pending = []
+        job.done.set ()
+        for w in self.workers:
+            w.Send ({'type' : 'cancel', 'job' : job.jid})
+
+    # Expire leases past their deadline
+    def Sweep (self, interval=0.5):
+        while True:
+            time.sleep (interval)
+            with self.lock:
+                now = time.time ()
+                for job in self.jobs.values ():
+                    for lid, (w, cells, deadline) in list (job.leases.items ()):
+                        if now > deadline:
+                            w.stats['expired'] += 1
+                            self.Requeue (job, lid)
+                self.Dispatch ()
+
+    def Stats (self):
+        with self.lock:
+            return {w.name : dict (w.stats, kind=w.kind) for w in self.workers}
+
+class ClusterWorker:
+    '''
+    Worker side. Leases are searched in turn, a cancel drops the
+    queued leases of the job and stops a board search of it.
+    '''
+    def __init__ (self, addr, name=None, dev=None):
+        self.sock = socket.create_connection (Address (addr))
+        self.rfile = self.sock.makefile ('r')
+        self.lock = threading.Lock ()
+        self.fpga = None
+        # Job the CPUCrypto1 odd table was built for
+        self.job = None
+        if dev:
+            from RecoverKey import FPGACrypto1
+            self.fpga = FPGACrypto1 (dev)
+        self.name = name or '{}:{}'.format (socket.gethostname (), os.getpid ())
+        self.leases = queue.Queue ()
+        self.cancelled = set ()
+        self.current = None
+        self.cancel = threading.Event ()
+        self.Send ({'type' : 'hello', 'name' : self.name,
+                    'kind' : 'fpga' if self.fpga else 'cpu'})
+
+    def Send (self, msg):
+        with self.lock:
+            self.sock.sendall ((json.dumps (msg) + '\n').encode ())
+
+    def Reader (self):
+        for line in self.rfile:
+            msg = json.loads (line)
+            if msg['type'] == 'lease':
+                self.leases.put (msg)
+            elif msg['type'] == 'cancel':
+                self.cancelled.add (msg['job'])
+                if self.current == msg['job']:
+                    self.cancel.set ()
+        self.leases.put (None)
+
+    # Keys of the leased cells
+    def Search (self, lease):
+        bits = int (lease['bits'], 16)
+        length = lease['len']
+        extra = [tuple (e) for e in lease['extra']]
+        if self.fpga:
+            bs = bits >> (length - 48)
+            known = [(n, (bits >> (length - 1 - n)) & 1) for n in range (48, length)]
+            key = self.fpga.Recover (bs, known + extra, self.cancel)
+            if self.fpga.timeout:
+                raise IOError ('Board timeout')
+            # Cells not known empty, the CPU workers take them
+            if key is None and self.fpga.lost:
+                raise IOError ('Board lost keys')
+            if key is None and self.fpga.shipped:
+                raise IOError ('Shipped image skips subkeys')
+            return [] if key is None else [key]
+        import CPUCrypto1 as cc
+        from BitUtil import int2binarr
+        if self.job != lease['job']:
+            cc.CPUCrypto1 ().Prepare (int2binarr (bits, length), extra, None)
+            self.job = lease['job']
+        cells = [tuple (c) for c in lease['cells']]
+        return cc.SearchEven (sorted (set ([e for e, o in cells])), cells)[0]
+
+    def Run (self):
+        threading.Thread (target=self.Reader, daemon=True).start ()
+        while True:
+            lease = self.leases.get ()
+            if lease is None:
+                break
+            if lease['job'] in self.cancelled:
+                continue
+            self.current = lease['job']
+            self.cancel.clear ()
+            start = time.time ()
+            msg = {'type' : 'result', 'job' : lease['job'], 'lease' : lease['lease']}
+            try:
+                keys = self.Search (lease)
+                msg.update (keys=[hex (k) for k in keys], cells=lease['cells'])
+            except (IOError, ValueError) as e:
+                msg['error'] = str (e)
+            msg['time'] = round (time.time () - start, 3)
+            self.current = None
+            # Coordinator has dropped the job
+            if not self.cancel.is_set ():
+                self.Send (msg)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    sub = parser.add_subparsers (dest='cmd', required=True)
+
+    p = sub.add_parser ('coordinator', help='Lease cells of bitstreams to workers')
+    p.add_argument ('bitstream', type=str, nargs='*',
+                    help='Bitstreams in hex, read from stdin if none')
+    p.add_argument ('--addr', type=str, default='0.0.0.0:7700', help='Listen on [host:]port')
+    p.add_argument ('--len', type=int, default=48, help='Bitstream length')
+    p.add_argument ('--span', type=int, default=1, help='Even index rows per CPU lease')
+    p.add_argument ('--slots', type=int, default=2, help='Leases held by each CPU worker')
+    p.add_argument ('--timeout', type=float, default=60, help='CPU lease timeout (s)')
+    p.add_argument ('--table', type=str,
+                    help='Lease most likely cells first (CalcProb trained table)')
+    p.add_argument ('--local', type=int, default=0, help='Start N CPU workers on localhost')
+
+    p = sub.add_parser ('worker', help='Search cells leased by a coordinator')
+    p.add_argument ('--addr', type=str, required=True, help='Coordinator host:port')
+    p.add_argument ('--dev', type=str, help='FPGA serial device (or emu[:DELAY]), CPU if not given')
+    p.add_argument ('--name', type=str, help='Worker name')
+    p.add_argument ('--csr', type=str,
+                    help='CSR map of queue image boards (JSON from the generated crypto1_csr)')
+    args = parser.parse_args ()
+
+    if args.cmd == 'worker':
+        if args.csr:
+            import RecoverKey
+            RecoverKey.LoadCSR (args.csr)
+        ClusterWorker (args.addr, args.name, args.dev).Run ()
+        sys.exit (0)
+
+    prob = None
+    if args.table:
+        from CalcProb import ProbTable
+        prob = ProbTable (path=args.table)
+    coord = Coordinator (args.addr, args.span, args.slots, args.timeout, prob=prob)
+    print ('Listening on {}'.format (coord.addr), flush=True)
+    local = [subprocess.Popen ([sys.executable, os.path.abspath (__file__), 'worker',
+                                '--addr', '127.0.0.1:{}'.format (coord.addr.split (':')[1])])
+             for n in range (args.local)]
+
+    from Crypto1Tool import Values, ParseHex
+    values = list (Values (args.bitstream))
+    jobs = [(v, time.time (), coord.Submit (ParseHex (v), args.len)) for v in values]
+    for v, start, jid in jobs:
+        keys = coord.Wait (jid)
+        print (v, ' '.join ([hex (k) for k in keys]) if keys else 'none',
+               '{:.2f}s'.format (time.time () - start), flush=True)
+    print (json.dumps (coord.Stats ()))
+    for p in local:
+        p.terminate ()
+    coord.Close ()
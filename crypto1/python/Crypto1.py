@@ -4,35 +4,21 @@
 #
 
 from pylfsr import LFSR
+from BitUtil import int2binarr, binarr2int, Reverse8, ReverseBytes, Swap32, \
+    OddParity8
 import struct
 import random
 
 # Helper functions
-def int2binarr (val, length):
-    l = [int(x) for x in list(bin(val)[2:])]
-    pad = [0] * (length - len(l))
-    return pad + l
-
-def binarr2int (arr):
-    return int (''.join([str(x) for x in arr]), 2)
-
 def dump_binarr (arr):
     print (hex (binarr2int (arr)))
-
-def swap32int(x):
-    return int.from_bytes(x.to_bytes(4, byteorder='little'),
-                          byteorder='big', signed=False)
-def swap32binarr (arr):
-    x = binarr2int (arr)
-    y = swap32int (x)
-    return int2binarr (y,32)
     
 # Non-linear filters
 class NLF:
     def __init__(self, fn):
         self.fn = fn
     def compute (self, arr=[]):
-        val = binarr2int (arr)
+        val = arr if isinstance (arr, int) else binarr2int (arr)
         return 1 if ((1 << val) & self.fn) != 0 else 0
 
 # PRNG - AKA regular LFSR
@@ -40,29 +26,25 @@ class PRNG:
     def __init__(self, init):
 
         # Convert possible init types
-        if isinstance (init, int):
-            init = int2binarr (init, 32)
-        elif isinstance (init, str):
-            init = int2binarr (int(init, 0), 32)
+        if isinstance (init, str):
+            init = int(init, 0)
         elif isinstance (init, list):
             for x in init:
                 if not isinstance(x, int) or ((x != 0) and (x != 1)):
                     raise ValueError ('Invalid init format')
-        else:
+            init = binarr2int (init)
+        elif not isinstance (init, int):
             raise ValueError ('Invalid init format')
 
-        # Only 16 bits used to seed the PRNG
-        init = [0] * 16 + init[16:32]
-
-        # Swap bytes
-        init = swap32binarr (init)
+        # Only 16 bits used to seed the PRNG, bytes swapped
+        init = int2binarr (Swap32 (init & 0xFFFF), 32)
         self.lfsr = LFSR (initstate=init,
                           fpoly=[16,14,13,11])
         #self.lfsr.info()
     def Run(self, count):
         for n in range (count):
             self.lfsr.next()
-        return swap32int (binarr2int (self.lfsr.state))
+        return Swap32 (binarr2int (self.lfsr.state))
     
     def GetWord(self):
         return self.Run (32)
@@ -112,21 +94,12 @@ class Crypto1:
     def State (self):
         return self.sr.state[::-1]
     
+    # Bits are reversed within each byte
     def KeyDerive (self, key):
-        nkey = []
-        for n in range (47, -1, -1):
-            nkey.append (key[n ^ 7])
-        return nkey
+        return int2binarr (ReverseBytes (binarr2int (key), 6), 48)[::-1]
 
     def KeyReverse (self):
-        key = self.sr.state
-        nkey = 0
-        idx = 47
-        for b in key[::-1]:
-            if (b):
-                nkey |= (1 << (idx ^ 7))
-            idx -= 1
-        return nkey
+        return ReverseBytes (binarr2int (self.sr.state[::-1]), 6)
 
     def ComputePartial (self):
         # 3 NLFs in two layers
@@ -136,11 +109,6 @@ class Crypto1:
 
         # Calculate layer one
         s = self.sr.state
-        a = nla.compute ([s[0],  s[2],  s[4],  s[6]])
-        b = nlb.compute ([s[8],  s[10], s[12], s[14]])
-        c = nla.compute ([s[16], s[18], s[20], s[22]])
-        d = nla.compute ([s[24], s[26], s[28], s[30]])
-        e = nlb.compute ([s[32], s[34], s[36], s[38]])
         layer1 = [nla.compute ([s[0],  s[2],  s[4],  s[6]]),
                   nlb.compute ([s[8],  s[10], s[12], s[14]]),
                   nla.compute ([s[16], s[18], s[20], s[22]]),
@@ -156,11 +124,6 @@ class Crypto1:
 
         # Calculate layer one
         s = self.sr.state
-        a = nla.compute ([s[0],  s[2],  s[4],  s[6]])
-        b = nlb.compute ([s[8],  s[10], s[12], s[14]])
-        c = nla.compute ([s[16], s[18], s[20], s[22]])
-        d = nla.compute ([s[24], s[26], s[28], s[30]])
-        e = nlb.compute ([s[32], s[34], s[36], s[38]])
         layer1 = [nla.compute ([s[0],  s[2],  s[4],  s[6]]),
                   nlb.compute ([s[8],  s[10], s[12], s[14]]),
                   nla.compute ([s[16], s[18], s[20], s[22]]),
@@ -235,21 +198,17 @@ class Crypto1:
 
     @staticmethod
     def RPermute8 (val):
-        return binarr2int (int2binarr (val, 8)[::-1])
+        return Reverse8 (val)
 
     @staticmethod
     def RPermute32 (val):
-        ret = Crypto1.RPermute8 ((val >> 24) & 0xFF) << 24
-        ret |= Crypto1.RPermute8 ((val >> 16) & 0xFF) << 16
-        ret |= Crypto1.RPermute8 ((val >> 8) & 0xFF) << 8
-        ret |= Crypto1.RPermute8 ((val >> 0) & 0xFF) << 0
-        return ret
+        return ReverseBytes (val, 4)
     
     def GetByte (self, inp=0, encrypt=False):
         ret = []
         inp = [x for x in int2binarr(inp, 8)[::-1]]
         for n in inp:
-            ret.insert (0, self.GetBit(0, n, encrypt))
+            ret.insert (0, self.GetBit (n, encrypt))
         return binarr2int (ret)
 
     def GetWord (self, inp=0, encrypt=False):
@@ -259,3 +218,27 @@ class Crypto1:
         ret |= self.GetByte ((inp >> 8) & 0xFF, encrypt) << 8;
         ret |= self.GetByte ((inp >> 0) & 0xFF, encrypt) << 0;
         return ret
+
+    # Encrypt bytes, returns encrypted bytes and the encrypted parity
+    # bit of each byte. Parity is encrypted with the keystream bit
+    # following the byte. With feed the plaintext is shifted into
+    # the state (reader nonce).
+    def Encrypt (self, data, feed=False):
+        enc = []
+        par = []
+        for x in data:
+            enc.append (x ^ self.GetByte (x if feed else 0))
+            par.append (OddParity8 (x) ^ self.ComputeNLF ())
+        return bytes (enc), par
+
+    # Decrypt bytes and check encrypted parity, returns plaintext
+    # and parity ok for each byte. With feed the plaintext is
+    # shifted into the state (tag side of reader nonce).
+    def Decrypt (self, data, par, feed=False):
+        plain = []
+        ok = []
+        for x, p in zip (data, par):
+            y = x ^ self.GetByte (x if feed else 0, feed)
+            plain.append (y)
+            ok.append (p ^ self.ComputeNLF () == OddParity8 (y))
+        return bytes (plain), ok
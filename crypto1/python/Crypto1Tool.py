@@ -0,0 +1,337 @@
+#!/bin/env python3
+#
+# Single entry point for the crypto1 tools. Subcommands only
+# import what they use so pyserial/pylfsr/numpy are not loaded
+# unless needed. Bitstreams are taken from the command line or
+# one per line (hex) from stdin, so a batch of jobs runs in one
+# process.
+#
+# Usage:
+#  Crypto1Tool.py recover [--dev DEV | --server ADDR] [--cache DB] [--plan] [--table NPZ] [BITSTREAM ...]
+#  Crypto1Tool.py fragments [OFFSET:HEX[/LEN] ...]
+#  Crypto1Tool.py prob [--key KEY] [BITSTREAM ...]
+#  Crypto1Tool.py sample [--table NPZ] N
+#  Crypto1Tool.py rewind [-n 45] [KEY ...]
+#  Crypto1Tool.py bench [--dev DEV] [--count N] [--seed S] [--record LOG]
+#  Crypto1Tool.py serve [--dev DEV] [--cache DB]
+#  Crypto1Tool.py daemon [--addr ADDR] [--dev DEV ...] [--cpu N] [--cache DB]
+#
+# fragments recovers the state at keystream offset 0 from several
+# short pieces of one session (CPU only, the cores need 48
+# contiguous bits). A job is one line of OFFSET:HEX[/LEN] pieces,
+# first bit the MSB and LEN 4 bits per digit if not given.
+#
+# recover --dev DEV --plan searches the 48 bit window of a longer
+# bitstream most likely to hold its state in the board cells
+# (WindowPlan), keys are still reported at the first bit. The CPU
+# searches every cell whatever the window, --plan is ignored.
+#
+# recover --server sends the jobs to a running daemon (KeyServer)
+# instead of opening the board itself.
+#
+# bench --record LOG --seed S saves the board session (and the CSR
+# map of a queue image board to LOG.csr), rerunning with --dev
+# replay:LOG[:SCALE] and the same seed replays it with the
+# recorded (or scaled, 0 for none) board latencies.
+#
+# --profile FILE before the subcommand saves a stage profile.
+#
+# --csr MAP before the subcommand gives the CSR offsets of boards
+# running the queue image, JSON of register name => offset (or
+# [offset, bit] for 1 bit registers) written from the generated
+# crypto1_csr. The shipped image needs none.
+#
+
+import argparse
+import sys
+import time
+
+# Parse hex value, 0x prefix optional
+def ParseHex (s):
+    return int (s, 16)
+
+# Values from command line, else one per line from stdin.
+# Blank lines and '#' comments are skipped.
+def Values (args):
+    if len (args):
+        yield from args
+        return
+    for line in sys.stdin:
+        line = line.split ('#')[0].strip ()
+        if line:
+            yield line
+
+# Recovery backend, FPGA if a device is given else CPU
+class Engine:
+
+    def __init__ (self, dev=None, cache=None, telemetry=False, plan=None, record=None,
+                  table=None):
+        # WindowPlanner picking the window of longer bitstreams for
+        # the board
+        self.plan = plan
+        self.cache = None
+        if cache:
+            from KeyCache import KeyCache
+            self.cache = KeyCache (cache)
+        self.fpga = None
+        if dev:
+            from RecoverKey import FPGACrypto1
+            # table sets the walk order of each job on the board
+            self.fpga = FPGACrypto1 (dev, self.cache, telemetry, record, table)
+        else:
+            from CPUCrypto1 import CPUCrypto1
+            self.cpu = CPUCrypto1 (self.cache)
+
+    # Returns list of states at first bitstream bit
+    def Recover (self, bitstream, length=48):
+        if self.fpga and self.plan and length > 48:
+            from BitUtil import int2binarr
+            return self.plan.Recover (self.Search, int2binarr (bitstream, length))
+        if self.fpga:
+            # Bits past 48 pick the key out of the result FIFO
+            extra = [(n, (bitstream >> (length - 1 - n)) & 1)
+                     for n in range (48, length)]
+            self.fpga.Recover (bitstream >> (length - 48), extra)
+            return self.fpga.keys
+        self.cpu.Recover (bitstream, length)
+        return self.cpu.keys
+
+    # 48 bits and (offset, bit) pairs past them on the board, for
+    # WindowPlanner
+    def Search (self, bits, extra):
+        from BitUtil import binarr2int
+        self.fpga.Recover (binarr2int (bits), extra)
+        return self.fpga.keys
+
+    # Save link telemetry of the board (JSON)
+    def Telemetry (self, path):
+        if path and self.fpga:
+            self.fpga.flex.telemetry.Dump (path)
+
+    # Recover hex values in turn, yields (value, keys). The FPGA
+    # keeps the next bitstream queued so results may come out of
+    # order.
+    def Stream (self, values, length=48):
+        if not self.fpga or (self.plan and length > 48):
+            for v in values:
+                yield v, self.Recover (ParseHex (v), length)
+            return
+        src = {}
+        def Jobs ():
+            for v in values:
+                x = ParseHex (v)
+                bs = x >> (length - 48)
+                src.setdefault (bs, []).append (v)
+                yield bs, [(n, (x >> (length - 1 - n)) & 1) for n in range (48, length)]
+        for bs, key in self.fpga.RecoverStream (Jobs ()):
+            yield src[bs].pop (0), [] if key is None else [key]
+
+def Recover (args):
+    if args.server:
+        from KeyServer import KeyClient
+        values = list (Values (args.bitstream))
+        with KeyClient (args.server) as client:
+            for msg in client.Recover (values, args.len):
+                if msg['event'] == 'error':
+                    print (values[msg['id']], 'error:', msg['error'], flush=True)
+                elif msg['event'] == 'done':
+                    print (values[msg['id']], ' '.join (msg['keys']) or 'none', flush=True)
+        return
+    plan = table = None
+    if args.table and args.dev:
+        from CalcProb import ProbTable
+        table = ProbTable (path=args.table)
+    if args.plan and not args.dev:
+        print ('--plan ignored, the CPU searches all cells', file=sys.stderr)
+    elif args.plan:
+        from WindowPlan import WindowPlanner
+        from RecoverKey import CELLS
+        plan = WindowPlanner (table, cells=CELLS)
+    eng = Engine (args.dev, args.cache, plan=plan, table=table)
+    for v, keys in eng.Stream (Values (args.bitstream), args.len):
+        print (v, ' '.join ([hex (k) for k in keys]) if keys else 'none',
+               flush=True)
+
+# OFFSET:HEX[/LEN] keystream fragment => (offset, bits)
+def ParseFragment (s):
+    off, val = s.split (':')
+    val, _, n = val.partition ('/')
+    n = int (n) if n else 4 * len (val[2:] if val.startswith ('0x') else val)
+    x = ParseHex (val)
+    return int (off), [(x >> (n - 1 - i)) & 1 for i in range (n)]
+
+def Fragments (args):
+    from CPUCrypto1 import CPUCrypto1
+    cpu = CPUCrypto1 ()
+    jobs = [' '.join (args.fragment)] if len (args.fragment) else Values ([])
+    for job in jobs:
+        try:
+            cpu.RecoverFragments ([ParseFragment (f) for f in job.split ()])
+            print (job, ' '.join ([hex (k) for k in cpu.keys]) or 'none', flush=True)
+        except ValueError as e:
+            print (job, 'error:', e, flush=True)
+
+def Prob (args):
+    import CalcProb as cp
+    from BitUtil import int2binarr
+
+    if args.key:
+        key = ParseHex (args.key)
+        eidx, oidx, bs = cp.GetIndex (key)
+        prob = cp.Crypto1Prob (cp.PROB_JSON, bs)
+        print ('Even={} Odd={} Bitstream={}'.format (
+            eidx, oidx, hex (cp.binarr2int (bs))))
+        print ('Solution found at {:.2f}%'.format (
+            prob.index (eidx, oidx) / 255 * 100))
+        return
+
+    # Most likely cells first for each 64 bit bitstream
+    for v in Values (args.bitstream):
+        prob = cp.Crypto1Prob (cp.PROB_JSON, int2binarr (ParseHex (v), 64))
+        cells = ['{},{}'.format (e, o) for _, e, o in prob.search[0:args.top]]
+        print (v, ' '.join (cells), flush=True)
+
+def Sample (args):
+    import CalcProb as cp
+    print ('Average time to solve: {:.2f}%'.format (cp.Sample (args.count)))
+    if args.table:
+        cell, pos = cp.SampleTable (args.count, cp.ProbTable (path=args.table))
+        print ('Trained table: cell {:.2f}%'.format (cell))
+        for half, p in zip (['Even', 'Odd'], pos):
+            print ('{} position: counter {:.2f}% ORDER {:.2f}% exact {:.2f}%'.format (
+                half, *p))
+
+def Rewind (args):
+    import FastCrypto1 as fc
+    for v in Values (args.key):
+        key = ParseHex (v)
+        for n in range (args.n):
+            key = fc.Rollback (key)
+        print (v, hex (key), flush=True)
+
+def Bench (args):
+    import FastCrypto1 as fc
+    from KeyCache import KeyCache
+    import random
+
+    eng = Engine (args.dev, telemetry=args.telemetry is not None, record=args.record)
+    rng = random.Random (args.seed)
+    ok = 0
+    start = time.time ()
+    for n in range (args.count):
+        state = rng.randint (0, 2**48 - 1)
+        bs = KeyCache.Bitstream (state)
+        t = time.time ()
+        keys = eng.Recover (bs)
+        hit = state in keys
+        ok += hit
+        print ('{}: bitstream={} {} {:.2f}s'.format (
+            n, hex (bs), 'OK' if hit else 'MISS', time.time () - t), flush=True)
+    total = time.time () - start
+    print ('{}/{} recovered, {:.2f}s/job'.format (ok, args.count, total / args.count))
+    eng.Telemetry (args.telemetry)
+
+# Line oriented job server on stdin/stdout. One JSON object is
+# written per input line, bad input does not stop the server.
+def Serve (args):
+    import json
+    eng = Engine (args.dev, args.cache)
+    for v in Values ([]):
+        t = time.time ()
+        try:
+            keys = eng.Recover (ParseHex (v), args.len)
+            resp = {'bitstream': v, 'keys': [hex (k) for k in keys]}
+        except ValueError as e:
+            resp = {'bitstream': v, 'error': str (e)}
+        resp['time'] = round (time.time () - t, 3)
+        print (json.dumps (resp), flush=True)
+
+def Daemon (args):
+    import KeyServer as ks
+    ks.Serve (args.addr, ks.KeyService (args.dev, args.cpu, args.cache, args.batch,
+                                        args.telemetry))
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--profile', type=str,
+                         help='Save stage profile (JSON, or .folded for flamegraph)')
+    parser.add_argument ('--csr', type=str,
+                         help='CSR map of queue image boards (JSON from the generated crypto1_csr)')
+    sub = parser.add_subparsers (dest='cmd', required=True)
+
+    p = sub.add_parser ('recover', help='Recover keys from bitstreams')
+    p.add_argument ('bitstream', type=str, nargs='*',
+                    help='Bitstreams in hex, read from stdin if none')
+    p.add_argument ('--len', type=int, default=48,
+                    help='Bitstream length, bits past 48 are verified')
+    p.add_argument ('--dev', type=str, help='FPGA serial device, CPU if not given')
+    p.add_argument ('--server', type=str, help='Send jobs to a key daemon (socket or port)')
+    p.add_argument ('--cache', type=str, help='Key cache file')
+    p.add_argument ('--plan', action='store_true',
+                    help='Search the 48 bit window of longer bitstreams best for the board')
+    p.add_argument ('--table', type=str,
+                    help='CalcProb trained table for --plan (crypto1_prob.json if not given) '
+                    'and the board walk order (counts up if not given)')
+    p.set_defaults (func=Recover)
+
+    p = sub.add_parser ('fragments', help='Recover keys from short keystream fragments')
+    p.add_argument ('fragment', type=str, nargs='*',
+                    help='One job of OFFSET:HEX[/LEN] fragments, jobs read from stdin if none')
+    p.set_defaults (func=Fragments)
+
+    p = sub.add_parser ('prob', help='Cell search order from probability table')
+    p.add_argument ('bitstream', type=str, nargs='*',
+                    help='64 bit bitstreams in hex, read from stdin if none')
+    p.add_argument ('--key', type=str, help='Show cell and position of key')
+    p.add_argument ('--top', type=int, default=20, help='Number of cells to show')
+    p.set_defaults (func=Prob)
+
+    p = sub.add_parser ('sample', help='Average time to solve over random keys')
+    p.add_argument ('count', type=int, help='Number of random keys')
+    p.add_argument ('--table', type=str, help='Also sample a trained CalcProb table')
+    p.set_defaults (func=Sample)
+
+    p = sub.add_parser ('rewind', help='Rewind FPGA keys')
+    p.add_argument ('key', type=str, nargs='*', help='Keys in hex, read from stdin if none')
+    p.add_argument ('-n', type=int, default=45, help='Cycles to rewind')
+    p.set_defaults (func=Rewind)
+
+    p = sub.add_parser ('bench', help='Recover random keys and time them')
+    p.add_argument ('--count', type=int, default=10, help='Number of jobs')
+    p.add_argument ('--dev', type=str, help='FPGA serial device, CPU if not given')
+    p.add_argument ('--telemetry', type=str, help='Save board link telemetry (JSON)')
+    p.add_argument ('--record', type=str, help='Record board transactions to log')
+    p.add_argument ('--seed', type=int,
+                    help='Random seed, same jobs as a recorded run for --dev replay:LOG')
+    p.set_defaults (func=Bench)
+
+    p = sub.add_parser ('serve', help='Answer bitstreams on stdin as JSON lines')
+    p.add_argument ('--len', type=int, default=48, help='Bitstream length')
+    p.add_argument ('--dev', type=str, help='FPGA serial device, CPU if not given')
+    p.add_argument ('--cache', type=str, help='Key cache file')
+    p.set_defaults (func=Serve)
+
+    p = sub.add_parser ('daemon', help='Key recovery service owning the boards')
+    p.add_argument ('--addr', type=str, default='/tmp/crypto1.sock',
+                    help='Unix socket path or [host:]port')
+    p.add_argument ('--dev', type=str, action='append', default=[],
+                    help='Board serial device (or emu[:DELAY]), repeat for more boards')
+    p.add_argument ('--cpu', type=int, help='CPU workers, default 1 without boards else 0')
+    p.add_argument ('--cache', type=str, help='Key cache file')
+    p.add_argument ('--batch', type=int, default=16, help='Max jobs a board takes at once')
+    p.add_argument ('--telemetry', action='store_true',
+                    help='Report board link telemetry in stats')
+    p.set_defaults (func=Daemon)
+
+    args = parser.parse_args ()
+
+    # Engines are imported lazily, instrument them once loaded
+    if args.profile:
+        import FastCrypto1
+        import Profile
+        Profile.Enable (args.profile)
+    if args.csr:
+        import RecoverKey
+        RecoverKey.LoadCSR (args.csr)
+    args.func (args)
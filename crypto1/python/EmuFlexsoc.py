@@ -0,0 +1,270 @@
+#!/bin/env python3
+#
+# Emulated board behind the Flexsoc access functions. The CSR map
+# of RecoverKey (Crypto1Attack on arty) is modelled on top of the
+# CPU engine so FPGACrypto1 and everything driving it can run
+# without a board attached:
+#
+#  FPGACrypto1 ('emu')        # or 'emu:DELAY' seconds per job
+#
+# EmuSerial puts the wire protocol in front of it so the Flexsoc
+# driver itself (and its recorder) runs against the model.
+#
+
+from CPUCrypto1 import CPUCrypto1
+import FastCrypto1 as fc
+import RecoverKey as rk
+import Flexsoc as flex
+from collections import deque
+from struct import unpack
+import threading
+import time
+
+# CSR map of the emulated queue image. The board's map comes
+# from the generator, the model only needs one of its own.
+EMU_CSR = {
+    'id'           : 0x0,
+    'key_lo'       : 0x4,
+    'key_hi'       : 0xC,
+    'done'         : (0xE, 0),
+    'valid'        : (0xE, 1),
+    'queued'       : (0xE, 2),
+    'lost'         : (0xE, 3),
+    'key_cnt'      : 0xF,
+    'bitstream_lo' : 0x10,
+    'bitstream_hi' : 0x14,
+    'start'        : 0x18,
+    'key_pop'      : 0x19,
+    'queue'        : 0x1A,
+    'skip'         : 0x1B,
+    'key_job'      : 0x1C,
+    'job'          : 0x1D,
+    'last_job'     : 0x1E,
+    'order'        : 0x1F,
+    'next_lo'      : 0x20,
+    'next_hi'      : 0x24,
+}
+for n in range (8):
+    EMU_CSR['eorder_{}'.format (n)] = 0x28 + 4 * n
+    EMU_CSR['oorder_{}'.format (n)] = 0x48 + 4 * n
+
+class EmuFlexsoc:
+    '''
+    Register model of Crypto1Attack: start resets and starts the
+    first job, queue/skip/key_pop act on the rising edge, job and
+    last_job count jobs, every key of the cells instantiated on the
+    FPGA is queued with its job number once the job has run for
+    delay seconds. Keys are reported 45 cycles into the bitstream
+    like the cores. Thread safe, access errors raise
+    Flexsoc.AccessError like a board answering with an error
+    response. shipped models the shipped image: only its registers
+    are mapped and a job stops at the first key. csr is the
+    register map FPGACrypto1 picks up.
+    '''
+    def __init__ (self, delay=0.0, cells=rk.CELLS, shipped=False):
+        self.delay = delay
+        self.shipped = shipped
+        self.csr = rk.SHIPPED_CSR if shipped else EMU_CSR
+        # Offset => [(register, bit)]
+        self.addr = {}
+        for name, off in self.csr.items ():
+            off, bit = off if isinstance (off, tuple) else (off, 0)
+            self.addr.setdefault (off, []).append ((name, bit))
+        self.cpu = CPUCrypto1 (cells=cells)
+        self.lock = threading.Lock ()
+        self.regs = {}
+        self.edge = {}
+        self.Reset ()
+        self.running = False
+        self.telemetry = None
+
+    # Context manager
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, type, value, traceback):
+        self.Close ()
+
+    def Close (self):
+        pass
+
+    def Reset (self):
+        self.running = True
+        self.done = False
+        self.queued = False
+        self.job = 0
+        self.last = 0xFF
+        self.fifo = deque ()
+        self.cur = self.Bitstream ('bitstream_lo', 'bitstream_hi')
+        self.start = time.time ()
+
+    def Bitstream (self, lo, hi):
+        return self.regs.get (lo, 0) | (self.regs.get (hi, 0) << 32)
+
+    # Keys of a bitstream as reported by the cores
+    def Keys (self, bitstream):
+        self.cpu.Recover (bitstream)
+        ret = []
+        for key in self.cpu.keys:
+            for n in range (45):
+                _, key = fc.Step (key)
+            ret.append (key)
+        return ret
+
+    # Swap in the queued job
+    def Swap (self):
+        self.last = self.job
+        self.cur = self.Bitstream ('next_lo', 'next_hi')
+        self.queued = False
+        self.job = (self.job + 1) & 0xFF
+        self.done = False
+        self.start = time.time ()
+
+    # Advance the model to now
+    def Update (self):
+        if not self.running:
+            return
+        if not self.done and time.time () - self.start >= self.delay:
+            keys = self.Keys (self.cur)
+            for key in keys[0:1] if self.shipped else keys:
+                self.fifo.append ((self.job, key))
+            self.done = True
+            self.last = self.job
+        if self.done and self.queued:
+            self.Swap ()
+
+    # Rising edge of a strobe register
+    def Rising (self, name, val):
+        prev = self.edge.get (name, 0)
+        self.edge[name] = val
+        return val and not prev
+
+    # Registers at addr, access error if none
+    def Regs (self, addr, access):
+        if addr not in self.addr:
+            raise flex.AccessError ('Access error: {} {}'.format (access, hex (addr)))
+        return self.addr[addr]
+
+    def Write (self, addr, val):
+        with self.lock:
+            self.Update ()
+            for name, bit in self.Regs (addr, 'write'):
+                self.WriteReg (name, (val >> bit) & ((1 << rk.WIDTH[name]) - 1))
+
+    def WriteReg (self, name, val):
+        if name in ('bitstream_lo', 'bitstream_hi', 'next_lo', 'next_hi', 'order') or \
+           name[1:6] == 'order':
+            # Walk order does not change the keys found
+            self.regs[name] = val
+        elif name == 'start':
+            if val:
+                if self.Rising (name, val):
+                    self.Reset ()
+            else:
+                self.edge[name] = 0
+                self.running = False
+        elif name == 'queue':
+            if self.Rising (name, val):
+                self.queued = True
+        elif name == 'skip':
+            if self.Rising (name, val) and self.queued:
+                self.Swap ()
+        elif name == 'key_pop':
+            if self.Rising (name, val) and len (self.fifo):
+                self.fifo.popleft ()
+        else:
+            raise flex.AccessError ('Access error: write {}'.format (name))
+
+    def Read (self, addr):
+        with self.lock:
+            self.Update ()
+            val = 0
+            for name, bit in self.Regs (addr, 'read'):
+                val |= self.ReadReg (name) << bit
+            return val
+
+    def ReadReg (self, name):
+        job, key = self.fifo[0] if len (self.fifo) else (0, 0)
+        if name == 'id':
+            return rk.ID_SHIPPED if self.shipped else rk.ID_QUEUE
+        elif name == 'done':
+            return int (self.running and self.done)
+        elif name == 'valid':
+            return int (len (self.fifo) > 0)
+        elif name == 'queued':
+            return int (self.queued)
+        elif name == 'lost':
+            return 0
+        elif name == 'key_cnt':
+            return min (len (self.fifo), 0xFF)
+        elif name == 'key_lo':
+            return key & 0xFFFFFFFF
+        elif name == 'key_hi':
+            return key >> 32
+        elif name == 'key_job':
+            return job
+        elif name == 'job':
+            return self.job
+        elif name == 'last_job':
+            return self.last
+        elif name in self.regs:
+            return self.regs[name]
+        raise flex.AccessError ('Access error: read {}'.format (name))
+
+    # Memory access functions
+    def WriteWord (self, addr, val):
+        self.Write (addr, val & 0xFFFFFFFF)
+
+    def WriteHalf (self, addr, val):
+        self.Write (addr, val & 0xFFFF)
+
+    def WriteByte (self, addr, val):
+        self.Write (addr, val & 0xFF)
+
+    def ReadWord (self, addr):
+        return self.Read (addr) & 0xFFFFFFFF
+
+    def ReadHalf (self, addr):
+        return self.Read (addr) & 0xFFFF
+
+    def ReadByte (self, addr):
+        return self.Read (addr) & 0xFF
+
+class EmuSerial:
+    '''
+    Serial side of an EmuFlexsoc: requests written are decoded and
+    run on the model, their response bytes queued for read. Access
+    errors answer 0x81 like the board.
+    '''
+    def __init__ (self, emu):
+        self.emu = emu
+        self.resp = bytearray ()
+
+    def write (self, data):
+        ctl = data[0]
+        addr = unpack ('>I', data[1:5])[0]
+        size = 1 << (ctl & 3)
+        try:
+            if ctl & 0x8:
+                self.emu.Write (addr, int.from_bytes (data[5:5+size], 'big'))
+                self.resp += bytes ([0x80])
+            else:
+                val = self.emu.Read (addr) & ((1 << (8 * size)) - 1)
+                self.resp += bytes ([0x80]) + val.to_bytes (size, 'big')
+        except flex.AccessError:
+            self.resp += bytes ([0x81]) + bytes (0 if ctl & 0x8 else size)
+        return len (data)
+
+    def read (self, n):
+        data = bytes (self.resp[0:n])
+        del self.resp[0:n]
+        return data
+
+    def flushInput (self):
+        self.resp = bytearray ()
+
+    def flushOutput (self):
+        pass
+
+    def close (self):
+        self.emu.Close ()
@@ -0,0 +1,406 @@
+#!/bin/env python3
+#
+# Integer and numpy based Crypto1 primitives for the CPU attacks
+#
+# States use the same convention as Crypto1 (state=x): bit n of
+# the 48 bit integer is sr.state[n], the filter taps the even bits
+# 0-38 and new bits are shifted in at bit 0.
+#
+
+from BitUtil import Parity, OddParity8, Compress, Spread, Split, Merge, \
+    Reverse8, ReverseBytes, Swap32
+import Bitslice as bs
+import numpy as np
+
+# LFSR feedback taps (bit positions in state)
+TAPS = [47, 42, 38, 37, 35, 33, 32, 30, 28, 23, 22, 20, 18, 12, 8, 6, 5, 4]
+TAPMASK = sum ([1 << n for n in TAPS])
+MASK48 = (1 << 48) - 1
+
+# Non-linear filter functions
+NLA = 0x9E98
+NLB = 0xB48E
+NLC = 0xEC57E80A
+
+# Feedback distance between a new bit and the bits it depends on
+DIST = [n + 1 for n in TAPS]
+
+# Filter input nibble is state[0,2,4,6] with state[0] as MSB
+FA4 = np.array ([(NLA >> (Reverse8 (n) >> 4)) & 1 for n in range (16)], dtype=np.uint32)
+FB4 = np.array ([(NLB >> (Reverse8 (n) >> 4)) & 1 for n in range (16)], dtype=np.uint32)
+
+# First layer outputs (NLC input) and filter output for the 20
+# even state bits, state[0] in bit 0
+def _gen_sel20 ():
+    x = np.arange (1 << 20, dtype=np.uint32)
+    sel = (FA4[x & 15] << 4) | (FB4[(x >> 4) & 15] << 3) | \
+        (FA4[(x >> 8) & 15] << 2) | (FA4[(x >> 12) & 15] << 1) | \
+        FB4[(x >> 16) & 15]
+    return sel.astype (np.uint8)
+SEL20 = _gen_sel20 ()
+F20 = ((np.uint32 (NLC) >> SEL20) & 1).astype (np.uint8)
+F20B = F20.tobytes ()
+
+# Cell index (EIDX/OIDX) of an NLC input, its rank among the
+# inputs giving the same output as in Enumerator
+CELL5 = np.zeros (32, dtype=np.uint8)
+for _b in range (2):
+    for _n, _v in enumerate ([v for v in range (32) if ((NLC >> v) & 1) == _b]):
+        CELL5[_v] = _n
+
+# Filter nibbles giving 0/1 in B20Enum order for each nibble of a
+# 20 bit half (Fa Fb Fa Fa Fb from bit 0). B20Enum counter bits
+# [3g+2:3g] index nibble g, the 3 bit sub-index.
+B20_FA = [[7, 11, 1, 6, 10, 4, 8, 0], [15, 3, 13, 5, 9, 14, 2, 12]]
+B20_FB = [[7, 13, 9, 1, 6, 10, 2, 0], [15, 11, 3, 5, 14, 12, 4, 8]]
+B20 = np.array ([B20_FA, B20_FB, B20_FA, B20_FA, B20_FB], dtype=np.uint32)
+
+# Nibble => sub-index for each nibble position
+SUB4 = np.zeros ((5, 16), dtype=np.uint32)
+for _g in range (5):
+    for _l in B20[_g]:
+        for _n, _v in enumerate (_l):
+            SUB4[_g, _v] = _n
+
+# B20Enum counter of 20 bit halves
+def SubIndex (h):
+    ctr = 0
+    for g in range (5):
+        ctr = ctr | (SUB4[g][(h >> (4 * g)) & 15] << (3 * g))
+    return ctr
+
+# 20 bit halves for B20Enum counters given the NLC input sel
+def Key20 (sel, ctr):
+    h = 0
+    for g in range (5):
+        h = h | (B20[g, (sel >> (4 - g)) & 1, (ctr >> (3 * g)) & 7] << (4 * g))
+    return h
+
+# Key <=> initial state (bits reversed within each byte)
+def KeyToState (key):
+    return ReverseBytes (key, 6)
+
+StateToKey = KeyToState
+
+def Filter (x):
+    return F20B[Compress (x) & 0xFFFFF]
+
+# Single cycle, returns output bit and next state
+def Step (x, inp=0, encrypt=False):
+    b = Filter (x)
+    fb = Parity (x & TAPMASK) ^ inp
+    if encrypt:
+        fb ^= b
+    return b, ((x << 1) | fb) & MASK48
+
+# Undo a single cycle
+def Rollback (x, inp=0, encrypt=False):
+    fb = x & 1
+    x >>= 1
+    fb ^= Parity (x & TAPMASK) ^ inp
+    if encrypt:
+        fb ^= Filter (x)
+    return x | (fb << 47)
+
+# Word i/o follows the air interface: bytes MSB first, bits LSB first
+def WordBits (x):
+    return [(x >> (n ^ 24)) & 1 for n in range (32)]
+
+def BitsWord (bits):
+    x = 0
+    for n, b in enumerate (bits):
+        x |= b << (n ^ 24)
+    return x
+
+def Word (x, inp=0, encrypt=False):
+    ks = 0
+    for n in range (32):
+        b, x = Step (x, (inp >> (n ^ 24)) & 1, encrypt)
+        ks |= b << (n ^ 24)
+    return ks, x
+
+def RollbackWord (x, inp=0, encrypt=False):
+    for n in range (31, -1, -1):
+        x = Rollback (x, (inp >> (n ^ 24)) & 1, encrypt)
+    return x
+
+# Tag PRNG, same sequence as Crypto1.PRNG
+def PrngSuccessor (x, n):
+    x = Swap32 (x)
+    for _ in range (n):
+        x = (x >> 1) | (((x >> 16) ^ (x >> 18) ^ (x >> 19) ^ (x >> 21)) & 1) << 31
+    return Swap32 (x)
+
+# Vectorized versions over uint64 arrays of states
+VParity = Parity
+
+def VFilter (x):
+    return F20[Compress (x) & 0xFFFFF]
+
+def VStep (x, inp=0):
+    b = VFilter (x)
+    fb = VParity (x & TAPMASK) ^ inp
+    return b, ((x << 1) | fb) & MASK48
+
+def VRollback (x, inp=0):
+    fb = x & 1
+    x = x >> 1
+    return x | ((fb ^ VParity (x & TAPMASK) ^ inp) << 47)
+
+# 32 cycles of each state feeding the matching inp word, same bit
+# order as Word. Returns keystream words and the new states.
+def VWord (x, inp=0, encrypt=False):
+    inp = np.asarray (inp, dtype=np.uint64)
+    ks = np.zeros (len (x), dtype=np.uint64)
+    for n in range (32):
+        b = VFilter (x).astype (np.uint64)
+        fb = VParity (x & TAPMASK) ^ ((inp >> (n ^ 24)) & 1)
+        if encrypt:
+            fb ^= b
+        x = ((x << 1) | fb) & MASK48
+        ks |= b << (n ^ 24)
+    return ks, x
+
+# Bitsliced states (Bitslice.py), plane n holds state bit n of 64
+# states per uint64 word
+def Slice (x):
+    bits = ((x[None, :] >> np.arange (48, dtype=np.uint64)[:, None]) & 1).astype (np.uint8)
+    bits = np.pad (bits, ((0, 0), (0, -len (x) % 64)))
+    return list (np.packbits (bits, axis=1, bitorder='little').view (np.uint64))
+
+# Lanes of a plane as uint8 array of n bits
+def Unslice (plane, n):
+    return np.unpackbits (plane.view (np.uint8), bitorder='little')[0:n]
+
+def SFilter (p):
+    return bs.NLFC (bs.NLFA (p[0], p[2], p[4], p[6]),
+                    bs.NLFB (p[8], p[10], p[12], p[14]),
+                    bs.NLFA (p[16], p[18], p[20], p[22]),
+                    bs.NLFA (p[24], p[26], p[28], p[30]),
+                    bs.NLFB (p[32], p[34], p[36], p[38]))
+
+# Single cycle on planes, the shift is a list rotation
+def SStep (p, inp=0):
+    fb = p[TAPS[0]] ^ inp
+    for n in TAPS[1:]:
+        fb = fb ^ p[n]
+    return SFilter (p), [fb] + p[0:47]
+
+# Extend subkeys by one bit, keeping those matching the next output bit
+def Extend (keys, bit):
+    keys = keys << 1
+    i = keys & 0xFFFFF
+    return np.concatenate ((keys[F20[i] == bit], keys[F20[i | 1] == bit] | 1))
+
+# (EIDX, OIDX) cell searched by Crypto1Attack for a state at the
+# first bitstream bit, from the filter input of the first two cycles
+def Cell (x):
+    x1 = ((x << 1) | Parity (x & TAPMASK)) & MASK48
+    return CELL5[SEL20[Compress (x) & 0xFFFFF]], CELL5[SEL20[Compress (x1) & 0xFFFFF]]
+
+# Cell index of every 20 bit half
+CELL20 = CELL5[SEL20]
+
+# All subkeys of a half state matching every other output bit.
+# Bit 0 is the newest bit, bit 2n the one n half-cycles older.
+# Given cell indices only halves starting in those cells are
+# extended.
+def SubkeyTable (bits, cells=None):
+    match = F20 == bits[0]
+    if cells is not None:
+        match &= np.isin (CELL20, list (cells))
+    keys = np.nonzero (match)[0].astype (np.uint64)
+    for b in bits[1:]:
+        keys = Extend (keys, b)
+    return keys
+
+# Parity contribution of each half to the feedback constraints
+def _contrib (keys, last, first, n_range):
+    ret = np.zeros (len (keys), dtype=np.uint64)
+    for j, n in enumerate (n_range):
+        mask = 0
+        for i in [n] + [n - d for d in DIST]:
+            if (i & 1) == (last & 1) and first <= i <= last:
+                mask |= 1 << ((last - i) >> 1)
+        ret |= VParity (keys & mask) << j
+    return ret
+
+# Move sparse known bits directly following ks into ks, returns
+# contiguous bits and sorted remaining (offset, bit) pairs
+def Contiguous (ks, extra=None):
+    ks = list (ks)
+    extra = dict (extra or [])
+    while len (ks) in extra:
+        ks.append (extra.pop (len (ks)))
+    return ks, sorted (extra.items ())
+
+# Sort merge, returns index pairs (ei, oi) with ekey[ei] == okey[oi].
+# order is the argsort of ekey if already known.
+def Join (ekey, okey, order=None):
+    if order is None:
+        order = np.argsort (ekey, kind='stable')
+    ekey = ekey[order]
+    lo = np.searchsorted (ekey, okey, 'left')
+    hi = np.searchsorted (ekey, okey, 'right')
+    cnt = hi - lo
+    total = int (cnt.sum ())
+    oi = np.repeat (np.arange (len (okey)), cnt)
+    start = np.repeat (lo - (np.cumsum (cnt) - cnt), cnt)
+    ei = order[start + np.arange (total)]
+    return ei, oi
+
+# Survivor count of each cell index after ext extensions of the
+# even (half 0) or odd subkeys, ext=4 gives the 24 bit subkeys of
+# GenSubkey
+def Survivors (bits, half, ext=4):
+    keys = SubkeyTable (bits[half::2][0:ext+1])
+    return np.bincount (CELL20[(keys >> np.uint64 (ext)).astype (np.int64)], minlength=16)
+
+# Subkey table of one half (0 even, 1 odd) at its last cycle for
+# the first 48 bits of ks and its feedback contribution key, the
+# odd key includes inp
+def HalfTable (ks, half, cells=None, inp=None):
+    N = len (ks)
+    keys = SubkeyTable (ks[half::2], cells)
+    last = 2 * (len (ks[half::2]) - 1) + half
+    key = _contrib (keys, last, half - 38, range (10, N))
+    if half and inp:
+        for j, n in enumerate (range (10, N)):
+            if n - 1 < len (inp) and inp[n - 1]:
+                key ^= np.uint64 (1 << j)
+    return keys, key
+
+# Joined even and odd subkeys to states at cycle 0. full holds the
+# contiguous bits, extra the remaining (offset, bit) pairs.
+def Combine (full, inp, extra, even, odd, cells=None):
+    N = min (len (full), 48)
+    inp = list (inp or []) + [0] * N
+    if 2 * ((N + 1) // 2 - 1) > 2 * (N // 2 - 1) + 1:
+        x = Merge (even, odd)
+    else:
+        x = Merge (odd, even)
+    x = Verify (x, full[N-1:], inp[N-1:], [(n - N + 1, b) for n, b in extra])
+    for n in range (N - 2, -1, -1):
+        x = VRollback (x, inp[n])
+    if cells is not None and len (x):
+        eidx, oidx = Cell (x)
+        x = x[np.isin (eidx.astype (np.int64) * 16 + oidx, [e * 16 + o for e, o in cells])]
+    return x
+
+def RecoverStates (ks, inp=None, extra=None, cells=None):
+    '''
+    Recover all states producing keystream bits ks[0:] while
+    feeding inp[n] on each cycle. Even and odd subkey tables are
+    built separately then sort merged on their contribution to
+    the LFSR feedback. Returns uint64 array of starting states.
+    Bits past the first 48 and the sparse (offset, bit) pairs in
+    extra (e.g. from encrypted parity) filter the candidates
+    before they are rolled back. Given a list of (EIDX, OIDX)
+    cells only states in those cells are searched, the tables
+    start from the cells' halves so the work shrinks with them.
+    '''
+    full, extra = Contiguous (ks, extra)
+    ks = full[0:48]
+    if len (ks) < 10:
+        raise ValueError ('At least 10 keystream bits required')
+
+    # Half states at the last even/odd cycle, bit n of the sequence
+    # depends on bit n - d for d in DIST, all within the table
+    # windows for n in 10..N-1
+    ecells = ocells = None
+    if cells is not None:
+        ecells = set ([e for e, o in cells])
+        ocells = set ([o for e, o in cells])
+    even, ekey = HalfTable (ks, 0, ecells)
+    odd, okey = HalfTable (ks, 1, ocells, inp)
+    ei, oi = Join (ekey, okey)
+
+    # Combine into state at cycle N-1, check remaining known bits
+    # then roll the survivors back to cycle 0
+    return Combine (full, inp, extra, even[ei], odd[oi], cells)
+
+# Keep states producing keystream bits ks and the sparse (offset,
+# bit) pairs in extra while feeding inp
+def Verify (x, ks, inp=None, extra=None):
+    known = dict (extra or [])
+    known.update (enumerate (ks))
+    inp = inp or []
+    s = x
+    for n in range (max (known) + 1 if len (known) else 0):
+        if n in known:
+            keep = VFilter (s) == known[n]
+            x = x[keep]
+            s = s[keep]
+        s = VStep (s, inp[n] if n < len (inp) else 0)[1]
+    return x
+
+# Without input the LFSR is linear, n cycles (back if negative)
+# are a GF(2) matrix applied as six byte tables XORed together
+_JUMP = {}
+
+def JumpTable (n):
+    if n not in _JUMP:
+        basis = np.uint64 (1) << np.arange (48, dtype=np.uint64)
+        for _ in range (abs (n)):
+            basis = VStep (basis)[1] if n > 0 else VRollback (basis)
+        tab = np.zeros ((6, 256), dtype=np.uint64)
+        for v in range (1, 256):
+            low = (v & -v).bit_length () - 1
+            tab[:, v] = tab[:, v & (v - 1)] ^ basis[low::8]
+        _JUMP[n] = tab
+    return _JUMP[n]
+
+def Jump (x, n):
+    tab = JumpTable (n)
+    ret = tab[0][x & 0xFF]
+    for b in range (1, 6):
+        ret ^= tab[b][(x >> np.uint64 (8 * b)) & 0xFF]
+    return ret
+
+# Sorted (offset, bits) fragments with overlapping and adjacent
+# ones joined, ValueError if known bits disagree
+def Fragments (frags):
+    ret = []
+    for off, bits in sorted ([(o, list (b)) for o, b in frags]):
+        if len (ret) and off <= ret[-1][0] + len (ret[-1][1]):
+            last = ret[-1][1]
+            pos = off - ret[-1][0]
+            if last[pos:pos + len (bits)] != bits[0:len (last) - pos]:
+                raise ValueError ('Fragments disagree at offset {}'.format (off))
+            last += bits[len (last) - pos:]
+        elif len (bits):
+            ret.append ((off, bits))
+    return ret
+
+def RecoverFragments (frags, cells=None):
+    '''
+    Recover states from keystream fragments given as (offset,
+    bits) pairs, e.g. several 24-40 bit pieces of one session.
+    Candidates come from RecoverStates on the longest fragment
+    (2^(48-n) of them for n bits), are jumped to the offset of
+    each other fragment, longest first, and dropped on their
+    first wrong bit. Under 30 bits the candidates are made one
+    even cell at a time to bound memory. Returns uint64 array of
+    states at offset 0.
+    '''
+    frags = sorted (Fragments (frags), key=lambda f: -len (f[1]))
+    if len (frags) == 0:
+        raise ValueError ('No keystream bits')
+    off, bits = frags[0]
+    cells = list (cells or [(e, o) for e in range (16) for o in range (16)])
+    groups = [cells]
+    if len (bits) < 30:
+        groups = [[c for c in cells if c[0] == e] for e in sorted (set ([e for e, o in cells]))]
+    ret = []
+    for group in groups:
+        x = RecoverStates (bits, cells=group if len (group) < 256 else None)
+        for o, b in frags[1:]:
+            if len (x) == 0:
+                break
+            s = Jump (x, o - off)
+            for bit in b:
+                keep = VFilter (s) == bit
+                x = x[keep]
+                s = VStep (s[keep])[1]
+        ret.append (x)
+    return Jump (np.concatenate (ret), -off)
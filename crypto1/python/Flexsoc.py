@@ -2,25 +2,282 @@
 #
 # Flexsoc python interface
 #
+# Telemetry (latency histograms per access type, bytes and
+# transactions per second, error counters) is off by default. When
+# enabled the access functions of the instance are wrapped, so a
+# disabled link runs the plain functions.
+#
+# record=PATH logs every transaction (request and response bytes,
+# start time and latency) to a compact binary log. Replay serves
+# such a log back through the same driver code with the recorded
+# or scaled latencies, so driver changes can be benchmarked
+# deterministically without a board:
+#
+#  Flexsoc (ReplaySerial ('session.log', scale=0))
+#  FPGACrypto1 ('replay:session.log[:SCALE]')
+#
+# Flexsoc.py --dump LOG prints a log one transaction per line.
+#
 
 import serial
+import argparse
+import json
 import time
-from struct import pack, unpack
+from struct import pack, unpack, unpack_from, calcsize
+
+# Access function => (type, bytes sent, bytes received)
+OPS = {
+    'ReadByte'  : ('rb', 5, 2),
+    'ReadHalf'  : ('rh', 5, 3),
+    'ReadWord'  : ('rw', 5, 5),
+    'WriteByte' : ('wb', 6, 1),
+    'WriteHalf' : ('wh', 7, 1),
+    'WriteWord' : ('ww', 9, 1),
+}
+
+class FlexsocError (IOError):
+    pass
+
+# Bus error, bit 0 of the response byte
+class AccessError (FlexsocError):
+    pass
+
+class InvalidResponse (FlexsocError):
+    pass
+
+# Fewer bytes than expected before the serial timeout
+class ReadTimeout (FlexsocError):
+    pass
+
+# Log header, then per transaction LOG_REC (start and latency in
+# us, request and response lengths) and the bytes. The start is 64
+# bit, 32 bits of us wrap after 71 minutes.
+LOG_MAGIC = b'FSLOG2\n'
+LOG_REC = '<QIBB'
+
+# Serial read timeout (s) when telemetry is on and none is given,
+# a link that stops answering is counted instead of blocking
+TIMEOUT = 1.0
+
+def ReadLog (path):
+    with open (path, 'rb') as fp:
+        data = fp.read ()
+    if not data.startswith (LOG_MAGIC):
+        raise ValueError ('Not a Flexsoc log: {}'.format (path))
+    pos = len (LOG_MAGIC)
+    hdr = calcsize (LOG_REC)
+    while pos + hdr <= len (data):
+        t, dt, nout, nin = unpack_from (LOG_REC, data, pos)
+        pos += hdr
+        yield t, dt, data[pos:pos+nout], data[pos+nout:pos+nout+nin]
+        pos += nout + nin
+
+class RecordSerial:
+    '''
+    Serial proxy logging each transaction: a write starts one and
+    the reads up to the next write are its response.
+    '''
+    def __init__ (self, ser, path):
+        self.ser = ser
+        self.fp = open (path, 'wb')
+        self.fp.write (LOG_MAGIC)
+        self.start = time.perf_counter ()
+        self.out = None
+
+    def Flush (self):
+        if self.out is not None:
+            t = int ((self.t0 - self.start) * 1e6)
+            dt = int ((self.t1 - self.t0) * 1e6)
+            self.fp.write (pack (LOG_REC, t, dt, len (self.out), len (self.inp)) +
+                           self.out + self.inp)
+            self.out = None
+
+    def write (self, data):
+        self.Flush ()
+        self.t0 = self.t1 = time.perf_counter ()
+        self.out = bytes (data)
+        self.inp = b''
+        return self.ser.write (data)
+
+    def read (self, n):
+        data = self.ser.read (n)
+        self.inp += data
+        self.t1 = time.perf_counter ()
+        return data
+
+    def close (self):
+        self.Flush ()
+        self.fp.close ()
+        self.ser.close ()
+
+    def __getattr__ (self, name):
+        return getattr (self.ser, name)
+
+class ReplaySerial:
+    '''
+    Serves a recorded log back. Each write must match the next
+    recorded request, its response is readable once the recorded
+    latency times scale has passed (0 replays at full speed).
+    '''
+    def __init__ (self, path, scale=1.0):
+        self.log = list (ReadLog (path))
+        self.scale = scale
+        self.pos = 0
+        self.inp = b''
+        self.ready = 0
+
+    def write (self, data):
+        if self.pos >= len (self.log):
+            raise FlexsocError ('Replay log exhausted after {} transactions'.format (self.pos))
+        t, dt, out, inp = self.log[self.pos]
+        if bytes (data) != out:
+            raise FlexsocError ('Replay diverged at transaction {}: sent {} recorded {}'.format (
+                self.pos, bytes (data).hex (), out.hex ()))
+        self.pos += 1
+        self.inp = inp
+        self.ready = time.perf_counter () + dt * self.scale / 1e6
+        return len (data)
+
+    def read (self, n):
+        wait = self.ready - time.perf_counter ()
+        if wait > 0:
+            time.sleep (wait)
+        data = self.inp[0:n]
+        self.inp = self.inp[n:]
+        return data
+
+    def flushInput (self):
+        pass
+
+    def flushOutput (self):
+        pass
+
+    def close (self):
+        pass
+
+class Telemetry:
+    '''
+    Counters of a Flexsoc link. Latencies are kept per access type
+    in log2 microsecond buckets (bucket n holds < 2^n us). Json
+    returns a snapshot at any time, Dump writes it to a file.
+    Attach works on any object with the access functions (e.g.
+    EmuFlexsoc).
+    '''
+    BUCKETS = 24
+
+    def __init__ (self):
+        self.Reset ()
+
+    def Reset (self):
+        self.start = time.time ()
+        # type => [count, total ns, min ns, max ns, buckets]
+        self.ops = {}
+        self.tx = 0
+        self.rx = 0
+        self.errors = {'access' : 0, 'invalid' : 0, 'timeout' : 0}
+
+    def Attach (self, obj):
+        for name, (typ, tx, rx) in OPS.items ():
+            setattr (obj, name, self.Wrap (getattr (obj, name), typ, tx, rx))
+        obj.telemetry = self
+        return obj
+
+    def Wrap (self, fn, typ, tx, rx):
+        tel = self
+
+        def wrapper (*args):
+            start = time.perf_counter_ns ()
+            try:
+                return fn (*args)
+            except AccessError:
+                tel.errors['access'] += 1
+                raise
+            except InvalidResponse:
+                tel.errors['invalid'] += 1
+                raise
+            except ReadTimeout:
+                tel.errors['timeout'] += 1
+                raise
+            finally:
+                tel.Add (typ, time.perf_counter_ns () - start, tx, rx)
+
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    def Add (self, typ, ns, tx, rx):
+        s = self.ops.get (typ)
+        if s is None:
+            s = self.ops[typ] = [0, 0, ns, ns, [0] * self.BUCKETS]
+        s[0] += 1
+        s[1] += ns
+        s[2] = min (s[2], ns)
+        s[3] = max (s[3], ns)
+        s[4][min ((ns // 1000).bit_length (), self.BUCKETS - 1)] += 1
+        self.tx += tx
+        self.rx += rx
+
+    # Upper bound (us) of the bucket holding quantile q
+    @staticmethod
+    def Quantile (hist, q):
+        total = sum (hist)
+        acc = 0
+        for n, c in enumerate (hist):
+            acc += c
+            if acc >= q * total:
+                return 1 << n
+        return 1 << len (hist)
+
+    def Json (self):
+        t = max (time.time () - self.start, 1e-9)
+        cnt = sum ([s[0] for s in self.ops.values ()])
+        ops = {}
+        for typ, (n, ns, lo, hi, hist) in sorted (self.ops.items ()):
+            ops[typ] = {'count' : n, 'mean_us' : round (ns / n / 1000, 1),
+                        'min_us' : round (lo / 1000, 1), 'max_us' : round (hi / 1000, 1),
+                        'p50_us' : self.Quantile (hist, 0.5),
+                        'p99_us' : self.Quantile (hist, 0.99),
+                        'hist' : {'<{}us'.format (1 << b) : c
+                                  for b, c in enumerate (hist) if c}}
+        return {'elapsed' : round (t, 3), 'transactions' : cnt,
+                'tx_bytes' : self.tx, 'rx_bytes' : self.rx,
+                'tps' : round (cnt / t, 1), 'tx_Bps' : round (self.tx / t, 1),
+                'rx_Bps' : round (self.rx / t, 1), 'errors' : dict (self.errors),
+                'ops' : ops}
+
+    def Dump (self, path):
+        with open (path, 'w') as fp:
+            json.dump (self.Json (), fp, indent=1)
 
 class Flexsoc (object):
 
     plen = { 'rb' : 3, 'rh' : 3, 'rw' : 3,
              'wb' : 4, 'wh' : 5, 'ww' : 6};
-    
-    def __init__ (self, device):
 
+    # device is a serial device path or an object with the pyserial
+    # calls used here (ReplaySerial, EmuFlexsoc.EmuSerial)
+    def __init__ (self, device, telemetry=False, timeout=None, record=None):
+
+        if not isinstance (device, str):
+            self.ser = device
+        else:
+            if timeout is None and telemetry:
+                timeout = TIMEOUT
+            self.Open (device, timeout)
+        if record:
+            self.ser = RecordSerial (self.ser, record)
+        self.telemetry = None
+        if telemetry:
+            Telemetry ().Attach (self)
+
+    def Open (self, device, timeout):
         try:
             # Create serial device
             self.ser = serial.Serial (device,
                                       12000000,
                                       serial.EIGHTBITS,
                                       serial.PARITY_NONE,
-                                      serial.STOPBITS_ONE)
+                                      serial.STOPBITS_ONE,
+                                      timeout=timeout)
             self.ser.flushInput ()
             self.ser.flushOutput ()
             time.sleep (0.5)
@@ -37,7 +294,7 @@ class Flexsoc (object):
 
     def Close (self):
         self.ser.close ()
-        
+
     def Control (self, typ):
         ctl = 0x80
         if typ[0] == 'w':
@@ -49,50 +306,79 @@ class Flexsoc (object):
             ctl |= 2
         return ctl
 
+    def Read (self, n):
+        data = self.ser.read (n)
+        if len (data) != n:
+            raise ReadTimeout ('Read timeout: {}/{} bytes'.format (len (data), n))
+        return data
+
+    # Response byte is 0x80, bit 0 set on a bus error. Read
+    # responses are only checked for the error bit, unless
+    # telemetry is on and counts invalid ones.
     def CheckResp (self, rv=None):
-        if rv:
-            if rv & 1:
-                print ('Access Error: {}'.format (hex (rv)))
-                raise IOError            
-        else:
-            rv = int.from_bytes(self.ser.read (1), 'big')
-            if rv != 0x80:
-                print ('Invalid response: {}'.format (hex (rv)))
-                raise IOError
+        strict = self.telemetry is not None
+        if rv is None:
+            rv = self.Read (1)[0]
+            strict = True
+        if rv & 1:
+            raise AccessError ('Access error: {}'.format (hex (rv)))
+        if strict and rv != 0x80:
+            raise InvalidResponse ('Invalid response: {}'.format (hex (rv)))
 
     # Memory access functions
     def WriteWord (self, addr, val):
         self.ser.write (pack ('>BII', self.Control ('ww'), addr, val))
         self.CheckResp ()
-        
+
     def WriteHalf (self, addr, val):
         self.ser.write (pack ('>BIH', self.Control ('wh'), addr, val))
         self.CheckResp ()
-        
+
     def WriteByte (self, addr, val):
         self.ser.write (pack ('>BIB', self.Control ('wb'), addr, val))
         self.CheckResp ()
-        
+
     def ReadWord (self, addr):
         self.ser.write (pack ('>BI', self.Control ('rw'), addr))
-        rv, val = unpack ('>BI', self.ser.read (5))
+        rv, val = unpack ('>BI', self.Read (5))
         self.CheckResp (rv)
         return val
 
     def ReadHalf (self, addr):
         self.ser.write (pack ('>BI', self.Control ('rh'), addr))
-        rv, val = unpack ('>BH', self.ser.read (3))
+        rv, val = unpack ('>BH', self.Read (3))
         self.CheckResp (rv)
         return val
 
     def ReadByte (self, addr):
         self.ser.write (pack ('>BI', self.Control ('rb'), addr))
-        rv, val = unpack ('>BB', self.ser.read (2))
+        rv, val = unpack ('>BB', self.Read (2))
         self.CheckResp (rv)
         return val
 
 if __name__ == '__main__':
 
-    with Flexsoc ('/dev/ttyUSB1') as fs:
-        print (hex(fs.ReadWord (0)))
-        
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('dev', type=str, nargs='?', default='/dev/ttyUSB1',
+                         help='Serial device')
+    parser.add_argument ('--count', type=int, default=1, help='Number of reads')
+    parser.add_argument ('--timeout', type=float, help='Serial read timeout (s)')
+    parser.add_argument ('--telemetry', type=str, help='Save link telemetry (JSON)')
+    parser.add_argument ('--record', type=str, help='Record transactions to log')
+    parser.add_argument ('--dump', type=str, help='Print a recorded log and exit')
+    args = parser.parse_args ()
+
+    if args.dump:
+        ops = {0x30 : 'rb', 0x31 : 'rh', 0x32 : 'rw', 0x48 : 'wb', 0x59 : 'wh', 0x6A : 'ww'}
+        for n, (t, dt, out, inp) in enumerate (ReadLog (args.dump)):
+            print ('{} {:.6f} {:>6}us {} {} -> {}'.format (
+                n, t / 1e6, dt, ops.get (out[0] & 0x7F, '??'), out[1:].hex (), inp.hex ()))
+        exit (0)
+
+    with Flexsoc (args.dev, args.telemetry is not None, args.timeout, args.record) as fs:
+        for n in range (args.count):
+            val = fs.ReadWord (0)
+        print (hex (val))
+        if args.telemetry:
+            fs.telemetry.Dump (args.telemetry)
+            print (json.dumps (fs.telemetry.Json (), indent=1))
@@ -0,0 +1,187 @@
+#!/bin/env python3
+#
+# Compile the espresso covers in ../espresso into bitsliced python
+# evaluators (Bitslice.py). Each input is a word holding one bit
+# of many candidates: a 64 lane int or a numpy uint64 array, so a
+# single & | ^ evaluates the filter for every lane.
+#
+# Truth tables (.esp) are reduced to prime implicants before they
+# are emitted, covers already minimized by espresso (.sol) are
+# emitted as is. Rerun after the covers change:
+#
+#  GenBitslice.py [--esp DIR] [--out FILE] [--check]
+#
+
+import argparse
+import os
+import time
+
+ROOT = os.path.dirname (os.path.abspath (__file__))
+ESP = os.path.join (ROOT, '..', 'espresso')
+OUT = os.path.join (ROOT, 'Bitslice.py')
+
+# Cover => (function name, minimize)
+COVERS = [
+    ('nlfa.esp', 'NLFA', True),
+    ('nlfb.esp', 'NLFB', True),
+    ('nlfc.esp', 'NLFC', True),
+    ('crypto1.sol', 'FILTER20', False),
+]
+
+class Cover:
+    '''
+    Single output espresso PLA, cubes of '0', '1', '-' with
+    input 0 first. Headerless files (espresso -o output) take the
+    input count from the cubes.
+    '''
+    def __init__ (self, path):
+        self.path = path
+        self.inputs = None
+        self.cubes = []
+        with open (path, 'r') as fp:
+            for line in fp:
+                line = line.split ('#')[0].strip ()
+                if not line:
+                    continue
+                tok = line.split ()
+                if tok[0] == '.ilb':
+                    self.inputs = tok[1:]
+                elif tok[0] == '.o' and tok[1] != '1':
+                    raise ValueError ('{}: only single output covers'.format (path))
+                elif tok[0] == '.e':
+                    break
+                elif tok[0][0] == '.':
+                    continue
+                elif tok[-1] == '1':
+                    self.cubes.append (tok[0])
+        n = len (self.cubes[0])
+        if any ([len (c) != n for c in self.cubes]):
+            raise ValueError ('{}: cube width differs'.format (path))
+        if self.inputs is None or len (self.inputs) != n:
+            self.inputs = None
+        self.n = n
+
+    # Quine-McCluskey prime implicants then a greedy cover
+    def Minimize (self):
+        minterms = set ()
+        for c in self.cubes:
+            minterms |= set (Expand (c))
+        primes = set ()
+        cur = set (self.cubes)
+        while cur:
+            nxt = set ()
+            used = set ()
+            for a in cur:
+                for b in cur:
+                    m = Combine (a, b)
+                    if m:
+                        nxt.add (m)
+                        used |= {a, b}
+            primes |= cur - used
+            cur = nxt
+        cover = []
+        left = set (minterms)
+        while left:
+            best = max (sorted (primes), key=lambda p: len (left & set (Expand (p))))
+            cover.append (best)
+            left -= set (Expand (best))
+        self.cubes = sorted (cover)
+
+# Minterms of a cube
+def Expand (cube):
+    ret = ['']
+    for ch in cube:
+        ret = [r + b for r in ret for b in ('01' if ch == '-' else ch)]
+    return ret
+
+# Merge cubes differing in one specified position
+def Combine (a, b):
+    diff = [n for n in range (len (a)) if a[n] != b[n]]
+    if len (diff) == 1 and '-' not in (a[diff[0]], b[diff[0]]):
+        n = diff[0]
+        return a[:n] + '-' + a[n+1:]
+    return None
+
+# Python source of a bitsliced sum of products. Inverted inputs
+# are xor'ed with ones (all lanes set) so python ints stay positive.
+def Emit (name, cover):
+    if cover.inputs:
+        args = cover.inputs
+        params = ', '.join (args)
+    else:
+        args = ['x[{}]'.format (n) for n in range (cover.n)]
+        params = 'x'
+    src = '# {} ({} cubes)\n'.format (os.path.basename (cover.path), len (cover.cubes))
+    src += 'def {} ({}, ones=ONES):\n'.format (name, params)
+    neg = sorted (set ([n for c in cover.cubes for n, ch in enumerate (c) if ch == '0']))
+    for n in neg:
+        src += '    n{} = {} ^ ones\n'.format (n, args[n])
+    terms = []
+    for c in cover.cubes:
+        lit = [args[n] if ch == '1' else 'n{}'.format (n)
+               for n, ch in enumerate (c) if ch != '-']
+        terms.append ('({})'.format (' & '.join (lit)) if lit else 'ones')
+    src += '    return (' + ' |\n            '.join (terms) + ')\n'
+    return src
+
+def Generate (esp=ESP):
+    src = '#\n# Generated by GenBitslice.py : do not edit!\n#\n'
+    src += '# Bitsliced filter functions, every argument holds one input\n'
+    src += '# bit of each lane. Pass ones for words wider than 64 lanes.\n'
+    src += '# FILTER20 takes the 20 filter taps (state bits 0, 2, .. 38).\n#\n\n'
+    src += 'LANES = 64\n'
+    src += 'ONES = (1 << LANES) - 1\n'
+    for f, name, minimize in COVERS:
+        cover = Cover (os.path.join (esp, f))
+        if minimize:
+            cover.Minimize ()
+        src += '\n' + Emit (name, cover)
+    return src
+
+# Compare generated functions in path with the FastCrypto1 tables
+def Check (path=OUT):
+    import importlib.util
+    import numpy as np
+    import FastCrypto1 as fc
+    spec = importlib.util.spec_from_file_location ('Bitslice', path)
+    bs = importlib.util.module_from_spec (spec)
+    spec.loader.exec_module (bs)
+
+    # 4/5 input functions on all inputs at once, input A is the MSB
+    for name, width, fn in [('NLFA', 4, fc.NLA), ('NLFB', 4, fc.NLB), ('NLFC', 5, fc.NLC)]:
+        args = [sum ([((v >> (width - 1 - a)) & 1) << v for v in range (1 << width)])
+                for a in range (width)]
+        out = getattr (bs, name) (*args)
+        ok = all ([((out >> v) & 1) == ((fn >> v) & 1) for v in range (1 << width)])
+        print ('{}: {}'.format (name, 'OK' if ok else 'FAIL'))
+
+    # Filter of random states, numpy words and the 20 input cover
+    x = np.random.randint (0, 1 << 48, 1 << 20, dtype=np.uint64)
+    start = time.time ()
+    ref = fc.VFilter (x)
+    t_ref = time.time () - start
+    p = fc.Slice (x)
+    start = time.time ()
+    out = fc.SFilter (p)
+    t_sl = time.time () - start
+    ok = (fc.Unslice (out, len (x)) == ref).all ()
+    sol = fc.Unslice (bs.FILTER20 (p[0:40:2]), len (x))
+    print ('SFilter: {} ({:.1f}ms, table {:.1f}ms)'.format (
+        'OK' if ok else 'FAIL', t_sl * 1000, t_ref * 1000))
+    print ('FILTER20: {}'.format ('OK' if (sol == ref).all () else 'FAIL'))
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--esp', type=str, default=ESP, help='Espresso cover directory')
+    parser.add_argument ('--out', type=str, default=OUT, help='Generated python module')
+    parser.add_argument ('--check', action='store_true',
+                         help='Check generated module against FastCrypto1')
+    args = parser.parse_args ()
+
+    src = Generate (args.esp)
+    with open (args.out, 'w') as fp:
+        fp.write (src)
+    print ('Wrote {}'.format (args.out))
+    if args.check:
+        Check (args.out)
@@ -0,0 +1,273 @@
+#!/bin/env python3
+#
+# Recover crypto1 key on the FPGA and the local CPU cores at once.
+# The board searches the cells instantiated in Crypto1Attack while
+# a process pool searches (EIDX, OIDX) cells most likely first, one
+# even index per task joined against the job's odd subkey table
+# (built once per worker, like CPUCrypto1.SearchEven). Whichever
+# side finds the key cancels the other, the cells of a board that
+# timed out, failed, lost keys or runs the shipped image are
+# searched on the CPU.
+#
+
+from RecoverKey import FPGACrypto1, CELLS
+from CPUCrypto1 import ALL_CELLS
+import FastCrypto1 as fc
+from BitUtil import int2binarr
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+import multiprocessing as mp
+import numpy as np
+import argparse
+import os
+import random
+import threading
+import time
+
+# Moving average weight of a new rate measurement
+ALPHA = 0.3
+
+# Job number shared with the pool workers, set by the pool
+# initializer. Bumped when a job ends so running tasks stop.
+_JOB = None
+
+def _Init (job):
+    global _JOB
+    _JOB = job
+
+# Odd half of the job a pool worker last searched: job number,
+# contiguous bits, remaining (offset, bit) pairs, odd subkeys,
+# their feedback keys and the keys' sort order
+_ODD = None
+
+# CPU search of the cells of one even index, runs in the pool
+# workers. The odd table of ocells is built on the first task of
+# a job, tasks of a job that is over are dropped. Returns states
+# found, cells searched and seconds taken.
+def Search (bits, extra, eidx, cells, ocells, job):
+    global _ODD
+    start = time.time ()
+    if _JOB.value != job:
+        return [], [], 0
+    if _ODD is None or _ODD[0] != job:
+        full, rest = fc.Contiguous (bits, extra)
+        odd, okey = fc.HalfTable (full[0:48], 1, ocells)
+        _ODD = (job, full, rest, odd, okey, np.argsort (okey, kind='stable'))
+    _, full, rest, odd, okey, order = _ODD
+    even, ekey = fc.HalfTable (full[0:48], 0, [eidx])
+    oi, ei = fc.Join (okey, ekey, order)
+    x = fc.Combine (full, None, rest, even[ei], odd[oi], cells)
+    return x.tolist (), cells, time.time () - start
+
+class HybridCrypto1:
+    '''
+    Same interface as FPGACrypto1 and CPUCrypto1. Cells are taken
+    most likely first with a CalcProb.ProbTable. The seconds per
+    cell of the board and of the pool are measured as jobs run:
+    when the board is faster its cells go first and the CPU takes
+    the tail, else the CPU walks every cell in order, board cells
+    included, skipping those the board has finished. mode 'fpga'
+    or 'cpu' forces the side going first. source tells which side
+    found the last key. A CPU task takes every queued cell of the
+    even index of the most likely one.
+    '''
+    def __init__ (self, dev, workers=None, cache=None, prob=None, mode='auto'):
+        # Cache is used from this thread only (sqlite)
+        self.fpga = FPGACrypto1 (dev)
+        self.workers = workers or os.cpu_count ()
+        self.job = mp.Value ('i', 0)
+        self.pool = ProcessPoolExecutor (self.workers, initializer=_Init,
+                                         initargs=(self.job,))
+        self.cache = cache
+        self.prob = prob
+        self.mode = mode
+        # Seconds per cell, None until measured
+        self.rate = {'fpga' : None, 'cpu' : None}
+        self.keys = []
+        self.cell = None
+        self.source = None
+
+    def Close (self):
+        self.pool.shutdown (cancel_futures=True)
+
+    def Measure (self, side, secs):
+        r = self.rate[side]
+        self.rate[side] = secs if r is None else (1 - ALPHA) * r + ALPHA * secs
+
+    # Board cells go first unless the pool is measured faster
+    def FpgaFirst (self):
+        if self.mode != 'auto':
+            return self.mode == 'fpga'
+        if None in self.rate.values ():
+            return True
+        return self.rate['fpga'] <= self.rate['cpu'] / self.workers
+
+    def Order (self, bits):
+        if self.prob and len (bits) > max (self.prob.offsets) + 1:
+            return [(e, o) for _, e, o in self.prob.Search (bits)]
+        return list (ALL_CELLS)
+
+    def Recover (self, bitstream, length=48, extra=None):
+        self.keys = []
+        self.cell = None
+        self.source = None
+        bs = bitstream >> (length - 48)
+        bits = int2binarr (bitstream, length)
+
+        # Repeat jobs return from cache
+        empty = set ()
+        if self.cache:
+            key = self.cache.Lookup (bs, bits, extra)
+            if key is not None:
+                self.keys = [key]
+                self.source = 'cache'
+                return key
+            empty = self.cache.EmptyCells (bs)
+
+        order = [c for c in self.Order (bits) if c not in empty]
+        board = [c for c in CELLS if c not in empty]
+        first = self.FpgaFirst ()
+        queue = [c for c in order if not first or c not in CELLS]
+        searched = set ()
+        job = self.job.value
+        ocells = sorted (set ([o for e, o in order]))
+
+        # Board runs in a thread, bits past 48 pick its key. A link
+        # error is handled as a timeout, the CPU takes its cells.
+        # So does a board that lost keys or runs the shipped image,
+        # whose cores skip subkeys: its cells are not known empty.
+        cancel = threading.Event ()
+        res = {}
+        def Board ():
+            start = time.time ()
+            try:
+                res['key'] = self.fpga.Recover (bs, [(n, bits[n]) for n in range (48, length)] +
+                                                list (extra or []), cancel)
+                res['retry'] = self.fpga.timeout or self.fpga.lost or self.fpga.shipped
+            except IOError as e:
+                print ('Board failed: {}'.format (e))
+                res['key'] = None
+                res['retry'] = True
+            res['time'] = time.time () - start
+        thread = None
+        if len (board):
+            thread = threading.Thread (target=Board, daemon=True)
+            thread.start ()
+
+        pending = {}
+        found = None
+        while found is None:
+
+            # Board finished: key, searched its cells or timed out
+            if thread and not thread.is_alive ():
+                thread = None
+                if res['key'] is not None:
+                    found = [res['key']], 'fpga'
+                    break
+                if res['retry']:
+                    queue = [c for c in board if c not in searched] + queue
+                elif not cancel.is_set ():
+                    searched |= set (board)
+                    self.Measure ('fpga', res['time'] / len (board))
+
+            # Keep the pool busy, most likely cells first
+            queue = [c for c in queue if c not in searched]
+            while len (pending) < self.workers and len (queue):
+                eidx = queue[0][0]
+                cells = [c for c in queue if c[0] == eidx]
+                queue = [c for c in queue if c[0] != eidx]
+                pending[self.pool.submit (Search, bits, extra, eidx, cells, ocells, job)] = cells
+            if len (pending) == 0:
+                if thread is None:
+                    break
+                thread.join (0.1)
+                continue
+
+            done, _ = wait (pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for f in done:
+                pending.pop (f)
+                keys, cells, secs = f.result ()
+                searched |= set (cells)
+                if len (cells):
+                    self.Measure ('cpu', secs / len (cells))
+                if len (keys) and found is None:
+                    found = keys, 'cpu'
+
+        # Stop the other side, queued CPU cells are dropped, running
+        # tasks return after their current cell and the cores are
+        # stopped on the next status poll
+        cancel.set ()
+        with self.job.get_lock ():
+            self.job.value += 1
+        for f in pending:
+            f.cancel ()
+        if thread:
+            thread.join ()
+
+        if found is None:
+            if self.cache:
+                for e, o in searched:
+                    self.cache.MarkEmpty (bs, e, o)
+            return None
+        self.keys, self.source = found
+        self.cell = tuple (int (x) for x in fc.Cell (self.keys[0]))
+        if self.cache:
+            for key in self.keys:
+                self.cache.Store (bs, key)
+        return self.keys[0]
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--dev', type=str, default='/dev/ttyUSB1',
+                         help='FPGA serial device (or emu[:DELAY])')
+    parser.add_argument ('--workers', type=int, help='CPU processes, all cores if not given')
+    parser.add_argument ('--count', type=int, default=12,
+                         help='Number of random bitstreams to recover')
+    parser.add_argument ('--len', type=int, default=48, help='Bitstream length')
+    parser.add_argument ('--mode', type=str, default='auto', choices=['auto', 'fpga', 'cpu'],
+                         help='Side searching the most likely cells')
+    parser.add_argument ('--table', type=str,
+                         help='Search most likely cells first (CalcProb trained table)')
+    parser.add_argument ('--cache', type=str, help='Key cache file')
+    parser.add_argument ('--csr', type=str,
+                         help='CSR map of queue image boards (JSON from the generated crypto1_csr)')
+    args = parser.parse_args ()
+
+    if args.csr:
+        import RecoverKey
+        RecoverKey.LoadCSR (args.csr)
+
+    prob = None
+    if args.table:
+        from CalcProb import ProbTable
+        prob = ProbTable (path=args.table)
+    cache = None
+    if args.cache:
+        from KeyCache import KeyCache
+        cache = KeyCache (args.cache)
+    crack = HybridCrypto1 (args.dev, args.workers, cache, prob, args.mode)
+
+    # Try random valid bitstreams
+    total = 0
+    for n in range (args.count):
+        rkey = random.randint (0, 2**48 - 1)
+        bs = 0
+        x = rkey
+        for i in range (args.len):
+            b, x = fc.Step (x)
+            bs = (bs << 1) | b
+        print ('bitstream={}'.format (hex (bs)))
+
+        start = time.time ()
+        key = crack.Recover (bs, args.len)
+        total += time.time () - start
+        if key is not None:
+            print ('Found key: {} cell={} by {} ({:.2f}s)'.format (
+                hex (key), crack.cell, crack.source, time.time () - start))
+            if rkey in crack.keys:
+                print ('Key check: OK')
+        else:
+            print ('Key not found')
+    print ('Average time: {:.2f}s, s/cell fpga={} cpu={}'.format (
+        total / args.count, crack.rate['fpga'], crack.rate['cpu']))
+    crack.Close ()
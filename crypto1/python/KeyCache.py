@@ -0,0 +1,117 @@
+#!/bin/env python3
+#
+# Persistent cache of recovered keys and searched cells keyed by
+# the 48 bit bitstream, shared by FPGACrypto1 and sim.py
+#
+
+import FastCrypto1 as fc
+from BitUtil import int2binarr
+import numpy as np
+import argparse
+import sqlite3
+
+class KeyCache:
+    '''
+    Keys are stored as the state at the first bitstream bit (as
+    returned by FPGACrypto1.Recover). The bitstreams of the windows
+    around a found key are stored too, so overlapping sniffs of the
+    same session hit the cache. A bitstream can come from several
+    states, every one stored is kept and a lookup only returns one
+    matching the known bits past the bitstream. Cells (EIDX, OIDX)
+    searched without a hit are recorded per bitstream.
+    '''
+    def __init__ (self, path='crypto1_cache.db', span=64):
+        self.span = span
+        self.db = sqlite3.connect (path)
+        self.db.execute ('CREATE TABLE IF NOT EXISTS state ('
+                         'bitstream INTEGER, state INTEGER, '
+                         'PRIMARY KEY (bitstream, state)) WITHOUT ROWID')
+        # Caches written with one state per bitstream
+        if self.db.execute ("SELECT name FROM sqlite_master WHERE name='result'").fetchone ():
+            self.db.execute ('INSERT OR IGNORE INTO state SELECT bitstream, state FROM result')
+            self.db.execute ('DROP TABLE result')
+        self.db.execute ('CREATE TABLE IF NOT EXISTS empty ('
+                         'bitstream INTEGER, cell INTEGER, '
+                         'PRIMARY KEY (bitstream, cell)) WITHOUT ROWID')
+        self.db.commit ()
+
+    def Close (self):
+        self.db.close ()
+
+    # Context manager
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, type, value, traceback):
+        self.Close ()
+
+    # 48 bit bitstream generated from state, first bit as MSB
+    @staticmethod
+    def Bitstream (state):
+        bs = 0
+        for n in range (48):
+            b, state = fc.Step (state)
+            bs = (bs << 1) | b
+        return bs
+
+    # Stored states of bitstream producing the known bits (from the
+    # first bitstream bit, the 48 bitstream bits if not given) and
+    # the extra (offset, bit) pairs
+    def States (self, bitstream, bits=None, extra=None):
+        r = self.db.execute ('SELECT state FROM state WHERE bitstream=?',
+                             (bitstream,)).fetchall ()
+        if len (r) == 0:
+            return []
+        x = np.array ([s for s, in r], dtype=np.uint64)
+        if bits is None:
+            bits = int2binarr (bitstream, 48)
+        return fc.Verify (x, bits, None, extra).tolist ()
+
+    # First stored state matching the known bits, None if there is
+    # none
+    def Lookup (self, bitstream, bits=None, extra=None):
+        states = self.States (bitstream, bits, extra)
+        return states[0] if len (states) else None
+
+    def Store (self, bitstream, state):
+        rows = [(bitstream, state)]
+        fwd = rev = state
+        for n in range (self.span):
+            _, fwd = fc.Step (fwd)
+            rev = fc.Rollback (rev)
+            rows.append ((self.Bitstream (fwd), fwd))
+            rows.append ((self.Bitstream (rev), rev))
+        self.db.executemany ('INSERT OR IGNORE INTO state VALUES (?, ?)', rows)
+        self.db.commit ()
+
+    def MarkEmpty (self, bitstream, eidx, oidx):
+        self.db.execute ('INSERT OR IGNORE INTO empty VALUES (?, ?)',
+                         (bitstream, (eidx << 4) | oidx))
+        self.db.commit ()
+
+    def EmptyCells (self, bitstream):
+        r = self.db.execute ('SELECT cell FROM empty WHERE bitstream=?',
+                             (bitstream,))
+        return set ([(c >> 4, c & 15) for c, in r])
+
+    # All 256 cells searched without a key
+    def Exhausted (self, bitstream):
+        return len (self.EmptyCells (bitstream)) == 256
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--db', type=str, default='crypto1_cache.db',
+                         help='Cache file')
+    parser.add_argument ('--lookup', type=str, help='Lookup bitstream')
+    args = parser.parse_args ()
+
+    with KeyCache (args.db) as cache:
+        if args.lookup:
+            bs = int (args.lookup, 0)
+            key = cache.Lookup (bs)
+            if key is not None:
+                print ('Found key: {}'.format (hex (key)))
+            else:
+                empty = cache.EmptyCells (bs)
+                print ('Not found, {} empty cells'.format (len (empty)))
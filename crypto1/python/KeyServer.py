@@ -0,0 +1,424 @@
+#!/bin/env python3
+#
+# Key recovery service. One process owns the boards and the CPU
+# engine, tools send bitstreams over a unix socket (or localhost
+# TCP) and get progress and keys back as JSON lines:
+#
+#  KeyServer.py --addr SOCK [--dev DEV ...] [--cpu N] [--cache DB]
+#  KeyServer.py --addr SOCK --client [--len N] [BITSTREAM ...]
+#
+# SOCK is a unix socket path or [host:]port. Requests are
+#  {"id": ID, "bitstream": "hex", "len": 48}
+# answered by events {"id": ID, "event": E, ...} with E one of
+# queued, running, fallback, done (with keys) or error.
+# {"cmd": "stats"} returns the service counters, with the link
+# telemetry of each board (Flexsoc.Telemetry) when run with
+# --telemetry.
+#
+# Requests for a bitstream already queued or running join that
+# job. A board takes every queued job at once and runs them through
+# FPGACrypto1.RecoverStream so the next bitstream always waits in
+# the shadow registers. Jobs no board found a key for (the FPGA
+# only searches its 20 cells) fall back to the CPU engine when CPU
+# workers run, which otherwise take jobs directly.
+#
+# --dev emu runs against the emulated board (EmuFlexsoc), e.g.
+#  KeyServer.py --addr /tmp/k.sock --dev emu --dev emu --cpu 1
+#
+
+import argparse
+import json
+import os
+import queue
+import socket
+import socketserver
+import sys
+import threading
+import time
+
+class Job:
+
+    def __init__ (self, bitstream, length):
+        self.bitstream = bitstream
+        self.length = length
+        # Callbacks taking an event dict
+        self.watchers = []
+        self.state = 'queued'
+        self.backend = None
+        self.keys = None
+        self.start = time.time ()
+
+    # 48 bit FPGA bitstream and (offset, bit) pairs past it
+    def Board (self):
+        bs = self.bitstream >> (self.length - 48)
+        extra = [(n, (self.bitstream >> (self.length - 1 - n)) & 1)
+                 for n in range (48, self.length)]
+        return bs, extra
+
+class KeyService:
+    '''
+    Job queues and backend workers. Boards and CPU workers run in
+    their own thread and open the device and cache there (sqlite
+    connections are per thread). Submit returns at once, progress
+    is reported through the watcher callback.
+    '''
+    def __init__ (self, devs=(), cpu=None, cache=None, batch=16, telemetry=False):
+        self.cache = cache
+        self.batch = batch
+        self.telemetry = telemetry
+        # Board name => Flexsoc.Telemetry
+        self.links = {}
+        self.lock = threading.Lock ()
+        # (bitstream, length) => Job while queued or running
+        self.jobs = {}
+        self.queue = queue.Queue ()
+        if cpu is None:
+            cpu = 0 if len (devs) else 1
+        self.cpu = cpu
+        # CPU workers take board misses, or all jobs without boards
+        self.fallback = queue.Queue () if len (devs) else self.queue
+        self.stats = {'requests' : 0, 'coalesced' : 0, 'jobs' : 0,
+                      'found' : 0, 'fallback' : 0, 'errors' : 0}
+        self.backends = {}
+        self.boards = []
+        self.workers = []
+        for n, dev in enumerate (devs):
+            self.boards.append (self.Worker ('fpga{}'.format (n), self.BoardLoop, dev))
+        for n in range (cpu):
+            self.workers.append (self.Worker ('cpu{}'.format (n), self.CpuLoop))
+
+    def Worker (self, name, fn, *args):
+        self.backends[name] = {'jobs' : 0, 'busy' : 0.0, 'errors' : 0}
+        t = threading.Thread (target=fn, args=(name,) + args, daemon=True)
+        t.start ()
+        return t
+
+    # Stop workers once queued jobs are done, boards first as
+    # their misses go to the CPU workers
+    def Stop (self):
+        for q, workers in [(self.queue, self.boards), (self.fallback, self.workers)]:
+            for t in workers:
+                q.put (None)
+            for t in workers:
+                t.join ()
+
+    def Event (self, job, event, **kw):
+        msg = dict (kw, event=event)
+        for w in list (job.watchers):
+            w (msg)
+
+    def Submit (self, bitstream, length, watcher):
+        with self.lock:
+            self.stats['requests'] += 1
+            job = self.jobs.get ((bitstream, length))
+            if job:
+                self.stats['coalesced'] += 1
+                job.watchers.append (watcher)
+                watcher ({'event' : job.state, 'backend' : job.backend,
+                          'coalesced' : True})
+                return
+            if length < 48 and not self.cpu:
+                watcher ({'event' : 'error', 'error' : 'Bitstreams under 48 bits need a CPU worker'})
+                return
+            job = Job (bitstream, length)
+            job.watchers.append (watcher)
+            self.jobs[(bitstream, length)] = job
+            self.stats['jobs'] += 1
+            q = self.queue if length >= 48 else self.fallback
+            q.put (job)
+            watcher ({'event' : 'queued', 'position' : q.qsize ()})
+
+    def Finish (self, job, keys, name, error=None):
+        with self.lock:
+            self.jobs.pop ((job.bitstream, job.length), None)
+            job.state = 'done'
+            job.keys = keys
+            self.stats['found'] += len (keys) > 0
+            self.stats['errors'] += error is not None
+        msg = {'keys' : [hex (k) for k in keys], 'backend' : name,
+               'time' : round (time.time () - job.start, 3)}
+        if error:
+            msg['error'] = error
+        self.Event (job, 'done', **msg)
+
+    def Running (self, job, name):
+        job.state = 'running'
+        job.backend = name
+        self.backends[name]['jobs'] += 1
+        self.Event (job, 'running', backend=name)
+
+    # Hand board misses to the CPU workers
+    def Miss (self, job, name, error=None):
+        if self.cpu and self.fallback is not self.queue:
+            with self.lock:
+                self.stats['fallback'] += 1
+                job.state = 'queued'
+            # Event first, a CPU worker may report running at once
+            self.Event (job, 'fallback', backend=name, position=self.fallback.qsize () + 1)
+            self.fallback.put (job)
+        else:
+            self.Finish (job, [], name, error)
+
+    # Block for one job then take what else is queued
+    def Take (self, q):
+        jobs = [q.get ()]
+        while len (jobs) < self.batch and jobs[-1] is not None:
+            try:
+                jobs.append (q.get_nowait ())
+            except queue.Empty:
+                break
+        return jobs
+
+    def Cache (self):
+        if not self.cache:
+            return None
+        from KeyCache import KeyCache
+        return KeyCache (self.cache)
+
+    # Errors never end the loop, jobs it took would hang. A board
+    # that failed to open hands every job it takes to the CPU
+    # workers, or fails it without them.
+    def BoardLoop (self, name, dev):
+        from RecoverKey import FPGACrypto1
+        fpga = None
+        try:
+            fpga = FPGACrypto1 (dev, self.Cache (), self.telemetry)
+            if self.telemetry:
+                self.links[name] = fpga.flex.telemetry
+        except Exception as e:
+            error = 'Board open failed: {}'.format (e)
+            print ('{}: {}'.format (name, error), file=sys.stderr)
+            self.backends[name]['errors'] += 1
+        while True:
+            jobs = self.Take (self.queue)
+            stop = jobs[-1] is None
+            jobs = [j for j in jobs if j is not None]
+            if fpga is None:
+                for j in jobs:
+                    self.Miss (j, name, error)
+                if stop:
+                    break
+                continue
+
+            # Same 48 bits may come with different extra bits
+            src = {}
+            def Stream (todo):
+                for j in todo:
+                    bs, extra = j.Board ()
+                    src.setdefault (bs, []).append (j)
+                    self.Running (j, name)
+                    yield bs, extra
+            start = time.time ()
+            try:
+                for bs, key in fpga.RecoverStream (Stream (list (jobs))):
+                    j = src[bs].pop (0)
+                    jobs.remove (j)
+                    if key is None:
+                        self.Miss (j, name)
+                    else:
+                        self.Finish (j, [key], name)
+            except Exception as e:
+                print ('{}: {}'.format (name, e), file=sys.stderr)
+                self.backends[name]['errors'] += 1
+                for j in jobs:
+                    self.Miss (j, name, str (e))
+            self.backends[name]['busy'] += time.time () - start
+            if stop:
+                break
+
+    def CpuLoop (self, name):
+        from CPUCrypto1 import CPUCrypto1
+        cpu = CPUCrypto1 (self.Cache ())
+        while True:
+            job = self.fallback.get ()
+            if job is None:
+                break
+            self.Running (job, name)
+            start = time.time ()
+            try:
+                cpu.Recover (job.bitstream, job.length)
+                keys, error = cpu.keys, None
+            except ValueError as e:
+                self.backends[name]['errors'] += 1
+                keys, error = [], str (e)
+            self.backends[name]['busy'] += time.time () - start
+            self.Finish (job, keys, name, error)
+
+    def Stats (self):
+        with self.lock:
+            stats = dict (self.stats, queued=self.queue.qsize (),
+                          fallback_queued=self.fallback.qsize (),
+                          active=len (self.jobs), backends=self.backends)
+        if self.telemetry:
+            stats['telemetry'] = {name : t.Json () for name, t in self.links.items ()}
+        return stats
+
+class Handler (socketserver.StreamRequestHandler):
+    '''
+    One client connection, any number of requests. Events for a
+    request are sent as they happen, the connection is held open
+    until every request got its done event.
+    '''
+    def handle (self):
+        lock = threading.Lock ()
+        idle = threading.Condition (lock)
+        self.outstanding = 0
+
+        def Send (msg):
+            try:
+                self.wfile.write ((json.dumps (msg) + '\n').encode ())
+                self.wfile.flush ()
+            except OSError:
+                pass
+
+        def Watcher (rid):
+            def Fn (msg):
+                with lock:
+                    Send (dict (msg, id=rid))
+                    if msg['event'] in ('done', 'error'):
+                        self.outstanding -= 1
+                        idle.notify ()
+            return Fn
+
+        for line in self.rfile:
+            rid = None
+            try:
+                req = json.loads (line)
+                rid = req.get ('id')
+                if req.get ('cmd') == 'stats':
+                    stats = self.server.service.Stats ()
+                    with lock:
+                        Send ({'id' : rid, 'event' : 'stats', 'stats' : stats})
+                    continue
+                bs = int (req['bitstream'], 16)
+                length = int (req.get ('len', 48))
+                if length < 10 or bs >> length:
+                    raise ValueError ('Bad bitstream length')
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                with lock:
+                    Send ({'id' : rid, 'event' : 'error', 'error' : str (e)})
+                continue
+            with lock:
+                self.outstanding += 1
+            self.server.service.Submit (bs, length, Watcher (rid))
+
+        with lock:
+            while self.outstanding:
+                idle.wait ()
+
+class UnixServer (socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+class TCPServer (socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+# Unix socket path or [host:]port, host defaults to localhost
+def Address (addr):
+    if os.sep in addr or not addr.split (':')[-1].isdigit ():
+        return addr
+    host, _, port = addr.rpartition (':')
+    return (host or '127.0.0.1', int (port))
+
+def Server (addr, service):
+    addr = Address (addr)
+    if isinstance (addr, str):
+        if os.path.exists (addr):
+            os.unlink (addr)
+        server = UnixServer (addr, Handler)
+    else:
+        server = TCPServer (addr, Handler)
+    server.service = service
+    return server
+
+# Run until interrupted then finish the queued jobs
+def Serve (addr, service):
+    server = Server (addr, service)
+    print ('Listening on {}'.format (addr), flush=True)
+    try:
+        server.serve_forever ()
+    except KeyboardInterrupt:
+        pass
+    server.server_close ()
+    service.Stop ()
+
+class KeyClient:
+    '''
+    Client side of the service. Recover yields every event of the
+    requests in turn, ending after the last done.
+    '''
+    def __init__ (self, addr):
+        addr = Address (addr)
+        family = socket.AF_UNIX if isinstance (addr, str) else socket.AF_INET
+        self.sock = socket.socket (family, socket.SOCK_STREAM)
+        self.sock.connect (addr)
+        self.rfile = self.sock.makefile ('r')
+
+    def Close (self):
+        self.rfile.close ()
+        self.sock.close ()
+
+    # Context manager
+    def __enter__ (self):
+        return self
+
+    def __exit__ (self, type, value, traceback):
+        self.Close ()
+
+    def Send (self, req):
+        self.sock.sendall ((json.dumps (req) + '\n').encode ())
+
+    # Bitstreams are ints or hex strings, ids are the list index
+    def Recover (self, bitstreams, length=48):
+        n = 0
+        for n, bs in enumerate (bitstreams):
+            self.Send ({'id' : n, 'len' : length,
+                        'bitstream' : bs if isinstance (bs, str) else hex (bs)})
+        left = n + 1 if len (bitstreams) else 0
+        while left:
+            msg = json.loads (self.rfile.readline ())
+            left -= msg['event'] in ('done', 'error')
+            yield msg
+
+    def Stats (self):
+        self.Send ({'cmd' : 'stats'})
+        return json.loads (self.rfile.readline ())['stats']
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('bitstream', type=str, nargs='*',
+                         help='Client: bitstreams in hex, read from stdin if none')
+    parser.add_argument ('--addr', type=str, default='/tmp/crypto1.sock',
+                         help='Unix socket path or [host:]port')
+    parser.add_argument ('--dev', type=str, action='append', default=[],
+                         help='Board serial device (or emu[:DELAY]), repeat for more boards')
+    parser.add_argument ('--cpu', type=int,
+                         help='CPU workers, default 1 without boards else 0')
+    parser.add_argument ('--cache', type=str, help='Key cache file')
+    parser.add_argument ('--batch', type=int, default=16,
+                         help='Max jobs a board takes at once')
+    parser.add_argument ('--client', action='store_true',
+                         help='Send bitstreams to a running service')
+    parser.add_argument ('--len', type=int, default=48, help='Bitstream length')
+    parser.add_argument ('--stats', action='store_true', help='Client: print service stats')
+    parser.add_argument ('--telemetry', action='store_true',
+                         help='Report board link telemetry in stats')
+    parser.add_argument ('--csr', type=str,
+                         help='CSR map of queue image boards (JSON from the generated crypto1_csr)')
+    args = parser.parse_args ()
+
+    if args.client or args.stats:
+        with KeyClient (args.addr) as client:
+            if args.stats:
+                print (json.dumps (client.Stats (), indent=1))
+            else:
+                from Crypto1Tool import Values
+                for msg in client.Recover (list (Values (args.bitstream)), args.len):
+                    print (json.dumps (msg), flush=True)
+    else:
+        if args.csr:
+            import RecoverKey
+            RecoverKey.LoadCSR (args.csr)
+        Serve (args.addr, KeyService (args.dev, args.cpu, args.cache, args.batch,
+                                      args.telemetry))
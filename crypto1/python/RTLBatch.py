@@ -0,0 +1,353 @@
+#!/bin/env python3
+#
+# Batch runs of the Verilated RTL from python. Crypto1Core (or
+# Crypto1Attack) is built into a shared library with
+# tb/Crypto1_lib.cpp and loaded with ctypes so thousands of random
+# bitstreams from Crypto1.Raw can be run in one process without a
+# testbench per job.
+#
+# Per cell the cycles to DONE, the keys reported and whether the
+# key was found in the cell it belongs to (fc.Cell) are collected.
+# --check also compares the reported keys with the CPU engine
+# restricted to the same cell. --table walks the enumerators in
+# the B20Enum ORDER of a trained CalcProb.ProbTable.
+#
+# A cell takes billions of cycles, --smoke walks each key's own
+# subkeys first and ends the run at the first key so the whole
+# path (enumerators, ring, merge, result FIFO) is checked in a few
+# ring passes. With --attack the keys are drawn from the FPGA
+# cells.
+#
+# GenSubkey instantiates fifo from the fusesoc fifo core, which
+# is not in this repo. Its sources are looked up in the fusesoc
+# libraries, --fifo-src gives them (files or directories of .v
+# files) when fusesoc is not set up.
+#
+# Usage:
+#  RTLBatch.py [--count N] [--all-cells] [--check] [--table NPZ] [--json FILE]
+#  RTLBatch.py --attack [--count N] [--json FILE]
+#  RTLBatch.py --smoke [--attack] [--count N]
+#  RTLBatch.py --fifo-src ~/fusesoc-cores/fifo/rtl/verilog ...
+#
+
+from Crypto1 import Crypto1
+from RecoverKey import CELLS
+import FastCrypto1 as fc
+from BitUtil import int2binarr, binarr2int
+import numpy as np
+import argparse
+import ctypes
+import glob
+import json
+import os
+import random
+import subprocess
+import time
+
+ROOT = os.path.join (os.path.dirname (os.path.abspath (__file__)), '..')
+RTL = os.path.join (ROOT, 'rtl')
+BUILD = os.path.join (ROOT, 'build', 'rtlbatch')
+LIB_SRC = os.path.join (ROOT, 'tb', 'Crypto1_lib.cpp')
+
+# Sources of each toplevel, crypto1.vh is found with -I
+SOURCES = {
+    'Crypto1Core' : ['B20Enum.sv', 'GenSubkey.sv', 'RingBuf.sv', 'Crypto1Core.sv'],
+    'Crypto1Attack' : ['B20Enum.sv', 'GenSubkey.sv', 'RingBuf.sv', 'Crypto1Core.sv',
+                       'Crypto1Attack.sv'],
+}
+
+# Max keys returned per run
+NKEYS = 64
+
+# Sources of the fusesoc fifo core, from paths if given else from
+# the core file found by fusesoc
+def FifoSources (paths=None):
+    if paths:
+        srcs = []
+        for p in paths:
+            srcs += sorted (glob.glob (os.path.join (p, '*.v'))) if os.path.isdir (p) else [p]
+        return [os.path.abspath (f) for f in srcs]
+    try:
+        out = subprocess.run (['fusesoc', 'core', 'show', 'fifo'], capture_output=True,
+                              text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        raise IOError ('fifo core not found, add fusesoc-cores to the fusesoc '
+                       'libraries or pass --fifo-src')
+    import yaml
+    info = dict ([l.split (':', 1) for l in out.splitlines () if ':' in l])
+    root = info['Core root'].strip ()
+    with open (os.path.join (root, info['Core file'].strip ()), 'r') as fp:
+        core = yaml.safe_load (fp)
+    srcs = []
+    for fs in core['targets']['default']['filesets']:
+        for f in core['filesets'][fs].get ('files', []):
+            f = f if isinstance (f, str) else list (f)[0]
+            if f.endswith ('.v') or f.endswith ('.sv'):
+                srcs.append (os.path.join (root, f))
+    return srcs
+
+# Build shared library for toplevel unless up to date
+def Build (top, build=BUILD, force=False, fifo=None):
+    mdir = os.path.join (build, top)
+    lib = os.path.join (mdir, 'lib{}.so'.format (top))
+    srcs = FifoSources (fifo) + [os.path.join (RTL, f) for f in SOURCES[top]]
+    deps = srcs + [LIB_SRC, os.path.join (RTL, 'crypto1.vh')]
+    if not force and os.path.exists (lib) and \
+       os.path.getmtime (lib) > max ([os.path.getmtime (f) for f in deps]):
+        return lib
+
+    os.makedirs (mdir, exist_ok=True)
+    cflags = '-fPIC -O2'
+    if top == 'Crypto1Attack':
+        cflags += ' -DTOP_ATTACK'
+    cmd = ['verilator', '--cc', '--exe', '--build', '-j', '0', '-O3',
+           '-Wno-fatal', '--top-module', top, '--Mdir', mdir,
+           '-I' + RTL, '-CFLAGS', cflags, '-LDFLAGS', '-shared', '-o', lib]
+    if top == 'Crypto1Core':
+        cmd += ['-GALL_KEYS=1']
+    subprocess.run (cmd + srcs + [LIB_SRC], check=True)
+    return lib
+
+class VCrypto1Core:
+    '''
+    Verilated Crypto1Core. Run searches one cell and returns the
+    cycles to DONE and every key found, rewound to the first
+    bitstream bit.
+    '''
+    def __init__ (self, build=BUILD, fifo=None):
+        self.lib = ctypes.CDLL (Build ('Crypto1Core', build, fifo=fifo))
+        self.lib.sim_new.restype = ctypes.c_void_p
+        self.lib.sim_free.argtypes = [ctypes.c_void_p]
+        self.lib.core_run.restype = ctypes.c_uint64
+        self.lib.core_run.argtypes = [
+            ctypes.c_void_p, ctypes.c_uint64, ctypes.c_int, ctypes.c_int,
+            ctypes.POINTER (ctypes.c_uint32), ctypes.POINTER (ctypes.c_uint32),
+            ctypes.c_uint64, ctypes.c_int, ctypes.POINTER (ctypes.c_uint64), ctypes.c_int,
+            ctypes.POINTER (ctypes.c_int)]
+        self.top = self.lib.sim_new ()
+        self.keys = (ctypes.c_uint64 * NKEYS) ()
+        self.found = ctypes.c_int ()
+
+    def Close (self):
+        if self.top:
+            self.lib.sim_free (self.top)
+            self.top = None
+
+    # first ends the run at the first key
+    def Run (self, bitstream, eidx, oidx, max_cycles, order=(None, None), first=False):
+        cycles = self.lib.core_run (self.top, bitstream, eidx, oidx,
+                                    Words (order[0]), Words (order[1]), max_cycles, first,
+                                    self.keys, NKEYS, ctypes.byref (self.found))
+        return cycles, [Rewind (k) for k in self.keys[0:min (self.found.value, NKEYS)]]
+
+class VCrypto1Attack (VCrypto1Core):
+    '''
+    Verilated Crypto1Attack, Run searches all cells and pops every
+    key from the result FIFO.
+    '''
+    def __init__ (self, build=BUILD, fifo=None):
+        self.lib = ctypes.CDLL (Build ('Crypto1Attack', build, fifo=fifo))
+        self.lib.sim_new.restype = ctypes.c_void_p
+        self.lib.sim_free.argtypes = [ctypes.c_void_p]
+        self.lib.attack_run.restype = ctypes.c_uint64
+        self.lib.attack_run.argtypes = [
+            ctypes.c_void_p, ctypes.c_uint64,
+            ctypes.POINTER (ctypes.c_uint32), ctypes.POINTER (ctypes.c_uint32),
+            ctypes.c_uint64, ctypes.c_int, ctypes.POINTER (ctypes.c_uint64), ctypes.c_int,
+            ctypes.POINTER (ctypes.c_int), ctypes.POINTER (ctypes.c_int)]
+        self.top = self.lib.sim_new ()
+        self.keys = (ctypes.c_uint64 * NKEYS) ()
+        self.found = ctypes.c_int ()
+        # A core dropped a key in the last run
+        self.lost = ctypes.c_int ()
+
+    def Run (self, bitstream, max_cycles, order=(None, None), first=False):
+        cycles = self.lib.attack_run (self.top, bitstream,
+                                      Words (order[0]), Words (order[1]), max_cycles, first,
+                                      self.keys, NKEYS, ctypes.byref (self.found),
+                                      ctypes.byref (self.lost))
+        return cycles, [Rewind (k) for k in self.keys[0:min (self.found.value, NKEYS)]]
+
+# 240 bit ORDER as 8 words, None counts up
+def Words (order):
+    if order is None:
+        return None
+    return (ctypes.c_uint32 * 8) (*[(order >> (32 * n)) & 0xFFFFFFFF for n in range (8)])
+
+# ORDER of each half walking the subkeys of key (state at the
+# first bitstream bit) first
+def KeyOrder (key):
+    import CalcProb as cp
+    ret = []
+    for y in (key, fc.Step (key)[1]):
+        h = fc.Compress (y) & 0xFFFFF
+        sel = int (fc.SEL20[h])
+        ctr = int (fc.SubIndex (h))
+        order = [[list (range (8)) for b in range (2)] for g in range (5)]
+        for g in range (5):
+            walk = order[g][(sel >> (4 - g)) & 1]
+            walk.remove ((ctr >> (3 * g)) & 7)
+            walk.insert (0, (ctr >> (3 * g)) & 7)
+        ret.append (cp.OrderBits (order))
+    return tuple (ret)
+
+# Keys are reported 45 cycles into the bitstream
+def Rewind (key):
+    for n in range (45):
+        key = fc.Rollback (key)
+    return key
+
+class CellStats:
+
+    def __init__ (self):
+        self.runs = 0
+        self.hits = 0
+        self.misses = 0
+        self.keys = 0
+        # Reported keys not producing the bitstream
+        self.bad = 0
+        # Key sets differing from the CPU engine
+        self.diff = 0
+        self.timeouts = 0
+        # Runs where a core dropped a key (Crypto1Attack LOST)
+        self.lost = 0
+        self.cycles = []
+
+    def Add (self, cycles, timeout):
+        self.runs += 1
+        self.cycles.append (cycles)
+        self.timeouts += timeout
+
+    def Json (self):
+        c = np.array (self.cycles or [0])
+        return {'runs' : self.runs, 'hits' : self.hits, 'misses' : self.misses,
+                'keys' : self.keys, 'bad' : self.bad, 'diff' : self.diff,
+                'timeouts' : self.timeouts, 'lost' : self.lost, 'cycles_mean' : float (c.mean ()),
+                'cycles_min' : int (c.min ()), 'cycles_max' : int (c.max ())}
+
+class Batch:
+    '''
+    Run random bitstreams through the cores and collect stats per
+    (EIDX, OIDX) cell. Bitstreams come from Crypto1.Raw so the RTL
+    is checked against the reference model.
+    '''
+    def __init__ (self, attack=False, cells=None, max_cycles=1 << 32,
+                  check=False, build=BUILD, table=None, fifo=None, smoke=False):
+        self.attack = attack
+        self.table = table
+        self.smoke = smoke
+        self.cells = cells
+        self.max_cycles = max_cycles
+        self.check = check
+        self.stats = {}
+        self.sim = VCrypto1Attack (build, fifo) if attack else VCrypto1Core (build, fifo)
+        if check:
+            from CPUCrypto1 import CPUCrypto1
+            self.cpu = CPUCrypto1
+
+    def Close (self):
+        self.sim.Close ()
+
+    # Count keys not producing the bitstream
+    @staticmethod
+    def Bad (keys, bitstream):
+        x = np.array (keys, dtype=np.uint64)
+        return len (keys) - len (fc.Verify (x, int2binarr (bitstream, 48)))
+
+    def Run (self, rkey):
+        bs = binarr2int (Crypto1 (state=rkey).Raw (48))
+        cell = tuple (int (x) for x in fc.Cell (rkey))
+        order = (None, None)
+        if self.table:
+            import CalcProb as cp
+            bits = int2binarr (bs, 48)
+            order = tuple (cp.OrderBits (self.table.Order (bits, half)) for half in range (2))
+        if self.smoke:
+            order = KeyOrder (rkey)
+
+        if self.attack:
+            cycles, keys = self.sim.Run (bs, self.max_cycles, order, self.smoke)
+            s = self.stats.setdefault (cell, CellStats ())
+            s.Add (cycles, cycles >= self.max_cycles)
+            s.keys += len (keys)
+            s.bad += self.Bad (keys, bs)
+            s.lost += self.sim.lost.value
+            if cell in CELLS:
+                s.hits += rkey in keys
+                s.misses += rkey not in keys
+            return
+
+        # Run true cell of the key, and all others if asked
+        for e, o in self.cells if self.cells else [cell]:
+            cycles, keys = self.sim.Run (bs, e, o, self.max_cycles, order, self.smoke)
+            s = self.stats.setdefault ((e, o), CellStats ())
+            s.Add (cycles, cycles >= self.max_cycles)
+            s.keys += len (keys)
+            s.bad += self.Bad (keys, bs)
+            if (e, o) == cell:
+                s.hits += rkey in keys
+                s.misses += rkey not in keys
+            if self.check and not self.smoke:
+                cpu = self.cpu (cells=[(e, o)])
+                cpu.Recover (bs)
+                s.diff += set (cpu.keys) != set (keys)
+
+    def Json (self):
+        return {'{},{}'.format (*k) : v.Json () for k, v in sorted (self.stats.items ())}
+
+    def Print (self):
+        for (e, o), s in sorted (self.stats.items ()):
+            j = s.Json ()
+            print ('({:2d},{:2d}) runs={:<6d} hit={:<6d} miss={:<4d} bad={:<4d} '
+                   'diff={:<4d} timeout={:<4d} lost={:<4d} cycles={:.0f} [{}..{}]'.format (
+                       e, o, j['runs'], j['hits'], j['misses'], j['bad'], j['diff'],
+                       j['timeouts'], j['lost'], j['cycles_mean'], j['cycles_min'],
+                       j['cycles_max']))
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--count', type=int, default=1000,
+                         help='Number of random bitstreams')
+    parser.add_argument ('--attack', action='store_true',
+                         help='Run Crypto1Attack instead of a single core')
+    parser.add_argument ('--all-cells', action='store_true',
+                         help='Run every FPGA cell for each bitstream, not only the key\'s')
+    parser.add_argument ('--check', action='store_true',
+                         help='Compare keys found with the CPU engine')
+    parser.add_argument ('--max-cycles', type=int, default=1 << 32,
+                         help='Give up on a run after this many cycles')
+    parser.add_argument ('--table', type=str,
+                         help='Walk enumerators most likely first (CalcProb table)')
+    parser.add_argument ('--smoke', action='store_true',
+                         help='Walk each key\'s subkeys first and stop at the first key')
+    parser.add_argument ('--build', type=str, default=BUILD, help='Build directory')
+    parser.add_argument ('--fifo-src', type=str, action='append',
+                         help='fifo core sources (file or directory), fusesoc lookup if not given')
+    parser.add_argument ('--seed', type=int, help='Random seed')
+    parser.add_argument ('--json', type=str, help='Save per cell stats')
+    args = parser.parse_args ()
+
+    if args.seed is not None:
+        random.seed (args.seed)
+
+    table = None
+    if args.table:
+        import CalcProb as cp
+        table = cp.ProbTable (path=args.table)
+    batch = Batch (args.attack, CELLS if args.all_cells else None,
+                   args.max_cycles, args.check, args.build, table, args.fifo_src, args.smoke)
+    start = time.time ()
+    for n in range (args.count):
+        rkey = random.randint (1, 2**48 - 1)
+        while args.smoke and args.attack and tuple (fc.Cell (rkey)) not in CELLS:
+            rkey = random.randint (1, 2**48 - 1)
+        batch.Run (rkey)
+        if (n + 1) % 100 == 0:
+            print ('{}/{} {:.1f}s'.format (n + 1, args.count, time.time () - start),
+                   flush=True)
+    batch.Close ()
+    batch.Print ()
+    if args.json:
+        with open (args.json, 'w') as fp:
+            json.dump (batch.Json (), fp, indent=1)
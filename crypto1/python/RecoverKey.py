@@ -4,83 +4,451 @@
 #
 
 import Flexsoc as flex
+import FastCrypto1 as fc
+from BitUtil import int2binarr
+import numpy as np
 import atexit
+import json
+import os
 import time
 
+# (EIDX, OIDX) cells instantiated in Crypto1Attack
+CELLS = [(i, j) for i in range (4) for j in range (5)]
+
+# CSR map of an image, register name of the crypto1_csr generator
+# list in crypto1.core => offset, or (offset, bit) for 1 bit
+# registers packed in a byte. The generator groups registers by
+# type, registers added to the list can move every other one.
+# id comes first in every image.
+ID           = 0x0
+
+# Shipped image (a35_20core_120M.bit), checked on the board
+SHIPPED_CSR = {
+    'id'           : 0x0,
+    'key_lo'       : 0x4,
+    'key_hi'       : 0xC,
+    'done'         : (0xE, 0),
+    'valid'        : (0xE, 1),
+    'bitstream_lo' : 0x10,
+    'bitstream_hi' : 0x14,
+    'start'        : 0x18,
+}
+
+# Register widths, the generator list of crypto1.core
+WIDTH = {
+    'id'           : 32,
+    'bitstream_lo' : 32,
+    'bitstream_hi' : 16,
+    'key_lo'       : 32,
+    'key_hi'       : 16,
+    'start'        : 1,
+    'done'         : 1,
+    'valid'        : 1,
+    'next_lo'      : 32,
+    'next_hi'      : 16,
+    'queued'       : 1,
+    'key_cnt'      : 8,
+    'key_pop'      : 1,
+    'key_job'      : 8,
+    'job'          : 8,
+    'last_job'     : 8,
+    'queue'        : 1,
+    'skip'         : 1,
+    'lost'         : 1,
+    'order'        : 1,
+}
+for n in range (8):
+    WIDTH['eorder_{}'.format (n)] = 16 if n == 7 else 32
+    WIDTH['oorder_{}'.format (n)] = 16 if n == 7 else 32
+
+# Map of the queue image, see LoadCSR
+QUEUE_CSR = None
+
+# Status bits returned by FPGACrypto1.Status
+STATUS = ('done', 'valid', 'queued', 'lost')
+
+# id of the shipped image (a35_20core_120M.bit). Its cores stop
+# at the first key, it has none of the appended registers.
+ID_SHIPPED   = 0xd00dcafe
+
+# id of images with the result FIFO and job queue
+ID_QUEUE     = 0xd00dcaf1
+
+# Read CSR map of the queue image from JSON written from the
+# generated crypto1_csr, {"name": offset or [offset, bit], ...}.
+# Every register of WIDTH must be mapped.
+def ReadCSR (path):
+    with open (path) as f:
+        csr = json.load (f)
+    missing = [r for r in WIDTH if r not in csr]
+    if len (missing):
+        raise ValueError ('{}: no offset for {}'.format (path, ', '.join (missing)))
+    if csr['id'] != ID:
+        raise ValueError ('{}: id not at {}'.format (path, hex (ID)))
+    return {r: tuple (v) if isinstance (v, list) else v for r, v in csr.items ()}
+
+# Map of queue image boards from then on
+def LoadCSR (path):
+    global QUEUE_CSR
+    QUEUE_CSR = ReadCSR (path)
+
+# Board transport for dev: a serial device, 'emu' or 'emu:DELAY'
+# for an emulated board (EmuFlexsoc), 'replay:LOG[:SCALE]' for a
+# recorded session, or an object with the Flexsoc access
+# functions. telemetry attaches a Flexsoc.Telemetry, record logs
+# the transactions (the emulated board then runs behind the wire
+# protocol). A session replays with the CSR map saved next to its
+# log (LOG.csr).
+def Transport (dev, telemetry=False, record=None):
+    if not isinstance (dev, str):
+        t = dev
+    elif dev.split (':')[0] == 'emu':
+        from EmuFlexsoc import EmuFlexsoc, EmuSerial
+        t = EmuFlexsoc (float (dev[4:] or 0))
+        if record:
+            f = flex.Flexsoc (EmuSerial (t), telemetry, record=record)
+            f.csr = t.csr
+            return f
+    elif dev.split (':')[0] == 'replay':
+        path, _, scale = dev[7:].rpartition (':')
+        if not path:
+            path, scale = scale, 1
+        f = flex.Flexsoc (flex.ReplaySerial (path, float (scale)), telemetry, record=record)
+        if os.path.exists (path + '.csr'):
+            f.csr = ReadCSR (path + '.csr')
+        return f
+    else:
+        return flex.Flexsoc (dev, telemetry, record=record)
+    if telemetry and getattr (t, 'telemetry', None) is None:
+        flex.Telemetry ().Attach (t)
+    return t
+
 class FPGACrypto1:
 
-    def __init__ (self, dev):
-        self.flex = flex.Flexsoc (dev)
+    def __init__ (self, dev, cache=None, telemetry=False, record=None, table=None):
+        self.flex = Transport (dev, telemetry, record)
+        self.cache = cache
+        # CalcProb.ProbTable giving the walk order of each job
+        self.table = table
+        # Keys matching every known bit from last Recover
+        self.keys = []
+        # Last Recover gave up before the cores were done
+        self.timeout = False
+        # A core dropped a key since START, cells may not be empty
+        self.lost = False
+        # Shipped image, single key search on the shipped registers
+        ident = self.flex.ReadWord (ID)
+        self.shipped = ident == ID_SHIPPED
+        if self.shipped:
+            self.csr = SHIPPED_CSR
+        elif ident == ID_QUEUE:
+            # The emulated board brings its own map
+            self.csr = getattr (self.flex, 'csr', None) or QUEUE_CSR
+            if self.csr is None:
+                raise IOError ('Image {} needs the CSR map generated for it (--csr)'.format (
+                    hex (ident)))
+        else:
+            raise IOError ('Unknown image id {}'.format (hex (ident)))
+        if record and not self.shipped:
+            with open (record + '.csr', 'w') as f:
+                json.dump (self.csr, f, indent=1)
+        # Last value written to bytes of 1 bit registers
+        self.shadow = {}
         atexit.register (self.cleanup)
         
     def cleanup (self):
         self.flex.Close ()
 
-    def int2binarr (self, val, length):
-        l = [int(x) for x in list(bin(val)[2:])]
-        pad = [0] * (length - len(l))
-        return (pad + l)
-
-    def binarr2int (self, arr):
-        return int (''.join([str(x) for x in arr]), 2)
-
-    def XOR (self, key):
-        return key[47] ^ key[42] ^ key[38] ^ key[37] ^ key[35] ^ key[33] ^ \
-            key[32] ^ key[30] ^ key[28] ^ key[23] ^ key[22] ^ key[20] ^ \
-            key[18] ^ key[12] ^ key[8] ^ key[6] ^ key[5] ^ key[4]
-    
     # Rewind 45 cycles
     def Rewind (self, key):
-        state = self.int2binarr (key, 48)[::-1]
         for n in range (45):
-            a = state[0]
-            state = state[1:48] + [0]
-            state[47] = self.XOR(state) ^ a
-        return self.binarr2int (state[::-1])
+            key = fc.Rollback (key)
+        return key
+
+    # Offset and bit of register
+    def Reg (self, name):
+        off = self.csr[name]
+        return off if isinstance (off, tuple) else (off, 0)
+
+    # Read register
+    def Read (self, name):
+        off, bit = self.Reg (name)
+        width = WIDTH[name]
+        if width == 32:
+            return self.flex.ReadWord (off)
+        if width == 16:
+            return self.flex.ReadHalf (off)
+        return (self.flex.ReadByte (off) >> bit) & ((1 << width) - 1)
+
+    # Write register, 1 bit registers keep the bits last written
+    # to the rest of their byte
+    def Write (self, name, val):
+        off, bit = self.Reg (name)
+        width = WIDTH[name]
+        if width == 32:
+            self.flex.WriteWord (off, val & 0xFFFFFFFF)
+        elif width == 16:
+            self.flex.WriteHalf (off, val & 0xFFFF)
+        elif width == 8:
+            self.flex.WriteByte (off, val & 0xFF)
+        else:
+            byte = (self.shadow.get (off, 0) & ~(1 << bit)) | ((val & 1) << bit)
+            self.shadow[off] = byte
+            self.flex.WriteByte (off, byte)
+
+    # Status bits, bit0 = done, bit1 = valid (FIFO not empty),
+    # bit2 = next job queued, bit3 = key lost. Bits sharing a byte
+    # are read together, done first.
+    def Status (self):
+        ret = 0
+        byte = {}
+        for n, name in enumerate (STATUS):
+            if name in self.csr:
+                off, bit = self.Reg (name)
+                if off not in byte:
+                    byte[off] = self.flex.ReadByte (off)
+                ret |= ((byte[off] >> bit) & 1) << n
+        return ret
+
+    # Write bitstream registers
+    def Bitstream (self, lo, hi, bitstream):
+        self.Write (lo, bitstream & 0xFFFFFFFF)
+        self.Write (hi, (bitstream >> 32) & 0xFFFF)
+
+    # Strobe write only register, hardware acts on rising edge
+    def Strobe (self, name):
+        self.Write (name, 1)
+        self.Write (name, 0)
+
+    # Write walk order of bitstream, taken by the next START or
+    # QUEUE
+    def Order (self, bitstream):
+        if not self.table or self.shipped:
+            return
+        import CalcProb as cp
+        bits = int2binarr (bitstream, 48)
+        for half, name in enumerate (('eorder', 'oorder')):
+            order = cp.OrderBits (self.table.Order (bits, half))
+            for n in range (8):
+                self.Write ('{}_{}'.format (name, n), order >> (32 * n))
+        self.Write ('order', 1)
+
+    # Pop every entry in the result FIFO, returns list of
+    # (job, rewound key)
+    def Pop (self):
+        ret = []
+        cnt = self.Read ('key_cnt')
+        for n in range (cnt):
+            job = self.Read ('key_job')
+            key = self.Read ('key_hi')
+            key <<= 32
+            key |= self.Read ('key_lo')
+            self.Strobe ('key_pop')
+            ret.append ((job, self.Rewind (key)))
+        return ret
+
+    # Key matches bitstream and extra known bits
+    @staticmethod
+    def Check (key, bitstream, extra=None):
+        x = np.array ([key], dtype=np.uint64)
+        return len (fc.Verify (x, int2binarr (bitstream, 48), None, extra)) == 1
+
+    # Keep keys from the result FIFO matching the known bits.
+    # Returns number of keys popped.
+    def Drain (self, bitstream, extra=None):
+        ret = self.Pop ()
+        for job, key in ret:
+            if self.Check (key, bitstream, extra):
+                self.keys.append (key)
+        return len (ret)
+
+    # Shipped image stops at its first key, keep it if it matches
+    # the known bits
+    def First (self, bitstream, extra=None):
+        key = self.Read ('key_hi')
+        key <<= 32
+        key |= self.Read ('key_lo')
+        key = self.Rewind (key)
+        if self.Check (key, bitstream, extra):
+            self.keys.append (key)
     
-    # Recover key from bitstream
-    def Recover (self, bitstream):
+    # Recover key from bitstream. Cores report every key in their
+    # cells, extra (offset, bit) pairs past the bitstream pick the
+    # right one. Setting cancel (threading.Event) stops the cores.
+    def Recover (self, bitstream, extra=None, cancel=None):
+        self.keys = []
+        self.timeout = False
+        self.lost = False
 
-        # Write bitstream low
-        self.flex.WriteWord (0x10, bitstream & 0xFFFFFFFF)
+        # Repeat jobs return from cache
+        if self.cache:
+            key = self.cache.Lookup (bitstream, extra=extra)
+            if key is not None:
+                self.keys = [key]
+                return key
+            empty = self.cache.EmptyCells (bitstream)
+            if all ([c in empty for c in CELLS]):
+                return None
 
-        # Write bitstream high
-        self.flex.WriteHalf (0x14, (bitstream >> 32) & 0xFFFF)
+        # Write bitstream
+        self.Bitstream ('bitstream_lo', 'bitstream_hi', bitstream)
+        self.Order (bitstream)
 
         # Start recovery
-        self.flex.WriteByte (0x18, 0)
+        self.Write ('start', 0)
         time.sleep (0.1)
-        self.flex.WriteByte (0x18, 1)
+        self.Write ('start', 1)
 
-        # Wait for completion
+        # Wait for completion or a key matching all known bits
+        popped = 0
         stat = 0
         for n in range (100):
-            stat = self.flex.ReadByte (0xE)
+            if cancel and cancel.is_set ():
+                self.Write ('start', 0)
+                return None
+            # Read status before draining, every key of a finished
+            # job is in the FIFO by then
+            stat = self.Status ()
             #print ('stat={}'.format (hex (stat)))
+
+            # Check queued keys
+            if stat & 2:
+                if self.shipped:
+                    if stat & 1:
+                        self.First (bitstream, extra)
+                else:
+                    popped += self.Drain (bitstream, extra)
             
-            # Check done bit
-            if stat & 1:
+            # Check done bit, stop early on a matching key
+            if stat & 1 or len (self.keys):
                 break
 
             # Delay
             time.sleep (0.5)
             print ('.', flush=True, end='')
         print ('')
-        if stat == 0:
+        if not (stat & 1) and not len (self.keys):
             print ('Timeout')
+            self.timeout = True
+        if stat & 8:
+            print ('Keys lost')
+            self.lost = True
             
         # Did we recover key?
-        if stat & 2:
-            key = self.flex.ReadHalf (0xC)
-            key <<= 32
-            key |= self.flex.ReadWord (4)
-
-            # Rewind key and return
-            key = self.Rewind (key)
+        if len (self.keys):
+            key = self.keys[0]
+            if self.cache:
+                for k in self.keys:
+                    self.cache.Store (bitstream, k)
             return key
         else:
+            # Every core searched its cell without a hit. Not trusted
+            # on the shipped image, its cores skip subkeys.
+            if self.cache and (stat & 1) and popped == 0 and not self.lost \
+               and not self.shipped:
+                for e, o in CELLS:
+                    self.cache.MarkEmpty (bitstream, e, o)
             return None
 
+    # Queue bitstream in the shadow registers
+    def Queue (self, bitstream):
+        self.Bitstream ('next_lo', 'next_hi', bitstream)
+        self.Order (bitstream)
+        self.Strobe ('queue')
+
+    def RecoverStream (self, jobs, interval=0.1, timeout=50):
+        '''
+        Recover a stream of jobs, each a bitstream or (bitstream,
+        extra). The shadow bitstream is kept full so the cores go
+        straight to the next job when done, a job ends early once
+        a key matching its known bits is found. Yields
+        (bitstream, key or None) as jobs finish. The shipped image
+        has no shadow registers, jobs run one by one there.
+        '''
+        if self.shipped:
+            for j in jobs:
+                bs, extra = j if isinstance (j, tuple) else (j, None)
+                yield bs, self.Recover (bs, extra)
+            return
+
+        jobs = iter (jobs)
+        # Job number => [bitstream, extra, keys, start time]. The
+        # hardware counts jobs from 0 after START, base is the job
+        # number that was started with.
+        pending = {}
+        first = nxt = base = 0
+        more = True
+        self.lost = False
+
+        while more or len (pending):
+
+            # Start or keep shadow slot full
+            stat = self.Status () if len (pending) else 0
+            while more and (len (pending) == 0 or
+                            (len (pending) == 1 and not (stat & 4))):
+                j = next (jobs, None)
+                if j is None:
+                    more = False
+                    break
+                bs, extra = j if isinstance (j, tuple) else (j, None)
+                if self.cache:
+                    key = self.cache.Lookup (bs, extra=extra)
+                    if key is not None:
+                        yield bs, key
+                        continue
+                if len (pending) == 0:
+                    self.Bitstream ('bitstream_lo', 'bitstream_hi', bs)
+                    self.Order (bs)
+                    self.Write ('start', 0)
+                    self.Write ('start', 1)
+                    self.lost = False
+                    base = nxt
+                else:
+                    self.Queue (bs)
+                    stat |= 4
+                pending[nxt] = [bs, extra, [], time.time ()]
+                nxt += 1
+            if len (pending) == 0:
+                break
+            if stat & 8 and not self.lost:
+                print ('Keys lost')
+                self.lost = True
+
+            # Read last finished job before draining, every key of a
+            # job up to last is in the FIFO by then
+            last = self.Read ('last_job')
+
+            # Sort keys into jobs
+            for tag, key in self.Pop ():
+                n = first + ((tag - (first - base)) & 0xFF)
+                if n in pending and self.Check (key, pending[n][0], pending[n][1]):
+                    pending[n][2].append (key)
+
+            # Finish oldest job when searched, matched or timed out
+            bs, extra, keys, start = pending[first]
+            done = ((last - (first - base)) & 0xFF) < 0x80
+            expired = time.time () - start > timeout
+            if done or len (keys) or expired:
+                if not done and first + 1 in pending:
+                    self.Strobe ('skip')
+                if len (keys):
+                    if self.cache:
+                        self.cache.Store (bs, keys[0])
+                    yield bs, keys[0]
+                else:
+                    if expired and not done:
+                        print ('Timeout')
+                    elif self.cache and not self.lost:
+                        for e, o in CELLS:
+                            self.cache.MarkEmpty (bs, e, o)
+                    yield bs, None
+                del pending[first]
+                first += 1
+                if first in pending:
+                    pending[first][3] = time.time ()
+                continue
+            time.sleep (interval)
+
 from Crypto1 import *
 import random
 
@@ -0,0 +1,227 @@
+#!/bin/env python3
+#
+# Streaming sniffer trace parser. Finds plaintext authentications
+# and turns the known nonces into 48 bit bitstream jobs for
+# FPGACrypto1.Recover or the CPU engine.
+#
+# Supported formats:
+#  - Proxmark3 binary trace (tracelog records)
+#  - Proxmark3 'trace list' text output
+#
+
+import FastCrypto1 as fc
+from BitUtil import binarr2int
+import numpy as np
+import argparse
+import mmap
+import struct
+
+# ISO14443-A CRC
+def CRC_A (data):
+    crc = 0x6363
+    for x in data:
+        b = (x ^ crc) & 0xFF
+        b = (b ^ (b << 4)) & 0xFF
+        crc = (crc >> 8) ^ (b << 8) ^ (b << 3) ^ (b >> 4)
+    return crc
+
+def CheckCRC (data):
+    if len (data) < 3:
+        return False
+    crc = CRC_A (data[:-2])
+    return data[-2] == (crc & 0xFF) and data[-1] == (crc >> 8)
+
+class Frame:
+    def __init__ (self, tag, data, par):
+        self.tag = tag
+        self.data = bytes (data)
+        # On air parity bit for each byte
+        self.par = par
+
+    def Word (self, n=0):
+        return int.from_bytes (self.data[n:n+4], 'big')
+
+# Proxmark3 tracelog: u32 timestamp, u16 duration,
+# u16 length (bit 15 = tag response), data, parity bytes
+def ReadBinary (mm):
+    off = 0
+    while off + 8 <= len (mm):
+        _, _, dlen = struct.unpack_from ('<IHH', mm, off)
+        tag = bool (dlen & 0x8000)
+        dlen &= 0x7FFF
+        off += 8
+        plen = (dlen + 7) // 8
+        if dlen == 0 or off + dlen + plen > len (mm):
+            break
+        data = mm[off:off+dlen]
+        pbytes = mm[off+dlen:off+dlen+plen]
+        par = [(pbytes[n >> 3] >> (7 - (n & 7))) & 1 for n in range (dlen)]
+        off += dlen + plen
+        yield Frame (tag, data, par)
+
+# 'trace list' text: ... | Src | Data | CRC | Annotation
+# A '!' after a byte marks parity differing from odd parity
+def ReadText (mm):
+    for line in iter (mm.readline, b''):
+        cols = line.decode (errors='ignore').split ('|')
+        if len (cols) < 4:
+            continue
+        src = cols[2].strip ()
+        if src not in ('Rdr', 'Tag'):
+            continue
+        data = []
+        par = []
+        for tok in cols[3].split ():
+            err = tok.endswith ('!')
+            try:
+                b = int (tok.rstrip ('!'), 16)
+            except ValueError:
+                break
+            data.append (b)
+            par.append (fc.OddParity8 (b) ^ err)
+        if len (data):
+            yield Frame (src == 'Tag', data, par)
+
+def ReadFrames (path):
+    with open (path, 'rb') as fp:
+        with mmap.mmap (fp.fileno (), 0, access=mmap.ACCESS_READ) as mm:
+            # Text traces start with printable characters
+            head = mm[0:64]
+            if all (32 <= x < 127 or x in (9, 10, 13) for x in head):
+                yield from ReadText (mm)
+            else:
+                yield from ReadBinary (mm)
+
+class Job:
+    '''
+    Known keystream from a plaintext authentication. The bitstream
+    is the first 48 bits of ks2|ks3 in FPGACrypto1.Recover order,
+    verify holds the remaining known bits.
+    '''
+    def __init__ (self, uid, nt, nr_enc, ks):
+        self.uid = uid
+        self.nt = nt
+        self.nr_enc = nr_enc
+        self.ks = ks
+        self.bitstream = binarr2int (ks[0:48])
+        self.verify = ks[48:]
+
+    # Convert recovered state at bitstream start into sector key
+    def Key (self, state):
+        x = fc.RollbackWord (state, self.nr_enc, True)
+        x = fc.RollbackWord (x, self.uid ^ self.nt)
+        return fc.StateToKey (x)
+
+class TraceParser:
+    '''
+    Pair reader/tag frames of three pass authentications:
+    AUTH(blk) -> nt -> {nr}{ar} -> {at}
+    '''
+    def __init__ (self):
+        self.seen = set ()
+        self.Reset ()
+
+    def Reset (self):
+        self.uid = None
+        self.state = 'idle'
+
+    def Process (self, f):
+        d = f.data
+
+        # REQA/WUPA start a new session
+        if not f.tag and len (d) == 1 and d[0] in (0x26, 0x52):
+            self.Reset ()
+            return None
+
+        # SELECT carries uid of each cascade level
+        if not f.tag and len (d) == 9 and d[0] in (0x93, 0x95, 0x97) \
+           and d[1] == 0x70 and CheckCRC (d):
+            self.uid = int.from_bytes (d[2:6], 'big')
+            return None
+
+        if self.state == 'idle':
+            if not f.tag and len (d) == 4 and d[0] in (0x60, 0x61) and CheckCRC (d):
+                self.state = 'auth'
+        elif self.state == 'auth':
+            if f.tag and len (d) == 4:
+                self.nt = f.Word ()
+                self.state = 'nt'
+            else:
+                self.state = 'idle'
+        elif self.state == 'nt':
+            if not f.tag and len (d) == 8:
+                self.nr_enc = f.Word (0)
+                self.ar = f
+                self.state = 'nr'
+            else:
+                self.state = 'idle'
+        elif self.state == 'nr':
+            # Session stays encrypted until next REQA/WUPA
+            self.state = 'encrypted'
+            if f.tag and len (d) == 4 and self.uid is not None:
+                return self.Extract (self.ar, f)
+        return None
+
+    def Extract (self, ar, at):
+        ar_ks = ar.Word (4) ^ fc.PrngSuccessor (self.nt, 64)
+        at_ks = at.Word (0) ^ fc.PrngSuccessor (self.nt, 96)
+        ks = fc.WordBits (ar_ks) + fc.WordBits (at_ks)
+
+        # Parity bit of each byte is encrypted with the keystream
+        # bit following it. Reject misaligned pairs, keep the last
+        # bit as an extra verify bit.
+        par = ar.par[4:8] + at.par[0:4]
+        for n in range (7):
+            if par[n] ^ fc.OddParity8 (self.Plain (n)) != ks[8 * (n + 1)]:
+                return None
+        ks.append (par[7] ^ fc.OddParity8 (self.Plain (7)))
+        return Job (self.uid, self.nt, self.nr_enc, ks)
+
+    # Plaintext ar/at byte n
+    def Plain (self, n):
+        if n < 4:
+            return (fc.PrngSuccessor (self.nt, 64) >> (24 - 8 * n)) & 0xFF
+        return (fc.PrngSuccessor (self.nt, 96) >> (24 - 8 * (n - 4))) & 0xFF
+
+    # Deduplicated jobs as they appear in the trace
+    def Jobs (self, path):
+        for f in ReadFrames (path):
+            job = self.Process (f)
+            if job and job.bitstream not in self.seen:
+                self.seen.add (job.bitstream)
+                yield job
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('trace', type=str, nargs='+', help='Trace files')
+    parser.add_argument ('--dev', type=str,
+                         help='Recover keys on FPGA attached to serial device')
+    parser.add_argument ('--cpu', action='store_true',
+                         help='Recover keys on CPU')
+    parser.add_argument ('--csr', type=str,
+                         help='CSR map of queue image boards (JSON from the generated crypto1_csr)')
+    args = parser.parse_args ()
+
+    crack = None
+    if args.dev:
+        from RecoverKey import FPGACrypto1, LoadCSR
+        if args.csr:
+            LoadCSR (args.csr)
+        crack = FPGACrypto1 (args.dev)
+
+    tp = TraceParser ()
+    for path in args.trace:
+        for job in tp.Jobs (path):
+            print ('uid={} nt={} bitstream={}'.format (
+                hex (job.uid), hex (job.nt), hex (job.bitstream)), flush=True)
+            if crack:
+                state = crack.Recover (job.bitstream)
+                states = [] if state is None else [state]
+                states = fc.Verify (np.array (states, dtype=np.uint64), job.ks)
+            elif args.cpu:
+                states = fc.RecoverStates (job.ks)
+            else:
+                continue
+            for s in states:
+                print ('Found key: {}'.format (hex (job.Key (int (s)))))
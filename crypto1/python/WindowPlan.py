@@ -0,0 +1,169 @@
+#!/bin/env python3
+#
+# Pick the 48 bit window of a longer keystream to search. Each
+# window gives the probability table a different context, so the
+# (EIDX, OIDX) cell of its state is more or less predictable. The
+# score depends on what the searcher does with the cells:
+#
+#  - fixed cells (the board, RecoverKey.CELLS): percent chance the
+#    state is outside them and the board misses it
+#  - cells walked most likely first (HybridCrypto1, Cluster,
+#    sim.py with a table): expected percent of cells walked before
+#    the one holding the state
+#
+# An unordered search of all 256 cells (CPUCrypto1) costs the same
+# on every window, there is nothing to plan for it. The search runs
+# on the best window, the bits outside it verify the candidates and
+# the state found is rewound to the first keystream bit.
+#
+# Usage:
+#  WindowPlan.py [--len 64] [--count N] [--table NPZ] [--board]
+#
+
+import CalcProb as cp
+import FastCrypto1 as fc
+import numpy as np
+import argparse
+import json
+import random
+
+class WindowPlanner:
+    '''
+    Scores windows with a trained CalcProb.ProbTable, or with
+    crypto1_prob.json (Crypto1Prob contexts) if none is given.
+    cells are the fixed cells of the searcher, None if it walks
+    all cells most likely first. Windows whose context runs past
+    the keystream are not scored.
+    '''
+    def __init__ (self, table=None, json_file=cp.PROB_JSON, cells=None):
+        self.table = table
+        self.mask = None
+        if cells is not None:
+            self.mask = np.zeros (256, dtype=bool)
+            for e, o in cells:
+                self.mask[e * 16 + o] = True
+        if table:
+            self.offsets = table.offsets
+        else:
+            with open (json_file, 'r') as fp:
+                self.plist = np.array (json.load (fp))
+            self.offsets = cp.CONTEXTS[8]
+
+    # Cell index probabilities of the half starting at bit first
+    def CellProb (self, bits, first):
+        if self.table:
+            return self.table.CellProb (self.table.Context (bits, first))
+        ctx = 0
+        for o in self.offsets:
+            ctx = (ctx << 1) | bits[first + o]
+        return self.plist[ctx]
+
+    # Percent chance the state of window w is outside the fixed
+    # cells, else expected percent of the 256 cells walked
+    def Cost (self, bits, w):
+        p = np.outer (self.CellProb (bits, w), self.CellProb (bits, w + 1)).ravel ()
+        if self.mask is not None:
+            return float ((1 - p[self.mask].sum () / p.sum ()) * 100)
+        p = np.sort (p)[::-1]
+        return float ((np.arange (256) * p).sum () / p.sum () / 255 * 100)
+
+    # [(cost, offset)] cheapest first. Without room for the context
+    # of any window it falls back to window 0 at a nan cost.
+    def Plan (self, bits):
+        if len (bits) < 48:
+            raise ValueError ('At least 48 keystream bits required, got {}'.format (len (bits)))
+        last = len (bits) - 48
+        scored = min (last, len (bits) - max (self.offsets) - 2)
+        if scored < 0:
+            return [(float ('nan'), 0)]
+        return sorted ([(self.Cost (bits, w), w) for w in range (scored + 1)])
+
+    def Recover (self, search, bits):
+        '''
+        Run search (bits48, extra) on the best window, extra holds
+        the (offset, bit) pairs past it. search returns states at
+        the window start, states matching every bit are returned
+        rewound to bit 0.
+        '''
+        cost, w = self.Plan (bits)[0]
+        self.window = w
+        self.cost = cost
+        extra = [(n - w, b) for n, b in enumerate (bits) if n >= w + 48]
+        x = np.array (search (bits[w:w+48], extra), dtype=np.uint64)
+        if len (x) == 0:
+            return []
+        return fc.Verify (fc.Jump (x, -w), bits).tolist ()
+
+if __name__ == '__main__':
+
+    parser = argparse.ArgumentParser ()
+    parser.add_argument ('--len', type=int, default=64, help='Keystream length')
+    parser.add_argument ('--count', type=int, default=200, help='Number of random keys')
+    parser.add_argument ('--table', type=str, help='Trained CalcProb table (default crypto1_prob.json)')
+    parser.add_argument ('--board', action='store_true',
+                         help='Plan for the board cells instead of a most likely first walk')
+    parser.add_argument ('--recover', type=int, default=0,
+                         help='Also recover N keys on the CPU through the planner')
+    args = parser.parse_args ()
+
+    from RecoverKey import CELLS
+    plan = WindowPlanner (cp.ProbTable (path=args.table) if args.table else None,
+                          cells=CELLS if args.board else None)
+
+    # Actual percent of cells walked (or of states outside the
+    # board cells) on the first and the planned window
+    first = 0.0
+    best = 0.0
+    expected = 0.0
+    for n in range (args.count):
+        x = random.randint (1, 2**48 - 1)
+        bits = []
+        s = x
+        states = []
+        for _ in range (args.len):
+            states.append (s)
+            b, s = fc.Step (s)
+            bits.append (b)
+        windows = plan.Plan (bits)
+        if np.isnan (windows[0][0]):
+            print ('No window can be scored, need {} bits'.format (max (plan.offsets) + 2))
+            break
+        cost, w = windows[0]
+        expected += cost
+        for attr, off in [('first', 0), ('best', w)]:
+            e = plan.CellProb (bits, off)
+            o = plan.CellProb (bits, off + 1)
+            order = sorted ([(-e[i] * o[j], i, j) for i in range (16) for j in range (16)])
+            cell = tuple (int (c) for c in fc.Cell (states[off]))
+            if args.board:
+                rank = 0 if cell in CELLS else 100
+            else:
+                rank = [(i, j) for _, i, j in order].index (cell) / 255 * 100
+            if attr == 'first':
+                first += rank
+            else:
+                best += rank
+    print ('{}: first window {:.2f}%, planned window {:.2f}% (expected {:.2f}%)'.format (
+        'Missed by the board' if args.board else 'Cells searched',
+        first / args.count, best / args.count, expected / args.count))
+
+    # The CPU stands in for the board with --board, else it checks
+    # the window plumbing only (all cells are searched)
+    if args.recover:
+        from CPUCrypto1 import CPUCrypto1, ALL_CELLS
+        from BitUtil import binarr2int
+        cpu = CPUCrypto1 (cells=CELLS if args.board else ALL_CELLS)
+        def Search (bits, extra):
+            cpu.Recover (binarr2int (bits), 48, extra)
+            return cpu.keys
+        ok = 0
+        for n in range (args.recover):
+            x = random.randint (1, 2**48 - 1)
+            bits = []
+            s = x
+            for _ in range (args.len):
+                b, s = fc.Step (s)
+                bits.append (b)
+            ok += x in plan.Recover (Search, bits)
+            print ('{}: window={} cost={:.2f}%'.format (n, plan.window, plan.cost), flush=True)
+        print ('{}/{} recovered'.format (ok, args.recover))
@@ -4,18 +4,18 @@
 #
 
 import sys
+import os
+import json
+import queue
 import argparse
-from multiprocessing import Process, Queue
+from multiprocessing import Process, Queue, Semaphore, shared_memory
+import numpy as np
 import time
+from BitUtil import int2binarr, binarr2int, Reverse8, ReverseBits, Merge
+import FastCrypto1 as fc
 
-# Helpers
-def binarr2int (arr):
-    return int (''.join([str(x) for x in arr]), 2)
-
-def int2binarr (val, length):
-    l = [int(x) for x in list(bin(val)[2:])]
-    pad = [0] * (length - len(l))
-    return (pad + l)
+# Filter nibble lookup, subkey bit 0 is the NLF MSB
+REV4 = [Reverse8 (n) >> 4 for n in range (16)]
 
 class NLF:
     def __init__(self, name, fn, width):
@@ -107,16 +107,20 @@ class Enumerator:
     The iteration is composed of the following
     (although this is arbitrary):
     [4 Fc][3 Fb1][3 Fa1][3 Fa2][3 Fb2][3 Fa3]
+    Given order (B20Enum counters, e.g. ProbTable.Positions) the
+    values are walked in that order instead.
     '''
-    def __init__(self, index, bit_in):
-        self.nla = NLF(0x9E98, 4)
-        self.nlb = NLF(0xB48E, 4)
-        self.nlc = NLF(0xEC57E80A, 5)
+    def __init__(self, index, bit_in, start=0, order=None):
+        self.nla = NLF('NLA', 0x9E98, 4)
+        self.nlb = NLF('NLB', 0xB48E, 4)
+        self.nlc = NLF('NLC', 0xEC57E80A, 5)
         self.Fa = [self.nla.enum(0), self.nla.enum(1)]
         self.Fb = [self.nlb.enum(0), self.nlb.enum(1)]
         self.Fc = [self.nlc.enum(0), self.nlc.enum(1)]
         self.bit_in = bit_in
         self.index = index
+        self.start = start
+        self.order = order
 
     def Test(self, val):
         s = int2binarr (val, 20)
@@ -130,13 +134,19 @@ class Enumerator:
         return self.nlc.compute (layer1)
 
     def __iter__(self):
-        self.idx = 0
+        self.idx = self.start
         return self
     
     def __next__(self):
         if self.idx >= 2**15:
             raise StopIteration
         
+        # Ordered walk, Pipeline reverses back to a 20 bit half
+        if self.order is not None:
+            ctr = int (self.order[self.idx])
+            self.idx += 1
+            return ReverseBits (int (fc.Key20 (self.Fc[self.bit_in][self.index], ctr)), 20)
+
         # Get Fc
         Fc = int2binarr (self.Fc[self.bit_in][self.index], 5)
         k0 = self.Fa[Fc[0]][(self.idx >> 12) & 7]
@@ -158,228 +168,465 @@ class Enumerator:
 
 class Pipeline (Process):
     ''' 
-    Takes index and 4 bits of cipher output.
-    Produces 16 replicated keystreams.
+    Takes index and 5 bits of cipher output.
+    Produces 24 bit subkeys for every enumerated 20 bit value.
+    Subkeys are ints with the newest bit in bit 0 as in GenSubkey.
     '''
-    def __init__ (self, index, bits=[]):
+    def __init__ (self, index, bits=[], order=None):
         Process.__init__(self)
         self.bits = bits
-        self.nla = NLF(0x9E98, 4)
-        self.nlb = NLF(0xB48E, 4)
-        self.nlc = NLF(0xEC57E80A, 5)
+        # Enumerator walk order, counting up if None
+        self.order = order
+        self.nla = NLF('NLA', 0x9E98, 4)
+        self.nlb = NLF('NLB', 0xB48E, 4)
+        self.nlc = NLF('NLC', 0xEC57E80A, 5)
         self.index = index
+        self.pos = 0
         
     def ComputeNLF (self, s):
-        #s = int2binarr (val, 24)
         # Note: This is on split keys (odd/even) hence the indices
-        layer1 = [self.nla.compute ([s[0],  s[1],  s[2],  s[3]]),
-                  self.nlb.compute ([s[4],  s[5],  s[6],  s[7]]),
-                  self.nla.compute ([s[8],  s[9],  s[10], s[11]]),
-                  self.nla.compute ([s[12], s[13], s[14], s[15]]),
-                  self.nlb.compute ([s[16], s[17], s[18], s[19]])]
+        layer1 = (self.nla.compute (REV4[s & 15]) << 4) | \
+            (self.nlb.compute (REV4[(s >> 4) & 15]) << 3) | \
+            (self.nla.compute (REV4[(s >> 8) & 15]) << 2) | \
+            (self.nla.compute (REV4[(s >> 12) & 15]) << 1) | \
+            self.nlb.compute (REV4[(s >> 16) & 15])
         return self.nlc.compute (layer1)
 
+    # Shift in one new bit, keep keys matching output bit
+    def Extend (self, keys, bit):
+        ret = []
+        for k in keys:
+            k <<= 1
+            if self.ComputeNLF (k) == bit:
+                ret.append (k)
+            if self.ComputeNLF (k | 1) == bit:
+                ret.append (k | 1)
+        return ret
+
     def ComputeShifted(self, b0, bits=[]):
-            # Possibles
-            stage1 = []
-            stage2 = []
-            stage3 = []
-            stage4 = []
-
-            ba = int2binarr (b0, 20)
-            print ('Input={}'.format (ba))
-            
-            # Check bit0
-            if self.ComputeNLF (ba[0:19] + [0]) == bits[0]:
-                stage1.append (binarr2int (ba[0:20] + [0]))
-            if self.ComputeNLF (ba[0:19] + [1]) == bits[0]:
-                stage1.append (binarr2int (ba[0:20] + [1]))
-            print ('stage1:')
-            for x in stage1:
-                print ('\t{}'.format (hex(x)))
-            
-            # Check bit1
-            for b1 in stage1:
-                ba = int2binarr (b1, 21)
-                if self.ComputeNLF (ba[0:19] + [0])  == bits[1]:
-                    stage2.append (binarr2int (ba[0:21] + [0]))
-                if self.ComputeNLF (ba[0:19] + [1]) == bits[1]:
-                    stage2.append (binarr2int (ba[0:21] + [1]))
-            print ('stage2:')
-            for x in stage2:
-                print ('\t{}'.format (hex(x)))
-            
-            # Check bit2
-            for b2 in stage2:
-                ba = int2binarr (b2, 22)
-                if self.ComputeNLF (ba[0:19] + [0])  == bits[1]:
-                    stage3.append (binarr2int (ba[0:22] + [0]))
-                if self.ComputeNLF (ba[0:19] + [1]) == bits[1]:
-                    stage3.append (binarr2int (ba[0:22] + [1]))
-            print ('stage3:')
-            for x in stage3:
-                print ('\t{}'.format (hex(x)))
-
-            # Check bit3
-            for b3 in stage3:
-                ba = int2binarr (b3, 23)
-                if self.ComputeNLF (ba[0:19] + [0])  == bits[1]:
-                    stage4.append (binarr2int (ba[0:23] + [0]))
-                if self.ComputeNLF (ba[0:19] + [1]) == bits[1]:
-                    stage4.append (binarr2int (ba[0:23] + [1]))
-            print ('stage4:')
-            for x in stage4:
-                print ('\t{}'.format (hex(x)))
-
-            # Debug only
-            #sys.exit (0)
-            
+            # Extend enumerated value once per output bit, same
+            # as GenSubkey EXTEND1-4
+            keys = [ReverseBits (b0, 20)]
+            #print ('Input={}'.format (keys[0]))
+            for n, b in enumerate (bits):
+                keys = self.Extend (keys, b)
+                #print ('stage{}:'.format (n + 1))
+                #for x in keys:
+                #    print ('\t{}'.format (hex(x)))
+                if len (keys) == 0:
+                    break
+
             # Return results
             # Stage4 list now contains potentials (up to 8) with enough bits (24) to
-            # combine with opposite bits and test using XOR feedback.
-            return stage4
+            # combine with opposite bits and test against the bitstream.
+            return keys
         
-    def run (self):
+    def run (self, start=0):
         # Create enumerator to match bit 0
-        enum = Enumerator (self.index, self.bits[0])
+        enum = Enumerator (self.index, self.bits[0], start, self.order)
         for b0 in enum:
 
-            print ('Enum: {}'.format(hex (b0)))
+            #print ('Enum: {}'.format(hex (b0)))
 
-            # Pad b0 4 bits
-            #b0 <<= 4
-            
             # Cycle through and compute shifted
             ret = self.ComputeShifted (b0, self.bits[1:5])
             if len (ret) > 0:
+                # Enumerator position of results
+                self.pos = enum.idx - 1
                 yield ret
 
+class RingBuf:
+    '''
+    Shared memory ring of fixed size uint32 blocks with one writer
+    and several readers, each reader sees every block as with the
+    RTL RingBuf. A slot is a count word followed by BLOCK
+    (position, subkey) word pairs, a zero count ends the stream.
+    Readers get a numpy view of the slot, nothing is pickled.
+    '''
+    BLOCK = 512
+
+    def __init__ (self, readers, depth=64):
+        self.depth = depth
+        self.words = 1 + 2 * self.BLOCK
+        self.shm = shared_memory.SharedMemory (create=True,
+                                               size=depth * self.words * 4)
+        self.free = [Semaphore (depth) for n in range (readers)]
+        self.full = [Semaphore (0) for n in range (readers)]
+        self.pending = []
+        self.slot = 0
+        self.Map ()
+
+    def Map (self):
+        self.buf = np.ndarray ((self.depth, self.words), dtype=np.uint32,
+                               buffer=self.shm.buf)
+
+    # Views can't be pickled, remap in the child
+    def __getstate__ (self):
+        state = self.__dict__.copy ()
+        del state['buf']
+        return state
+
+    def __setstate__ (self, state):
+        self.__dict__.update (state)
+        self.Map ()
+
+    # Writer side
+    def Put (self, pos, key):
+        self.pending += [pos, key]
+        if len (self.pending) == 2 * self.BLOCK:
+            self.Flush ()
+
+    def Flush (self, end=False):
+        if len (self.pending) == 0 and not end:
+            return
+        # Wait until every reader is done with the slot
+        for f in self.free:
+            f.acquire ()
+        self.buf[self.slot, 0] = len (self.pending) >> 1
+        self.buf[self.slot, 1:1+len (self.pending)] = self.pending
+        for f in self.full:
+            f.release ()
+        self.pending = []
+        self.slot = (self.slot + 1) % self.depth
+
+    def Close (self):
+        self.Flush ()
+        self.Flush (end=True)
+
+    # Reader side, yields (cnt, 2) views. The slot is handed back
+    # once the caller asks for the next block.
+    def Read (self, reader):
+        slot = 0
+        while True:
+            self.full[reader].acquire ()
+            cnt = int (self.buf[slot, 0])
+            if cnt == 0:
+                return
+            yield self.buf[slot, 1:1+2*cnt].reshape (cnt, 2)
+            self.free[reader].release ()
+            slot = (slot + 1) % self.depth
+
+    # Owner releases the segment
+    def Unlink (self):
+        del self.buf
+        self.shm.close ()
+        self.shm.unlink ()
+
 class EvenPipeline (Pipeline):
-    def __init__ (self, index, bits=[], q=[]):
-        super (EvenPipeline, self).__init__ (index, bits)
-        self.q = q
+    def __init__ (self, index, bits=[], ring=None, start=0, order=None):
+        super (EvenPipeline, self).__init__ (index, bits, order)
+        self.ring = ring
+        # Enumerator position to resume from
+        self.first = start
 
     def run (self):
 
         cnt = 0
-        for klist in super (EvenPipeline, self).run ():
-            # Send results to each queue
-            for k in klist:
-                for qi in self.q:
-                    qi.put (k)
-                print ('=> Passed: {}'.format(hex (k)))
-                #self.q[0].put (k)
-                #while not self.q[0].empty():
-                #    time.sleep (0.1)
+        for klist in super (EvenPipeline, self).run (self.first):
+            # Send results to ring buffer tagged with position
+            for n, k in enumerate (klist):
+                self.ring.Put ((self.pos << 4) | n, k)
+                #print ('=> Passed: {}'.format(hex (k)))
                 cnt += 1
-            #print ('\b\b\b\b\b{:.2f}%'.format ((cnt/2**15) * 100))
         print ('Even cnt={}'.format (cnt), flush=True)
                 
-        # Send none to terminate
-        for qi in self.q:
-            qi.put (None)
-        #self.q[0].put (None)
+        # Zero length block to terminate
+        self.ring.Close ()
         
 class OddPipeline (Pipeline):
-    def __init__ (self, index, sbits=[], vbits=[], q=None):
-        super (OddPipeline, self).__init__ (index, sbits)
-        self.q = q
-        self.vbits = vbits
-        
-    def CheckXOR (self, key):
-        return key[47] ^ key[42] ^ key[38] ^ key[37] ^ key[35] ^ key[33] ^ \
-            key[32] ^ key[30] ^ key[28] ^ key[23] ^ key[22] ^ key[20] ^ \
-            key[18] ^ key[12] ^ key[8] ^ key[6] ^ key[5] ^ key[4] ^ key[0] == 0
+    '''
+    The odd subkeys of a cell only depend on the cell and the odd
+    bitstream bits, so they are walked once and kept in arrays.
+    Each block of even subkeys from the ring is then joined with
+    all of them at once (merged and verified as numpy arrays)
+    instead of rerunning the odd enumerator per even subkey.
+    '''
+    # Merged states per batch
+    JOIN = 1 << 20
+
+    def __init__ (self, eidx, index, sbits=[], known=[], ring=None, reader=0,
+                  res=None, resume=None, interval=60, order=None):
+        super (OddPipeline, self).__init__ (index, sbits, order)
+        self.ring = ring
+        self.reader = reader
+        self.res = res
+        self.eidx = eidx
+        # (cycle, bit) pairs to verify counted from the merge point
+        self.known = known
+        # (even position, odd position, cnt) to resume from
+        self.resume = resume
+        self.interval = interval
+
+    # Interleave into 48 bit state 9 cycles in, odd subkey holds
+    # the filter taps (even state bits)
+    @staticmethod
+    def Merge (even, odd):
+        return Merge (odd, even)
+
+    # Keep states matching the known bits, rewound to the first bit
+    def Verify (self, x):
+        x = fc.Verify (x, [], None, self.known)
+        for n in range (9):
+            x = fc.VRollback (x)
+        return x
+
+    # Enumerator positions and odd subkeys in walk order
+    def Candidates (self):
+        pos = []
+        keys = []
+        for klist in super (OddPipeline, self).run ():
+            pos += [self.pos] * len (klist)
+            keys += klist
+        return np.array (pos, dtype=np.int64), np.array (keys, dtype=np.uint64)
+
+    # Join even subkeys with odd subkeys, returns first key found
+    # in (even, odd) walk order or None
+    def Join (self, even, odd):
+        x = self.Merge (even[:, None], odd[None, :]).ravel ()
+        x = self.Verify (x)
+        return int (x[0]) if len (x) else None
+
+    # Even positions and subkeys of each ring buffer block
+    def Blocks (self):
+        for blk in self.ring.Read (self.reader):
+            yield [(w >> 4, w & 15) for w in blk[:, 0].tolist ()], \
+                blk[:, 1].astype (np.uint64)
 
     def run (self):
-        # Get next element from even queue
-        while True:
-            even = self.q.get()
-            if even == None:
-                print ('Odd done')
-                return
-            even = int2binarr (even, 24)
-            
-            # Rotate even right by one
-            even = [even[23]] + even[0:23]
-            
-            # Run search space of 32768 for each element
-            cnt = 0
-            xor_passed = 0
-            for klist in super (OddPipeline, self).run ():
-                for k in klist:
-
-                    #print ('Odd={}'.format (hex (k)))
-                    # Convert to bin array
-                    odd = int2binarr (k, 24)
-
-                    # Merge keys
-                    key = [item for sublist in zip(even, odd) for item in sublist]
-
-                    # Check XOR
-                    if self.CheckXOR (key):
-                        xor_passed += 1
-                    else:
-                        continue
-                    
-                    # Generate output with Crypto1 to compare
-                    # Skip first 10 bits
-                    cipher = Crypto1 (key[::-1])
-                    out = cipher.Output (len (self.vbits))
-                    if out == self.vbits:
-                        cipher.Reverse (len(self.vbits) + 10)
-                        key = cipher.State ()[::-1]
-                        print ('Found key={}'.format (hex (binarr2int (key))))
-                        sys.exit (0)
-
-                    cnt += 1
-            print ('Odd cnt={} XOR passed={}'.format (cnt, xor_passed), flush=True)
+        last = time.time ()
+        cnt = 0
+        if self.resume:
+            cnt = self.resume[2]
+        opos, odd = self.Candidates ()
+        print ('Odd cnt={}'.format (len (odd)), flush=True)
+        batch = max (1, self.JOIN // max (1, len (odd)))
+
+        for epos, even in self.Blocks ():
+
+            # Skip evens completed before checkpoint, finish the
+            # one in progress from its odd position
+            if self.resume:
+                n = 0
+                while n < len (epos) and epos[n] < self.resume[0]:
+                    n += 1
+                if n < len (epos) and epos[n] == self.resume[0]:
+                    part = odd[opos >= self.resume[1]]
+                    key = self.Join (even[n:n+1], part)
+                    cnt += len (part)
+                    if key is not None:
+                        print ('Found key={}'.format (hex (key)))
+                        self.res.put (('found', self.eidx, self.index, key))
+                        return
+                    n += 1
+                if n == len (epos):
+                    continue
+                self.resume = None
+                epos = epos[n:]
+                even = even[n:]
+
+            for n in range (0, len (even), batch):
+
+                # Report progress for checkpoint
+                if time.time () - last > self.interval:
+                    self.res.put (('progress', self.eidx, self.index,
+                                   epos[n], 0, cnt))
+                    last = time.time ()
+
+                key = self.Join (even[n:n+batch], odd)
+                cnt += len (even[n:n+batch]) * len (odd)
+                if key is not None:
+                    print ('Found key={}'.format (hex (key)))
+                    self.res.put (('found', self.eidx, self.index, key))
+                    return
+
+        print ('Odd done cnt={}'.format (cnt))
+        self.res.put (('empty', self.eidx, self.index))
+
+class Checkpoint:
+    '''
+    Per cell search position saved periodically so a killed
+    search resumes with bounded lost work. Each cell holds the
+    position (enumerator idx, subkey) of the even subkey being
+    searched, the odd enumerator idx reached and the candidate
+    count, or done once searched.
+    '''
+    def __init__ (self, path, bitstream, interval=60):
+        self.path = path
+        self.bitstream = bitstream
+        self.interval = interval
+        self.last = time.time ()
+        self.cells = {}
+        try:
+            with open (path, 'r') as fp:
+                ckpt = json.load (fp)
+            if int (ckpt['bitstream'], 0) == bitstream:
+                self.cells = ckpt['cells']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def Get (self, e, o):
+        c = self.cells.get ('{},{}'.format (e, o))
+        if c is None or c == 'done':
+            return None
+        return ((c[0], c[1]), c[2], c[3])
+
+    def IsDone (self, e, o):
+        return self.cells.get ('{},{}'.format (e, o)) == 'done'
+
+    def Update (self, e, o, epos, opos, cnt):
+        self.cells['{},{}'.format (e, o)] = [epos[0], epos[1], opos, cnt]
+
+    def Done (self, e, o):
+        self.cells['{},{}'.format (e, o)] = 'done'
+
+    # Write to temp file and rename so a kill never leaves a
+    # partial checkpoint
+    def Save (self, force=False):
+        if not force and (time.time () - self.last) < self.interval:
+            return
+        tmp = self.path + '.tmp'
+        with open (tmp, 'w') as fp:
+            json.dump ({'bitstream' : hex (self.bitstream),
+                        'cells' : self.cells}, fp)
+            fp.flush ()
+            os.fsync (fp.fileno ())
+        os.replace (tmp, self.path)
+        self.last = time.time ()
+
+    def Remove (self):
+        if os.path.exists (self.path):
+            os.remove (self.path)
 
 class Crypto1Attack:
     '''
-    Attack crypto1 cipher using pipelined approach
+    Attack crypto1 cipher using pipelined approach. Extra holds
+    sparse known (offset, bit) pairs past the bitstream such as
+    encrypted parity bits, checked along with the bitstream.
+    With a CalcProb.ProbTable cells and enumerator positions are
+    searched most likely first.
     '''
-    def __init__(self, bitstream):
+    def __init__(self, bitstream, cache=None, ckpt=None, extra=None, prob=None):
         search = bitstream[0:10]
-        self.verify = bitstream[10:]
+        self.bitstream = binarr2int (bitstream[0:48])
+        known, extra = fc.Contiguous (bitstream, extra)
+        self.extra = extra
+        self.known = [(n - 9, b) for n, b in enumerate (known) if n >= 9] + \
+            [(n - 9, b) for n, b in extra]
         self.even = search[0::2]
         self.odd = search[1::2]
-        
-    def Attack(self):
-
-        epipe = []
-        opipe = []
-        q = [Queue() for x in range (256)]
-
-        '''
-        # Setup 16 even bit pipelines
-        for n in range (16):
-            epipe.append (EvenPipeline (n, self.even, q[n*16:n*16+16]))
-            
-        # Setup 256 odd pipelines
-        for n in range (256):
-            opipe.append (OddPipeline (n % 16, self.odd, self.verify, q[n]))
+        self.cache = cache
+        self.ckpt = ckpt
+        self.prob = None
+        self.bits = bitstream
+        if prob and len (bitstream) > max (prob.offsets) + 1:
+            self.prob = prob
+
+    # Search one even index against all pending odd indices
+    def AttackEven (self, eidx, oidx):
+
+        # Resume positions from checkpoint
+        resume = [None] * len (oidx)
+        interval = 60
+        if self.ckpt:
+            resume = [self.ckpt.Get (eidx, o) for o in oidx]
+            interval = self.ckpt.interval
+        start = 0
+        if all (resume):
+            start = min ([r[0][0] for r in resume])
+
+        # Most likely enumerator positions first
+        eorder = None
+        oorder = [None] * len (oidx)
+        if self.prob:
+            eorder = self.prob.Positions (self.bits, 0, eidx)
+            oorder = [self.prob.Positions (self.bits, 1, o) for o in oidx]
+
+        ring = RingBuf (len (oidx))
+        res = Queue ()
+        epipe = EvenPipeline (eidx, self.even, ring, start, eorder)
+        opipe = [OddPipeline (eidx, o, self.odd, self.known, ring, n, res,
+                              resume[n], interval, oorder[n])
+                 for n, o in enumerate (oidx)]
+
+        # Stop the pipelines and free the ring whatever ends the
+        # wait, exceptions and Ctrl-C included
+        key = None
+        try:
+            # Run pipelines
+            for p in opipe:
+                p.start ()
+            epipe.start ()
+
+            # Wait for every cell to complete or a key
+            done = 0
+            while done < len (oidx):
+                try:
+                    r = res.get (timeout=1)
+                except queue.Empty:
+                    r = None
+                if r is None:
+                    pass
+                elif r[0] == 'found':
+                    key = r[3]
+                    break
+                elif r[0] == 'progress':
+                    if self.ckpt:
+                        self.ckpt.Update (*r[1:])
+                else:
+                    done += 1
+                    if self.cache:
+                        self.cache.MarkEmpty (self.bitstream, r[1], r[2])
+                    if self.ckpt:
+                        self.ckpt.Done (r[1], r[2])
+                if self.ckpt:
+                    self.ckpt.Save ()
+        finally:
+            for p in [epipe] + opipe:
+                if p.pid is not None:
+                    p.terminate ()
+                    p.join ()
+            ring.Unlink ()
+        return key
 
-        # Run pipelines
-        for n in range (256):
-            opipe[n].start ()
-        for n in range (16):
-            epipe[n].start ()
+    def Attack(self):
 
-        # Wait for threads to complete
-        for n in range (16):
-            epipe[n].join ()
-        for n in range (256):
-            opipe[n].join ()
-        '''
-        
-        # Shortcut
-        epipe.append (EvenPipeline (5, self.even, q[0:16]))
-        #opipe.append (OddPipeline (0, self.odd, self.verify, q[0]))
-        #opipe[0].start ()
-        epipe[0].start ()
-        epipe[0].join ()
-        #opipe[0].join ()
+        # Repeat jobs return from cache
+        if self.cache:
+            key = self.cache.Lookup (self.bitstream, self.bits, self.extra)
+            if key is not None:
+                print ('Found key={} (cached)'.format (hex (key)))
+                return key
+
+        # Most likely cells first
+        eorder = list (range (16))
+        oorder = list (range (16))
+        if self.prob:
+            even = self.prob.CellProb (self.prob.Context (self.bits, 0))
+            odd = self.prob.CellProb (self.prob.Context (self.bits, 1))
+            eorder = np.argsort (-even, kind='stable').tolist ()
+            oorder = np.argsort (-odd, kind='stable').tolist ()
+
+        for eidx in eorder:
+            # Skip cells already searched without a hit
+            oidx = list (oorder)
+            if self.cache:
+                empty = self.cache.EmptyCells (self.bitstream)
+                oidx = [o for o in oidx if (eidx, o) not in empty]
+            if self.ckpt:
+                oidx = [o for o in oidx if not self.ckpt.IsDone (eidx, o)]
+            if len (oidx) == 0:
+                continue
+
+            key = self.AttackEven (eidx, oidx)
+            if key is not None:
+                if self.cache:
+                    self.cache.Store (self.bitstream, key)
+                if self.ckpt:
+                    self.ckpt.Remove ()
+                return key
+        if self.ckpt:
+            self.ckpt.Remove ()
+        return None
         
 
 if __name__ == '__main__':
@@ -390,8 +637,22 @@ if __name__ == '__main__':
     parser.add_argument ('--key', type=str, help='key')
     parser.add_argument ('--len', type=int, help='bit length')
     parser.add_argument ('--truth', type=bool, help='Gen truth table')
+    parser.add_argument ('--cache', type=str, help='Key cache file')
+    parser.add_argument ('--checkpoint', type=str, help='Checkpoint file to resume from')
+    parser.add_argument ('--interval', type=int, default=60,
+                         help='Checkpoint interval in seconds')
+    parser.add_argument ('--extra', type=str, action='append',
+                         help='Extra known bit as offset:bit (e.g. parity)')
+    parser.add_argument ('--profile', type=str,
+                         help='Save stage profile (JSON, or .folded for flamegraph)')
+    parser.add_argument ('--table', type=str,
+                         help='Search most likely first (CalcProb trained table)')
     args = parser.parse_args ()
 
+    if args.profile:
+        import Profile
+        Profile.Enable (args.profile)
+
     # Generate truth table for 20 bits input for all 1
     # output. Use to feed espresso for minimized equation
     if args.truth:
@@ -411,8 +672,25 @@ if __name__ == '__main__':
         bitstream = int2binarr (int (args.output, 0), args.len)
         
         # Reverse
-        cr = Crypto1Attack (bitstream)
-        cr.Attack ()
+        cache = None
+        if args.cache:
+            from KeyCache import KeyCache
+            cache = KeyCache (args.cache)
+        ckpt = None
+        if args.checkpoint:
+            ckpt = Checkpoint (args.checkpoint, binarr2int (bitstream[0:48]),
+                               args.interval)
+        extra = None
+        if args.extra:
+            extra = [tuple (int (v, 0) for v in e.split (':')) for e in args.extra]
+        prob = None
+        if args.table:
+            from CalcProb import ProbTable
+            prob = ProbTable (path=args.table)
+        cr = Crypto1Attack (bitstream, cache, ckpt, extra, prob)
+        key = cr.Attack ()
+        if key is None:
+            print ('Key not found')
 
     else:
 
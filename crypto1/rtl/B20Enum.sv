@@ -3,6 +3,11 @@
  * Given an index for Fc, and an output bit,
  * Generate all 32768 20 bit combinations that
  * produce given output bit.
+ *
+ * ORDER permutes the 3 bit counter digit of each Fa/Fb nibble so
+ * likely sub-indices are walked first (CalcProb.ProbTable.Order).
+ * Entry ((nibble * 2 + output) * 8 + rank) * 3 holds the list
+ * index visited at rank, `ORDER_ID counts up.
  * 
  * Elliot Buller
  * 2022
@@ -15,6 +20,7 @@ module B20Enum
     input               BIT_IN,
     input               STB,
     input [3:0]         IDX,
+    input [239:0]       ORDER,
     output logic [19:0] KEY20, 
     output logic        DONE
     );
@@ -68,13 +74,18 @@ module B20Enum
    logic [4:0]         sel;
    always sel = Fc[BIT_IN][IDX];
 
+   // List index of nibble n (0 = KEY20[3:0]) at counter digit
+   function automatic [2:0] Digit (input int n, input logic out, input [2:0] rank);
+      Digit = ORDER[((n * 2 + 32'(out)) * 8 + 32'(rank)) * 3 +: 3];
+   endfunction
+
    // 15 bit counter arranged as 3 bit index for each function
    // Fb Fa Fa Fb Fa
-   always KEY20 = {Fb[sel[0]][ctr[14:12]], 
-                   Fa[sel[1]][ctr[11:9]],
-                   Fa[sel[2]][ctr[8:6]],
-                   Fb[sel[3]][ctr[5:3]],
-                   Fa[sel[4]][ctr[2:0]]};
+   always KEY20 = {Fb[sel[0]][Digit (4, sel[0], ctr[14:12])],
+                   Fa[sel[1]][Digit (3, sel[1], ctr[11:9])],
+                   Fa[sel[2]][Digit (2, sel[2], ctr[8:6])],
+                   Fb[sel[3]][Digit (1, sel[3], ctr[5:3])],
+                   Fa[sel[4]][Digit (0, sel[4], ctr[2:0])]};
    logic               started;
 
    always @(posedge CLK)
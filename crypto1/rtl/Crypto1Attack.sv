@@ -17,10 +17,17 @@
  *   the full 86bit extended LFSR.
  * - The verify bits [:10+] are then checked against these
  *   output bits to see if the key was found.
- * - Matches are then latched onto a shared bus for final
- *   check against the remaining output stream.
- * - 48 bit known output stream required to generate a single
- *   valid key.
+ * - Matches are queued in a result FIFO for final check
+ *   against the remaining output stream. Cores keep searching
+ *   after a match so every key in the searched cells is
+ *   reported, a 48 bit output stream can have several. Each
+ *   core holds its keys in a small queue until they fit in the
+ *   result FIFO, LOST is set if a core finds a key with its
+ *   queue full.
+ * - A second (shadow) bitstream can be queued while a search
+ *   runs. Once the cores are done the shadow is swapped in and
+ *   the search restarts. FIFO entries carry the job number they
+ *   were found in.
  * - The resulting key found will be 45 cycles into the LFSR.
  *   It can then be rewound 45 cycles using simple XOR rotation.
  * 
@@ -39,88 +46,206 @@
  * # output=0x5a7be10a7259
  */ 
 module Crypto1Attack
-  (
-   input               CLK,
-   input               RESETn,
-   input [47:0]        BITSTREAM,
-   output logic [47:0] KEY,
-   output logic        VALID,
-   output logic        DONE
-   );
-
-   logic [255:0]       valid, data, done;
-   logic               key_data, key_clk;
-   logic [6:0]         ctr;
+  #(
+    parameter FIFO_DEPTH = 16,
+    // Keys held per core while the result FIFO is busy
+    parameter CORE_DEPTH = 4
+    ) (
+       input               CLK,
+       input               RESETn,
+       // First job, latched when released from reset
+       input [47:0]        BITSTREAM,
+       // B20Enum walk order shared by every core, latched with
+       // the first job and on QUEUE for the queued one
+       input [239:0]       EORDER,
+       input [239:0]       OORDER,
+       // Shadow bitstream, marked queued on rising edge of QUEUE
+       input [47:0]        NEXT,
+       input               QUEUE,
+       output logic        QUEUED,
+       // End current job now, next one starts if queued
+       input               SKIP,
+       // Job being searched and last job finished
+       output logic [7:0]  JOB,
+       output logic [7:0]  LAST,
+       // Head of result FIFO, VALID while not empty
+       output logic [47:0] KEY,
+       output logic [7:0]  KEY_JOB,
+       output logic        VALID,
+       output logic [7:0]  COUNT,
+       // Pop head on rising edge
+       input               POP,
+       // A key was dropped since reset
+       output logic        LOST,
+       output logic        DONE
+       );
+
+   localparam NCORES = 20;
+   localparam AW = $clog2 (FIFO_DEPTH);
+   localparam CW = $clog2 (CORE_DEPTH);
+
+   logic [NCORES-1:0]  found, done, pend, push;
+   logic [47:0]        key [NCORES];
+
+   // Per core key queues
+   logic [47:0]        hold [NCORES][CORE_DEPTH];
+   logic [7:0]         hold_job [NCORES][CORE_DEPTH];
+   logic [CW:0]        hwidx [NCORES], hridx [NCORES];
+   logic [47:0]        push_key;
+   logic [7:0]         push_job;
+
+   // Result FIFO
+   logic [47:0]        fifo [FIFO_DEPTH];
+   logic [7:0]         fifo_job [FIFO_DEPTH];
+   logic [AW:0]        widx, ridx, used;
+   logic               pop_q;
+
+   // Bitstream being searched, cores reset for one cycle on swap
+   logic [47:0]        cur;
+   logic               restart, swap, queue_q, skip_q;
+
+   // Walk order of current and queued job
+   logic [239:0]       eorder, oorder, next_eorder, next_oorder;
    
-   // Instantiate 256 cores containing all combinations
+   // Instantiate cores containing combinations
    // of indices i,j
    genvar              i, j;
    generate
       for (i = 0; i < 4; i++) begin
         for (j = 0; j < 5; j++) 
-//      for (i = 5; i < 6; i++) begin
-//         for (j = 0; j < 1; j++) 
            begin : Crypto1Core
-            Crypto1Core #(.EIDX(i), .OIDX(j), .RING_DEPTH(32))
+            Crypto1Core #(.RING_DEPTH(32), .ALL_KEYS(1))
               core
                   (
                    .CLK       (CLK),
-                   .RESETn    (RESETn),
-                   .BITSTREAM (BITSTREAM),
-                   .KEY_CLK   (key_clk),
-                   .KEY_DATA  (data[(i << 4) | j]),
-                   .KEY_VALID (valid[(i << 4) | j]),
-                   .DONE      (done[(i << 4) | j])
+                   .RESETn    (RESETn & ~restart),
+                   .BITSTREAM (cur),
+                   .EIDX      (4'(i)),
+                   .OIDX      (4'(j)),
+                   .EORDER    (eorder),
+                   .OORDER    (oorder),
+                   .KEY       (key[i * 5 + j]),
+                   .VALID     (),
+                   .FOUND     (found[i * 5 + j]),
+                   .DONE      (done[i * 5 + j])
                    );
            end
       end
    endgenerate
 
-   // MUX onehot valid signal
-   always_comb 
+   always_comb
      begin
-        key_data = '0;
-        for (int k = 0; k < 256; k++) begin
-           if (valid == (1 << k))
-             key_data = data[k];
-        end
+        used = widx - ridx;
+        KEY = fifo[ridx[AW-1:0]];
+        KEY_JOB = fifo_job[ridx[AW-1:0]];
+        COUNT = 8'(used);
+        VALID = (used != 0);
      end
+
+   // Push head key of lowest pending core, one per cycle
+   always_comb
+     begin
+        push = '0;
+        push_key = '0;
+        push_job = '0;
+        for (int k = 0; k < NCORES; k++)
+          pend[k] = (hwidx[k] != hridx[k]);
+        if (used < FIFO_DEPTH)
+          for (int k = NCORES - 1; k >= 0; k--)
+            if (pend[k])
+              begin
+                 push = NCORES'(1) << k;
+                 push_key = hold[k][hridx[k][CW-1:0]];
+                 push_job = hold_job[k][hridx[k][CW-1:0]];
+              end
+     end
+
+   // Swap in queued job once done or skipped
+   always_comb
+     swap = QUEUED & ~restart & (DONE | (SKIP & ~skip_q));
    
    always @(posedge CLK)
      if (~RESETn)
        begin
           DONE <= 0;
-          VALID <= 0;
-          key_clk <= 0;
-          ctr <= 0;
+          LOST <= 0;
+          for (int k = 0; k < NCORES; k++)
+            begin
+               hwidx[k] <= 0;
+               hridx[k] <= 0;
+            end
+          widx <= 0;
+          ridx <= 0;
+          pop_q <= 0;
+          cur <= BITSTREAM;
+          eorder <= EORDER;
+          oorder <= OORDER;
+          JOB <= 0;
+          LAST <= 8'hff;
+          QUEUED <= 0;
+          restart <= 0;
+          queue_q <= 0;
+          skip_q <= 0;
        end
      else
        begin
 
-          // Found key
-          if (|valid)
+          // Queue each key until it fits in the FIFO, drop it and
+          // flag LOST if the core queue is full
+          for (int k = 0; k < NCORES; k++)
             begin
-               // Set key as valid
-               VALID <= 1;
-
-               // Clock in key data
-               if (ctr < 98)
+               if (found[k])
                  begin
-                    ctr <= ctr + 1;
-                    key_clk <= ~key_clk;
-                    if (~ctr[0])
-                      KEY <= {KEY[46:0], key_data};
+                    if ((hwidx[k] - hridx[k]) != (CW+1)'(CORE_DEPTH))
+                      begin
+                         hold[k][hwidx[k][CW-1:0]] <= key[k];
+                         hold_job[k][hwidx[k][CW-1:0]] <= JOB;
+                         hwidx[k] <= hwidx[k] + 1;
+                      end
+                    else
+                      LOST <= 1;
                  end
-               else
-                 // Mark as done
-                 DONE <= 1;
+               if (push[k])
+                 hridx[k] <= hridx[k] + 1;
+            end
+
+          if (|push)
+            begin
+               fifo[widx[AW-1:0]] <= push_key;
+               fifo_job[widx[AW-1:0]] <= push_job;
+               widx <= widx + 1;
+            end
+
+          // Queue next job
+          queue_q <= QUEUE;
+          skip_q <= SKIP;
+          if (QUEUE & ~queue_q)
+            begin
+               QUEUED <= 1;
+               next_eorder <= EORDER;
+               next_oorder <= OORDER;
+            end
+
+          // Start next job
+          restart <= swap;
+          if (swap)
+            begin
+               cur <= NEXT;
+               eorder <= next_eorder;
+               oorder <= next_oorder;
+               QUEUED <= 0;
+               JOB <= JOB + 1;
             end
+          if (swap | DONE)
+            LAST <= JOB;
+
+          // Pop
+          pop_q <= POP;
+          if (POP & ~pop_q & (widx != ridx))
+            ridx <= ridx + 1;
 
-          // Key not found
-          else if ($countones (done) == 20)
-            DONE <= 1;
+          // All cells searched and every key queued
+          DONE <= ~swap & ~restart & (&done) & ~|pend;
        end
 
 endmodule // Crypto1Attack
-
-                     
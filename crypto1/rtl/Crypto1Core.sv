@@ -12,15 +12,21 @@
 
 module Crypto1Core 
   #(
-    parameter RING_DEPTH = 32
+    parameter RING_DEPTH = 32,
+    // Keep searching after a match, FOUND strobes for each key
+    parameter ALL_KEYS = 0
     ) (
        input               CLK,
        input               RESETn,
        input [47:0]        BITSTREAM,
        input [3:0]         EIDX,
        input [3:0]         OIDX,
+       // Even/odd B20Enum walk order, `ORDER_ID counts up
+       input [239:0]       EORDER,
+       input [239:0]       OORDER,
        output logic        DONE,
        output logic        VALID,
+       output logic        FOUND,
        output logic [47:0] KEY
    );
 
@@ -60,6 +66,7 @@ module Crypto1Core
                                BITSTREAM[45],
                                BITSTREAM[47]}),
              .IDX            (EIDX),
+             .ORDER          (EORDER),
              .SUBKEY_RDEN    (efifo_rden),
              .SUBKEY_RDDATA  (efifo_rddata),
              .SUBKEY_RDEMPTY (efifo_rdempty),
@@ -101,6 +108,7 @@ module Crypto1Core
                               BITSTREAM[44],
                               BITSTREAM[46]}),
             .IDX            (OIDX),
+            .ORDER          (OORDER),
             .SUBKEY_RDEN    (ofifo_rden),
             .SUBKEY_RDDATA  (odd_subkey),
             .SUBKEY_RDEMPTY (ofifo_rdempty),
@@ -203,9 +211,13 @@ module Crypto1Core
              state <= WAIT_FULL;
              ring_valid <= 0;
              ring_rden <= 0;
+             ring_reset_n <= 0;
+             odd_reset_n <= 0;
+             ofifo_rden <= 0;
              valid <= 0;
              DONE <= 0;
              VALID <= 0;
+             FOUND <= 0;
           end
         else
           begin
@@ -217,9 +229,13 @@ module Crypto1Core
              if (valid[10] && (match9 == BITSTREAM[37:0]))
                begin
                   VALID <= 1;
-                  state <= FINISHED;
+                  FOUND <= 1;
                   KEY <= key_save;
+                  if (!ALL_KEYS)
+                    state <= FINISHED;
                end
+             else
+               FOUND <= 0;
                          
              // Generate 48 bits of LFSR from even/odd subkeys
              // Plus 4 bits of extended bitstream
@@ -284,14 +300,21 @@ module Crypto1Core
                     // Release odd generator from reset
                     odd_reset_n <= 1;
                     
-                    // Wait until ring buffer is full
-                    if (ring_full & ring_reset_n & ~ofifo_rdempty)
+                    if (ring_reset_n)
                       begin
-                         state <= COMPARE;
-                         // Read subkey from odd generator
-                         ofifo_rden <= 1;
-                         // Read subkey from ring buffer
-                         ring_rden <= 1;
+                         // Wait until ring buffer is full
+                         if (ring_full & ~ofifo_rdempty)
+                           begin
+                              state <= COMPARE;
+                              // Read subkey from odd generator
+                              ofifo_rden <= 1;
+                              // Read subkey from ring buffer
+                              ring_rden <= 1;
+                           end
+
+                         // No even or odd subkeys left to pair
+                         else if ((ring_done & ~ring_full) | (ring_full & odd_done))
+                           state <= WAIT_FINISH;
                       end
                  end
 
@@ -299,27 +322,36 @@ module Crypto1Core
                COMPARE:
                  begin
 
-                    // Cycle odd keys for every complete ring buffer
                     if (ofifo_rden)
                       ofifo_rden <= 0;
-                    else if (ring_end & ~odd_done & ~ofifo_rdempty)
-                      ofifo_rden <= 1;
 
-                    // Have we exhausted search space?
-                    if (even_done & ring_end)
+                    // Hold ring after each pass until next odd is ready
+                    if (ring_rden)
                       begin
-                         state <= WAIT_FINISH;
-                         ring_rden <= 0;
+                         if (ring_end)
+                           ring_rden <= 0;
                       end
-                    
+
+                    // Cycle odd keys for every complete ring buffer
+                    else if (~ofifo_rdempty)
+                      begin
+                         ofifo_rden <= 1;
+                         ring_rden <= 1;
+                      end
+
                     // Done with current ring buffer
-                    else if (odd_done & ring_end)
+                    else if (odd_done)
                       begin
-                         // Fetch next ring buffer
-                         odd_reset_n <= 0;
-                         ring_reset_n <= 0;
-                         state <= WAIT_FULL;
-                         ring_rden <= 0;
+                         // Have we exhausted search space?
+                         if (ring_done)
+                           state <= WAIT_FINISH;
+                         else
+                           begin
+                              // Fetch next ring buffer
+                              odd_reset_n <= 0;
+                              ring_reset_n <= 0;
+                              state <= WAIT_FULL;
+                           end
                       end
 
                  end // case: COMPARE
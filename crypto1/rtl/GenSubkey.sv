@@ -12,6 +12,8 @@ module GenSubkey
    input               RESETn,
    input [4:0]         BITSTREAM,
    input [3:0]         IDX,
+   // B20Enum walk order
+   input [239:0]       ORDER,
    // Finished enumerating subkeys
    output logic        DONE,
    // Output FIFO of subkeys
@@ -59,6 +61,7 @@ module GenSubkey
         .RESETn (RESETn),
         .BIT_IN (BITSTREAM[0]),
         .IDX    (IDX),
+        .ORDER  (ORDER),
         .STB    (gen_stb),
         .KEY20  (k20),
         .DONE   (done));
@@ -89,6 +92,7 @@ module GenSubkey
              state <= GENERATE;
              gen_stb <= 0;
              DONE <= 0;
+             fifo_write <= 0;
           end
         else
           begin
@@ -238,9 +242,12 @@ module GenSubkey
                     // Check if both are done
                     if (idx < 0)
                       begin
-                         // Stop FIFO write
-                         fifo_write <= 0;
-                         state <= GENERATE;
+                         // Stop FIFO write once last subkey is in
+                         if (~fifo_wrfull)
+                           begin
+                              fifo_write <= 0;
+                              state <= GENERATE;
+                           end
                       end
                     else
                       begin
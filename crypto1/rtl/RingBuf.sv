@@ -23,8 +23,9 @@ module RingBuf
      // Client interface
      input              RDEN,
      output logic [WIDTH-1:0] RDDATA,
+     // Full or holding the last entries
      output logic       FULL,
-     // No more data
+     // No more data to load
      output logic       DONE,
      // End of current ring buffer
      output logic       END);
@@ -35,11 +36,12 @@ module RingBuf
    logic [$clog2(DEPTH):0]   ridx;
    logic                     data_valid;
    
-   // Read while data is available and not full
-   always FIFO_RDEN = ~FIFO_RDEMPTY & (widx < $clog2(DEPTH+1)'(DEPTH - 1));
-   always FULL = (widx == $clog2(DEPTH+1)'(DEPTH));
+   // Read while data is available and not full, count the read in flight
+   always FIFO_RDEN = ~FIFO_RDEMPTY &
+                      ((widx + $clog2(DEPTH+1)'(data_valid)) < $clog2(DEPTH+1)'(DEPTH));
+   always DONE = FIFO_DONE & FIFO_RDEMPTY & ~data_valid;
+   always FULL = (widx == $clog2(DEPTH+1)'(DEPTH)) | (DONE & (widx != 0));
    always END = (ridx == (widx - 1));
-   always DONE = (FIFO_DONE & END);
                 
    always @(posedge CLK)
      begin
@@ -64,11 +66,11 @@ module RingBuf
                   widx <= widx + 1;
                end
 
-             // If RDEN push data out and increment
+             // If RDEN push data out and increment, wrap at end
              if (RDEN)
                begin
                   RDDATA <= data[ridx[$clog2(DEPTH)-1:0]];
-                  ridx <= ridx + 1;
+                  ridx <= END ? 0 : ridx + 1;
                end
           end
      end
@@ -40,4 +40,7 @@
                 b[18] ^ b[12] ^ b[8] ^ b[6] ^   \
                 b[5] ^ b[4])
 
+   // B20Enum ORDER walking every sub-index in list order
+`define ORDER_ID {10{24'hFAC688}}
+
 `endif
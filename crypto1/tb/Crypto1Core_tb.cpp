@@ -84,6 +84,16 @@ static int parse_args(int argc, char **argv, VerilatorUtils* utils)
 	return argp_parse(&argp, argc, argv, 0, 0, utils);
 }
 
+// B20Enum ORDER counting up (`ORDER_ID), 3 bit entry n holds n % 8
+template <class T> static void order_id (T &w)
+{
+  for (int n = 0; n < 8; n++)
+    w[n] = 0;
+  for (int n = 0; n < 240; n++)
+    if ((((n / 3) & 7) >> (n % 3)) & 1)
+      w[n / 32] |= 1U << (n % 32);
+}
+
 int main(int argc, char **argv, char **env)
 {
 	uint32_t insn = 0;
@@ -104,6 +114,10 @@ int main(int argc, char **argv, char **env)
     // Set bitstream
     top->BITSTREAM = bitstream;
 
+    // Walk enumerators in counter order
+    order_id (top->EORDER);
+    order_id (top->OORDER);
+
     // Set indices
     top->EIDX = eidx;
     top->OIDX = oidx;
@@ -0,0 +1,147 @@
+/*
+ * C interface to a Verilated Crypto1Core or Crypto1Attack for
+ * batch runs from python (ctypes). Build with -DTOP_ATTACK for
+ * Crypto1Attack, see python/RTLBatch.py.
+ *
+ * Each run resets the model, loads the bitstream and clocks it
+ * until DONE or max_cycles, or the first key if first is set.
+ * Every key reported on the way is stored (up to nkeys) and the
+ * cycle count is returned. eorder and oorder are the 8 word
+ * B20Enum ORDER of each half, NULL counts up.
+ */
+
+#include <stdint.h>
+#include <verilated.h>
+
+#ifdef TOP_ATTACK
+#include "VCrypto1Attack.h"
+typedef VCrypto1Attack top_t;
+#else
+#include "VCrypto1Core.h"
+typedef VCrypto1Core top_t;
+#endif
+
+#define RESET_CYCLES  4
+
+double sc_time_stamp () {
+  return 0;
+}
+
+// Load ORDER port, identity (`ORDER_ID) if no order given
+template <class T> static void set_order (T &w, const uint32_t *order)
+{
+  for (int n = 0; n < 8; n++)
+    w[n] = order ? order[n] : 0;
+  if (!order)
+    for (int n = 0; n < 240; n++)
+      if ((((n / 3) & 7) >> (n % 3)) & 1)
+        w[n / 32] |= 1U << (n % 32);
+}
+
+static void cycle (top_t *top)
+{
+  top->CLK = 0;
+  top->eval ();
+  top->CLK = 1;
+  top->eval ();
+}
+
+extern "C" {
+
+void *sim_new (void)
+{
+  return new top_t;
+}
+
+void sim_free (void *h)
+{
+  top_t *top = (top_t *)h;
+  top->final ();
+  delete top;
+}
+
+#ifdef TOP_ATTACK
+
+// Keys are popped from the result FIFO as they appear, the job
+// tag of each key is not needed for a single bitstream. lost is
+// set if a core dropped a key.
+uint64_t attack_run (void *h, uint64_t bitstream, const uint32_t *eorder,
+                     const uint32_t *oorder, uint64_t max_cycles, int first,
+                     uint64_t *keys, int nkeys, int *found, int *lost)
+{
+  top_t *top = (top_t *)h;
+  uint64_t n;
+
+  *found = 0;
+  top->RESETn = 0;
+  top->BITSTREAM = bitstream;
+  set_order (top->EORDER, eorder);
+  set_order (top->OORDER, oorder);
+  top->QUEUE = 0;
+  top->SKIP = 0;
+  top->POP = 0;
+  for (n = 0; n < RESET_CYCLES; n++)
+    cycle (top);
+  top->RESETn = 1;
+
+  for (n = 0; n < max_cycles; n++) {
+    cycle (top);
+
+    // Pop on rising edge, every other cycle
+    if (top->POP)
+      top->POP = 0;
+    else if (top->VALID) {
+      if (*found < nkeys)
+        keys[*found] = top->KEY;
+      (*found)++;
+      top->POP = 1;
+      if (first)
+        break;
+    }
+    if (top->DONE && !top->VALID && !top->POP)
+      break;
+  }
+  *lost = top->LOST;
+  return n;
+}
+
+#else
+
+// Core is built with ALL_KEYS=1, FOUND strobes once per key
+uint64_t core_run (void *h, uint64_t bitstream, int eidx, int oidx,
+                   const uint32_t *eorder, const uint32_t *oorder,
+                   uint64_t max_cycles, int first, uint64_t *keys, int nkeys,
+                   int *found)
+{
+  top_t *top = (top_t *)h;
+  uint64_t n;
+
+  *found = 0;
+  top->RESETn = 0;
+  top->BITSTREAM = bitstream;
+  set_order (top->EORDER, eorder);
+  set_order (top->OORDER, oorder);
+  top->EIDX = eidx;
+  top->OIDX = oidx;
+  for (n = 0; n < RESET_CYCLES; n++)
+    cycle (top);
+  top->RESETn = 1;
+
+  for (n = 0; n < max_cycles; n++) {
+    cycle (top);
+    if (top->FOUND) {
+      if (*found < nkeys)
+        keys[*found] = top->KEY;
+      (*found)++;
+      if (first)
+        break;
+    }
+    if (top->DONE)
+      break;
+  }
+  return n;
+}
+
+#endif
+
+} // extern "C"